@@ -1,11 +1,13 @@
 import io
 import os
-from pathlib import Path
+import time
 import streamlit as st
-from PIL import Image as PILImage
 
 # mūsų modulis su ReportLab generatoriais
 import worksheet as ws
+import darbai
+import ikelimas
+import wordsearch
 
 st.set_page_config(page_title="Užduočių lapų generatorius", page_icon="📝", layout="centered")
 
@@ -13,23 +15,149 @@ st.title("📝 Užduočių lapų generatorius")
 
 # --- bendri nustatymai / aplankai
 IMAGES_DIR = ws.IMAGES_DIR
-OUT_DIR = ws.OUT_DIR
 IMAGES_DIR.mkdir(exist_ok=True)
-OUT_DIR.mkdir(exist_ok=True)
 
-def save_uploaded_any(file, preferred_basename: str | None = None):
+def ikelti_paveikslelius(up):
     """
-    Išsaugo įkeltą paveikslėlį kaip PNG (be vargo su JPEG alfa kanalu).
-    Jei nurodytas preferred_basename, naudoja jį kaip failo pavadinimą.
+    Įkeltus failus priima ikelimas.ikelti: jau matytas turinys praleidžiamas (pakartotinis
+    paspaudimas nieko nekainuoja), nauji sumažinami iki spausdinimo dydžio. Žodžio paveikslėlį
+    pakeitus kitu, senas nedingsta – jis perkeliamas į images/.pakeisti/.
     """
-    img = PILImage.open(file)
-    # jei yra alfa – paliekam RGBA, jei nėra – RGB
-    if img.mode not in ("RGB", "RGBA"):
-        img = img.convert("RGBA")
-    base = preferred_basename or Path(file.name).stem
-    target = IMAGES_DIR / f"{base}.png"
-    img.save(target)   # visada .png
-    return target
+    if not up:
+        return []
+    rez = ikelimas.ikelti([(f.name, f.getvalue()) for f in up], IMAGES_DIR)
+    if any(r["busena"] != "praleista" for r in rez):
+        ws.vaizdu_indeksas.atnaujinti()
+    pakeisti = [r["zodis"] for r in rez if r["busena"] == "pakeista"]
+    if pakeisti:
+        st.info("Pakeisti paveikslėliai: " + ", ".join(pakeisti) + f" (seni – {IMAGES_DIR.name}/{ikelimas.PAKEISTI}/)")
+    for r in rez:
+        if r["klaida"]:
+            st.warning(f"Nepavyko įkelti „{r['zodis']}“: {r['klaida']}")
+    return rez
+
+def _sekla(tekstas: str):
+    """Sėklos laukelis: tuščias – naujas atsitiktinis lapas, skaičius – tas pats lapas kaskart."""
+    tekstas = tekstas.strip()
+    return int(tekstas) if tekstas.isdigit() else None
+
+# --- generavimo etapai (sekimas.py): lentelė – pažymėjus šoninėje juostoje,
+# SEKIMAS_JSONL=out/sekimas.jsonl – kiekvienas lapas dar ir eilute faile
+SEKIMO_FAILAS = os.environ.get("SEKIMAS_JSONL") or None
+rodyti_etapus = st.sidebar.checkbox("Rodyti generavimo etapus", False)
+
+# --- kokybės profilis (ws.PROFILIAI): perduodamas kiekvienam generatoriui per pateikti()
+PROFILIU_PAVADINIMAI = {
+    "juodrastis": "Juodraštis – greita peržiūra ekrane",
+    "spausdinimas": "Spausdinimas klasėje",
+    "archyvas": "Archyvas – didžiausia kokybė",
+}
+profilis = st.sidebar.selectbox("Kokybė", list(ws.PROFILIAI), index=list(ws.PROFILIAI).index(ws.NUMATYTAS_PROFILIS),
+                                format_func=lambda p: f"{PROFILIU_PAVADINIMAI.get(p, p)} ({ws.PROFILIAI[p]['dpi']} DPI)")
+
+def _etapu_lentele(s):
+    with st.expander("Generavimo etapai"):
+        for ir in s.irasai:
+            d = ir.kaip_zodynas()
+            viso = d["laikas_s"]
+            st.markdown(f"**{d['generatorius']}** – {viso * 1000:.0f} ms")
+            etapai = sorted(d["etapai"].items(), key=lambda x: -x[1]["s"])
+            st.table([{"etapas": k, "ms": round(e["s"] * 1000, 1), "kartai": e["kartai"],
+                       "dalis": f"{e['s'] / viso:.0%}" if viso else "–"} for k, e in etapai])
+            st.caption(", ".join(f"{k}: {v}" for k, v in d["skaitikliai"].items()))
+
+# --- foniniai darbai (darbai.py): viena ribota eilė visoms sesijoms; sesija saugo tik darbo id,
+# tad perpiešimas (bet koks slankiklis) nieko negeneruoja iš naujo, o lėtas lapas neblokuoja kitų
+DARBU_GIJOS = int(os.environ.get("DARBU_GIJOS", min(4, os.cpu_count() or 1)))
+DARBU_EILE = int(os.environ.get("DARBU_EILE", 64))
+# bendras procesų telkinys visų darbų lygiagrečiai paieškai (workers) – daugiau procesų nebus
+DARBU_PROCESAI = max(1, int(os.environ.get("DARBU_PROCESAI", os.cpu_count() or 1)))
+
+@st.cache_resource
+def darbu_eile():
+    return darbai.DarbuEile(gijos=DARBU_GIJOS, max_eile=DARBU_EILE, procesu=DARBU_PROCESAI)
+
+def procesu_skaicius(zyme, **kwargs):
+    """Lygiagrečių procesų slankiklis; kai galimas tik vienas procesas – be slankiklio, 1 (min == max st.slider neleidžia)."""
+    if DARBU_PROCESAI < 2:
+        return 1
+    return st.slider(zyme, 1, DARBU_PROCESAI, 1, **kwargs)
+
+def pateikti(vieta, fn, *args, sujungti=True, **kwargs):
+    """
+    Įdeda generavimą į eilę; skirtuko `vieta` rezultatą vėliau grąžina rezultatas(vieta).
+    Pasirinktas kokybės profilis pridedamas prie argumentų (jį priima visi generatoriai).
+    """
+    kwargs.setdefault("profilis", profilis)
+    try:
+        d = darbu_eile().pateikti(fn, *args, sujungti=sujungti, sekti=rodyti_etapus, jsonl=SEKIMO_FAILAS,
+                                  **kwargs)
+    except darbai.EilePilna:
+        st.warning("Šiuo metu generuojama labai daug lapų – pabandykite po minutės.")
+        return
+    st.session_state[f"darbas_{vieta}"] = d.id
+
+@st.experimental_fragment(run_every=0.5)
+def _eiga(darbo_id):
+    """
+    Eigos juosta – fragmentas: perpiešiamas tik jis (kas 0,5 s), tad kiti skirtukai ir šoninė
+    juosta rodomi iškart. Darbui pasibaigus perpiešiamas visas puslapis – skirtukas parodo rezultatą.
+    """
+    eile = darbu_eile()
+    d = eile.gauti(darbo_id)
+    if d is None or d.baigta is not None:
+        st.rerun()
+    nr = eile.vieta_eileje(d)
+    tekstas = f"Laukiama eilėje ({nr})…" if nr else f"Generuojama… {time.monotonic() - d.pradeta:.0f} s"
+    st.progress(eile.progresas(d), text=tekstas)
+
+def rezultatas(vieta):
+    """Paskutinio šios sesijos darbo skirtuke `vieta` rezultatas; kol nebaigtas – None, rodoma eigos juosta."""
+    darbo_id = st.session_state.get(f"darbas_{vieta}")
+    d = darbu_eile().gauti(darbo_id) if darbo_id else None
+    if d is None:
+        return None
+    if d.baigta is None:
+        _eiga(d.id)
+        return None
+    if d.klaida:
+        st.error(f"Nepavyko sugeneruoti: {d.klaida}")
+        return None
+    if rodyti_etapus and d.sekimas:
+        _etapu_lentele(d.sekimas)
+    return d.rezultatas
+
+def _paieskos_lapas(zodziai, dydis, kryptys, seed, variantai=1, workers=1, profilis=ws.NUMATYTAS_PROFILIS):
+    """Vienas darbas: (sėkla, PDF, netilpę žodžiai) – sėkla nustatoma čia, kad netilpę būtų to paties lapo."""
+    seed = ws._sekla(seed)
+    pdf = ws.generuoti_pdf_tinkleli_lentele(zodziai, dydis=dydis, failas=None, kryptys=kryptys, seed=seed,
+                                            profilis=profilis, variantai=variantai, workers=workers)
+    return seed, pdf, ws.paieskos_netilpe(zodziai, dydis, kryptys, seed, variantai, workers)
+
+def _kryziazodzio_lapai(zodziai, size, budget, workers, seed, atsakymai, profilis=ws.NUMATYTAS_PROFILIS,
+                        variantai=1):
+    """
+    Vienas darbas: (sėkla, [(mygtukas, failas, PDF)]). Sėkla nustatoma čia, kad mokytojas ją matytų ir
+    rinkinį galėtų atkurti; maketas ieškomas kartą – atsakymai visada atitinka mokinio lapą.
+    """
+    seed = ws._sekla(seed)
+    if variantai > 1:
+        # klasės rinkinys: visi variantai (ir, jei pažymėta, atsakymų skyrius) viename PDF
+        return seed, [(f"Atsisiųsti ({variantai} variantai{' su atsakymais' if atsakymai else ''})",
+                       "kryziazodis-variantai.pdf",
+                       ws.kryziazodis_pdf(zodziai, size=size, failas=None, budget=budget, workers=workers,
+                                          seed=seed, profilis=profilis, variantai=variantai,
+                                          atsakymu_skyrius=atsakymai))]
+    kz = ws.sukurti_kryziazodi(zodziai, size=size, budget=budget, workers=workers, seed=seed)
+    lapai = [("Atsisiųsti (tuščias)", "kryziazodis.pdf",
+              ws.kryziazodis_pdf(zodziai, show_answers=False, failas=None, maketas=kz, profilis=profilis))]
+    if atsakymai:
+        lapai.append(("Atsisiųsti (atsakymai)", "kryziazodis-atsakymai.pdf",
+                      ws.kryziazodis_pdf(zodziai, show_answers=True, failas=None, maketas=kz, profilis=profilis)))
+        lapai.append(("Atsisiųsti (abu viename PDF)", "kryziazodis-su-atsakymais.pdf",
+                      ws.kryziazodis_su_atsakymais_pdf(zodziai, failas=None, viename=True, maketas=kz,
+                                                       profilis=profilis)))
+    return seed, lapai
 
 st.caption("Įkelkite paveikslėlius ir suveskite žodžius. PDF bus sugeneruotas vietoje ir bus galima parsisiųsti.")
 
@@ -39,7 +167,8 @@ tabs = st.tabs([
     "3) Linksnių lentelė",
     "4) Kryžiažodis",
     "5) Sakinys pagal pavyzdį",
-    "6) Gyvūnai ir jų vietos"
+    "6) Gyvūnai ir jų vietos",
+    "7) Visas rinkinys"
 ])
 
 # ---- 1
@@ -53,29 +182,43 @@ with tabs[0]:
     if st.button("Generuoti PDF"):
         # išsaugom įkeltus failus pagal žodžių sąrašą, jei reikia – naudotojas gali įkelti vieną po kito
         # čia tiesiog išsaugom visus; paieška vyks per ws.rasti_paveiksleli
-        for f in up:
-            # saugom originaliu vardu (tavo rasti_paveiksleli su LT raidem tvarkosi)
-            save_uploaded_any(f)
+        ikelti_paveikslelius(up)
 
         zodziai = [w.strip() for w in words.split(",") if w.strip()]
-        outfile = OUT_DIR / "uzduotis-zodziai.pdf"
-        ws.generuoti_zodziu_uzduoti(zodziai, failas=str(outfile))
+        # PDF generuojamas atmintyje – jokių bendrų failų out/ kataloge tarp naudotojų
+        pateikti("zodziai", ws.generuoti_zodziu_uzduoti, zodziai, failas=None)
+    pdf = rezultatas("zodziai")
+    if pdf is not None:
         st.success("PDF paruoštas.")
-        st.download_button("Atsisiųsti PDF", data=open(outfile, "rb").read(), file_name=outfile.name, mime="application/pdf")
+        st.download_button("Atsisiųsti PDF", data=pdf, file_name="uzduotis-zodziai.pdf", mime="application/pdf")
 
 # ---- 2
 with tabs[1]:
     st.subheader("Žodžių paieška (tinklelis + paveikslėliai + 3 linijų forma)")
     words = st.text_input("Žodžiai (kableliais)", "vilkas, lapė, meška")
     size = st.slider("Tinklelio dydis", 8, 20, 15)
+    visos_kryptys = st.checkbox("Žodžiai ir įstrižai, ir atbulai (8 kryptys)", True)
+    seed_txt = st.text_input("Sėkla (nebūtina; tas pats skaičius – tas pats tinklelis)", "", key="seed_paieska")
+    variantai = st.number_input("Variantų (klasei – kiekvienam mokiniui kitas tinklelis, atsakymai gale)",
+                                1, 40, 1, key="variantai_paieska")
+    workers_paieska = procesu_skaicius("Lygiagrečių procesų skaičius (variantams)", key="workers_paieska")
     up = st.file_uploader("Paveikslėliai (nebūtina visiems)", type=["png","jpg","jpeg"], accept_multiple_files=True)
     if st.button("Generuoti paieškos PDF"):
-        for f in up:
-            save_uploaded_any(f)
+        ikelti_paveikslelius(up)
         zodziai = [w.strip() for w in words.split(",") if w.strip()]
-        outfile = OUT_DIR / "uzduotis-paieska.pdf"
-        ws.generuoti_pdf_tinkleli_lentele(zodziai, dydis=size, failas=str(outfile))
-        st.download_button("Atsisiųsti PDF", data=open(outfile, "rb").read(), file_name=outfile.name, mime="application/pdf")
+        kryptys = wordsearch.KRYPTYS_VISOS if visos_kryptys else wordsearch.KRYPTYS_HV
+        seed = _sekla(seed_txt)
+        # be sėklos kiekvienas paspaudimas – naujas tinklelis, tad tokių darbų nesujungiame
+        pateikti("paieska", _paieskos_lapas, zodziai, size, kryptys, seed, variantai=int(variantai),
+                 workers=workers_paieska, sujungti=seed is not None)
+    rez = rezultatas("paieska")
+    if rez is not None:
+        seed, pdf, netilpo = rez
+        st.caption(f"Sėkla: {seed}")
+        if netilpo:
+            st.warning("Į tinklelį netilpo (lape jų nėra): " + ", ".join(netilpo)
+                       + ". Padidinkite tinklelį arba įjunkite 8 kryptis.")
+        st.download_button("Atsisiųsti PDF", data=pdf, file_name="uzduotis-paieska.pdf", mime="application/pdf")
 
 # ---- 3
 with tabs[2]:
@@ -95,20 +238,22 @@ with tabs[2]:
     up = st.file_uploader("Paveikslėliai (pasirinktinai)", type=["png","jpg","jpeg"], accept_multiple_files=True)
 
     if st.button("Generuoti pasirinktinę linksnių PDF"):
-        for f in up:
-            save_uploaded_any(f)
+        ikelti_paveikslelius(up)
         zodziai = [w.strip() for w in words.split(",") if w.strip()]
-        outfile = OUT_DIR / "uzduotis-linksniai-custom.pdf"
-        ws.generuoti_linksniu_pdf_custom(
+        pateikti(
+            "linksniai",
+            ws.generuoti_linksniu_pdf_custom,
             zodziai,
             pasirinkti_linksniai,
             rodyti_vns,
             rodyti_dgs,
-            failas=str(outfile),
+            failas=None,
             rodyti_zodi_salia_paveikslelio=show_word
         )
-        st.download_button("Atsisiųsti PDF", data=open(outfile, "rb").read(),
-                           file_name=outfile.name, mime="application/pdf")
+    pdf = rezultatas("linksniai")
+    if pdf is not None:
+        st.download_button("Atsisiųsti PDF", data=pdf,
+                           file_name="uzduotis-linksniai-custom.pdf", mime="application/pdf")
 
 # ---- 4
 with tabs[3]:
@@ -116,18 +261,27 @@ with tabs[3]:
     words = st.text_input("Žodžiai (kableliais)", "arklys, kiškis, voverė, lapė")
     size = st.slider("Tinklelio dydis", 9, 17, 13)
     up = st.file_uploader("Paveikslėliai užuominoms", type=["png","jpg","jpeg"], accept_multiple_files=True)
-    show_ans = st.checkbox("Sukurti ir atsakymų versiją", True)
+    show_ans = st.checkbox("Sukurti ir atsakymų versiją (variantams – atsakymų skyrius gale)", True)
+    variantai = st.number_input("Variantų (klasei – kiekvienam mokiniui kitas maketas, atsakymai gale)",
+                                1, 40, 1, key="variantai_kryziazodis")
+    with st.expander("Maketo paieška"):
+        budget = st.slider("Paieškos laikas (s)", 0.5, 10.0, 1.0, step=0.5,
+                           help="Apytiksliai: paieška ribojama laikui proporcingu žingsnių skaičiumi, "
+                                "todėl ta pati sėkla visada duoda tą patį maketą.")
+        workers = procesu_skaicius("Lygiagrečių procesų skaičius")
+        seed_txt = st.text_input("Sėkla (nebūtina; tas pats skaičius – tas pats maketas)", "", key="seed_kryziazodis")
     if st.button("Generuoti kryžiažodį"):
-        for f in up:
-            save_uploaded_any(f)
+        ikelti_paveikslelius(up)
         zodziai = [w.strip() for w in words.split(",") if w.strip()]
-        out1 = OUT_DIR / "kryziazodis.pdf"
-        ws.kryziazodis_pdf(zodziai, show_answers=False, size=size, failas=str(out1))
-        st.download_button("Atsisiųsti (tuščias)", data=open(out1, "rb").read(), file_name=out1.name, mime="application/pdf")
-        if show_ans:
-            out2 = OUT_DIR / "kryziazodis-atsakymai.pdf"
-            ws.kryziazodis_pdf(zodziai, show_answers=True, size=size, failas=str(out2))
-            st.download_button("Atsisiųsti (atsakymai)", data=open(out2, "rb").read(), file_name=out2.name, mime="application/pdf")
+        seed = _sekla(seed_txt)
+        pateikti("kryziazodis", _kryziazodzio_lapai, zodziai, size, budget, workers, seed, show_ans,
+                 variantai=int(variantai), sujungti=seed is not None)
+    rez = rezultatas("kryziazodis")
+    if rez is not None:
+        seed, lapai = rez
+        st.caption(f"Sėkla: {seed}")
+        for tekstas, vardas, pdf in lapai:
+            st.download_button(tekstas, data=pdf, file_name=vardas, mime="application/pdf")
 
 # ---- 5
 with tabs[4]:
@@ -137,12 +291,13 @@ with tabs[4]:
     sample_img_word = st.text_input("Kokio žodžio paveikslėlį naudoti pavyzdyje? (nebūtina)", "")
     up = st.file_uploader("Paveikslėliai (visi)", type=["png","jpg","jpeg"], accept_multiple_files=True)
     if st.button("Generuoti užduotį"):
-        for f in up:
-            save_uploaded_any(f)
+        ikelti_paveikslelius(up)
         zodziai = [w.strip() for w in words.split(",") if w.strip()]
-        outfile = OUT_DIR / "uzduotis-sakinys.pdf"
-        ws.generuoti_sakini_pagal_pavyzdi(zodziai, pavyzdys_sakinys=sample_sentence, pavyzdys_paveikslelis=sample_img_word, failas=str(outfile))
-        st.download_button("Atsisiųsti PDF", data=open(outfile, "rb").read(), file_name=outfile.name, mime="application/pdf")
+        pateikti("sakinys", ws.generuoti_sakini_pagal_pavyzdi, zodziai, pavyzdys_sakinys=sample_sentence,
+                 pavyzdys_paveikslelis=sample_img_word, failas=None)
+    pdf = rezultatas("sakinys")
+    if pdf is not None:
+        st.download_button("Atsisiųsti PDF", data=pdf, file_name="uzduotis-sakinys.pdf", mime="application/pdf")
 
 # ---- 6
 with tabs[5]:
@@ -153,12 +308,51 @@ with tabs[5]:
     up = st.file_uploader("Paveikslėliai (gyvūnai ir vietos, gali būti mišriai)", type=["png","jpg","jpeg"], accept_multiple_files=True)
 
     if st.button("Generuoti „Sujunk + Parašyk“ PDF"):
-        for f in up:
-            save_uploaded_any(f)
+        ikelti_paveikslelius(up)
         gyvunai = [w.strip() for w in gyv.split(",") if w.strip()]
         vietos = [w.strip() for w in places.split(",") if w.strip()]
-        outfile = OUT_DIR / "uzduotis-gyvunai-vietos.pdf"
-        ws.generuoti_gyvunai_ir_vietos(gyvunai, vietos, failas=str(outfile), rasymo_eiluciu_kiekis=write_lines)
+        pateikti("gyvunai", ws.generuoti_gyvunai_ir_vietos, gyvunai, vietos, failas=None,
+                 rasymo_eiluciu_kiekis=write_lines)
+    pdf = rezultatas("gyvunai")
+    if pdf is not None:
+        st.download_button("Atsisiųsti PDF", data=pdf, file_name="uzduotis-gyvunai-vietos.pdf", mime="application/pdf")
 
-        st.download_button("Atsisiųsti PDF", data=open(outfile, "rb").read(), file_name=outfile.name, mime="application/pdf")
+# ---- 7
+with tabs[6]:
+    st.subheader("Visas rinkinys viename PDF")
+    st.caption("Vienas žodžių sąrašas – visi pasirinkti lapai viename faile (su turiniu/žymėmis).")
+    words = st.text_input("Žodžiai (kableliais)", "kiškis, lapė, ežys, vilkas, meška")
+    pavadinimai = {t: p for t, (p, _) in ws.RINKINIO_SKYRIAI.items()}
+    skyriai = st.multiselect("Lapai", options=list(pavadinimai), default=list(ws.RINKINIO_NUMATYTI),
+                             format_func=pavadinimai.get)
+    with st.expander("Parinktys"):
+        r_linksniai = st.multiselect("Linksniai", ["kas?", "ko?", "kam?", "kuo?", "kur?"], default=["kas?", "kam?"],
+                                     key="rinkinys_linksniai")
+        r_sakinys = st.text_input("Pavyzdinis sakinys", "Paukštis gyvena inkile.", key="rinkinys_sakinys")
+        r_vietos = st.text_input("Vietos (gyvūnų lapui, kableliais)", "miškas, tvenkinys, tvartas", key="rinkinys_vietos")
+        r_atsakymai = st.checkbox("Kryžiažodžio atsakymai", True, key="rinkinys_atsakymai")
+        seed_txt = st.text_input("Sėkla (nebūtina)", "", key="seed_rinkinys")
+    up = st.file_uploader("Paveikslėliai", type=["png","jpg","jpeg"], accept_multiple_files=True, key="rinkinys_up")
+    if st.button("Generuoti rinkinį") and skyriai:
+        ikelti_paveikslelius(up)
+        zodziai = [w.strip() for w in words.split(",") if w.strip()]
+        parinktys = {
+            "linksniai": {"linksniai": r_linksniai},
+            "kryziazodis": {"atsakymai": r_atsakymai},
+            "sakinys": {"pavyzdys_sakinys": r_sakinys},
+            "gyvunai": {"vietos": [w.strip() for w in r_vietos.split(",") if w.strip()]},
+        }
+        # tvarka – kaip skirtukuose, ne kaip pažymėta
+        skyriai = [t for t in ws.RINKINIO_SKYRIAI if t in skyriai]
+        seed = _sekla(seed_txt)
+        pateikti("rinkinys", ws.generuoti_rinkini, zodziai, skyriai=skyriai, parinktys=parinktys, failas=None,
+                 seed=seed, sujungti=seed is not None)
+    pdf = rezultatas("rinkinys")
+    if pdf is not None:
+        st.download_button("Atsisiųsti PDF", data=pdf, file_name="uzduociu-rinkinys.pdf", mime="application/pdf")
 
+# --- PDF talpyklos statistika (kiek lapų grąžinta be perpiešimo)
+_stat = ws.talpyklos_statistika()
+st.sidebar.caption(f"PDF talpykla: {_stat['hit']} pataikymų, {_stat['miss']} praleidimų, {_stat['skip']} netalpinta")
+_darbai = darbu_eile().statistika()
+st.sidebar.caption(f"Darbai: {_darbai['vykdoma']} generuojama, {_darbai['eileje']} laukia eilėje")
@@ -0,0 +1,272 @@
+# assets.py
+"""Paveikslėlių paruošimas PDF lapams: paieškos indeksas ir sumažintos kopijos (miniatiūros) talpykloje."""
+import functools
+import hashlib
+import io
+import os
+import threading
+import time
+import unicodedata
+from pathlib import Path
+
+import reportlab
+from reportlab import rl_config
+
+try:  # reportlab vidus (ne viešas API) – kitoje versijoje jo nesant ideti_vaizda nieko nedaro
+    from reportlab.pdfbase.pdfdoc import PDFDocument, PDFImageXObject, PDFObjectReference
+    from reportlab.pdfgen.canvas import Canvas, _digester
+    _VIDUS_YRA = hasattr(Canvas, "_setXObjects") and all(
+        hasattr(PDFDocument, a) for a in ("getXObjectName", "Reference", "addForm"))
+except ImportError:
+    _VIDUS_YRA = False
+
+import sekimas
+from cache import CACHE_DIR, DiskCache, i_baitus, is_baitu, raktas
+
+# Spausdinimo raiška, kuriai ruošiamos miniatiūros (taškai colyje)
+THUMB_DPI = 200
+JPEG_QUALITY = 85
+
+_thumbs = DiskCache(CACHE_DIR / "thumbs", max_dydis=100 * 1024 * 1024)
+_hashes = {}  # (kelias, mtime_ns, dydis) -> sha256 – kad to paties failo nemaišytume kas kartą
+
+# Paruošti PDF vaizdų srautai (žr. ideti_vaizda)
+SRAUTU_TALPYKLA_ENABLED = True
+SRAUTU_ATMINTYJE = 256
+_srautai = DiskCache(CACHE_DIR / "srautai", max_dydis=100 * 1024 * 1024)
+_srautai_atmintyje = {}  # raktas -> srauto žodynas (paskutiniai SRAUTU_ATMINTYJE)
+_srautu_lock = threading.Lock()
+
+
+def failo_hash(kelias) -> str:
+    """Failo turinio sha256; perskaičiuojama tik pasikeitus mtime ar dydžiui."""
+    s = os.stat(kelias)
+    k = (str(kelias), s.st_mtime_ns, s.st_size)
+    h = _hashes.get(k)
+    if h is None:
+        with open(kelias, "rb") as f:
+            h = hashlib.sha256(f.read()).hexdigest()
+        _hashes[k] = h
+    return h
+
+
+def miniatiura(kelias, plotis, aukstis, dpi=THUMB_DPI, kokybe=JPEG_QUALITY) -> str:
+    """
+    Grąžina kelią į paveikslėlį, sumažintą iki tikrai spausdinamo dydžio
+    (plotis × aukštis punktais esant `dpi`; be alfa kanalo – JPEG `kokybe`). Rezultatas
+    saugomas disko talpykloje pagal šaltinio turinio hash + dydį + DPI + kokybę, tad
+    kiekvienas failas perkoduojamas tik kartą.
+    Jei šaltinis jau mažesnis arba jo nepavyksta atidaryti – grąžinamas originalas.
+    """
+    px_w = max(1, round(plotis * dpi / 72))
+    px_h = max(1, round(aukstis * dpi / 72))
+    try:
+        r = raktas(failo_hash(kelias), px_w, px_h, dpi, kokybe)
+    except OSError:
+        return str(kelias)
+
+    for plet in (".png", ".jpg"):
+        p = _thumbs.gauti(r, plet)
+        if p is not None:
+            sekimas.skaiciuoti("miniatiuros_talpykloje")
+            return str(p)
+
+    from PIL import Image as PILImage  # tik kuriant miniatiūrą – paleidžiant PIL nereikia
+
+    with sekimas.etapas("dekodavimas"):
+        try:
+            with PILImage.open(kelias) as img:
+                if img.width <= px_w and img.height <= px_h:
+                    sekimas.skaiciuoti("miniatiuros_originalai")
+                    return str(kelias)
+                img.load()
+                alfa = img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info)
+                img = img.convert("RGBA" if alfa else "RGB")
+                img = img.resize((px_w, px_h), PILImage.LANCZOS)
+        except (OSError, ValueError):
+            return str(kelias)
+
+        buf = io.BytesIO()
+        if alfa:
+            img.save(buf, format="PNG", optimize=True)
+            plet = ".png"
+        else:
+            img.save(buf, format="JPEG", quality=kokybe, optimize=True)
+            plet = ".jpg"
+    sekimas.skaiciuoti("miniatiuros_sukurtos")
+    return str(_thumbs.ideti(r, buf.getvalue(), plet))
+
+
+# ---------- Paruošti vaizdų srautai ----------
+def ideti_vaizda(c, kelias, mask="auto"):
+    """
+    Užregistruoja paveikslėlio XObject drobės `c` dokumente, kad po to kviečiamas
+    c.drawImage(kelias, ..., mask=mask) rastų jį jau esantį. Be to reportlab kiekvienam
+    dokumentui PNG išskleidžia, suspaudžia Flate, alfa kanalą paverčia atskiru SMask ir abu
+    užkoduoja A85 (JPEG – tik A85). Talpykloje laikomas paties reportlab sukurtas srautas, tad
+    PDF baitai tokie pat; raktas – failo turinys, plėtinys, mask, reportlab versija ir useA85.
+    Talpykloje – ne reportlab objektai, o tik srauto baitai ir jo žodyno laukai (_i_zodyna).
+    Jei reportlab vidus kitoks (_VIDUS_YRA), nieko nedaroma – drawImage viską atlieka pats.
+    """
+    doc = getattr(c, "_doc", None)
+    if not SRAUTU_TALPYKLA_ENABLED or not _VIDUS_YRA or not hasattr(doc, "idToObject"):
+        return
+    kelias = str(kelias)
+    vardas = _digester(f"{kelias}{mask}".encode("utf-8"))  # kaip Canvas.drawImage failo vardui
+    reg = doc.getXObjectName(vardas)
+    if doc.idToObject.get(reg) is not None:
+        return
+    try:
+        r = raktas(failo_hash(kelias), Path(kelias).suffix.lower(), mask, reportlab.Version, rl_config.useA85,
+                   "zodynas")
+    except OSError:
+        return
+
+    zod = _srautai_atmintyje.get(r)
+    if zod is None:
+        p = _srautai.gauti(r, ".marshal")
+        if p is not None:
+            try:
+                zod = is_baitu(p.read_bytes())
+            except Exception:  # sugadintas ar nesuderinamas įrašas – kuriame iš naujo
+                zod = None
+    if zod is not None:
+        sekimas.skaiciuoti("srautai_talpykloje")
+    else:
+        with sekimas.etapas("srautu_paruosimas"):
+            try:
+                obj = PDFImageXObject(vardas, kelias, mask=mask)
+            except Exception:
+                return  # tegul drawImage pats praneša apie netinkamą failą
+            zod = _i_zodyna(obj)
+        sekimas.skaiciuoti("srautai_sukurti")
+        try:
+            _srautai.ideti(r, i_baitus(zod), ".marshal")
+        except (OSError, ValueError):
+            pass  # talpykla – tik pagreitis
+    with _srautu_lock:
+        _srautai_atmintyje[r] = zod
+        while len(_srautai_atmintyje) > SRAUTU_ATMINTYJE:
+            del _srautai_atmintyje[next(iter(_srautai_atmintyje))]
+
+    # toliau – kaip Canvas.drawImage, pirmą kartą matydamas paveikslėlį
+    obj = _is_zodyno(vardas, zod)
+    c._setXObjects(obj)
+    doc.Reference(obj, reg)
+    doc.addForm(vardas, obj)
+    smask = getattr(obj, "_smask", None)
+    if smask:
+        m_reg = doc.getXObjectName(smask.name)
+        if doc.idToObject.get(m_reg) is None:
+            c._setXObjects(smask)
+            obj.smask = doc.Reference(smask, m_reg)
+        else:
+            obj.smask = PDFObjectReference(m_reg)
+        del obj._smask
+
+
+# PDFImageXObject laukai, iš kurių format() sudaro vaizdo srautą (be vardo ir SMask)
+_SRAUTO_LAUKAI = ("width", "height", "bitsPerComponent", "colorSpace", "_filters", "streamContent",
+                  "mask", "_decode", "_dotrans")
+
+
+def _i_zodyna(obj):
+    """PDFImageXObject -> paprastas žodynas: srauto baitai, filtrai ir žodyno laukai (SMask – su vardu)."""
+    zod = {k: getattr(obj, k) for k in _SRAUTO_LAUKAI if hasattr(obj, k)}
+    smask = getattr(obj, "_smask", None)
+    if smask:
+        zod["smask"] = (smask.name, _i_zodyna(smask))
+    return zod
+
+
+def _is_zodyno(vardas, zod):
+    """Naujas PDFImageXObject iš _i_zodyna žodyno (kiekvienam dokumentui – savas objektas)."""
+    obj = PDFImageXObject(vardas)
+    for k, v in zod.items():
+        if k != "smask":
+            setattr(obj, k, v)
+    if "smask" in zod:
+        obj._smask = _is_zodyno(*zod["smask"])
+    return obj
+
+# ---------- Paveikslėlių indeksas ----------
+IMAGE_EXTS = (".png", ".jpg", ".jpeg")  # prioriteto tvarka
+
+
+@functools.lru_cache(maxsize=4096)
+def normalizuoti(vardas: str):
+    """Grąžina (NFC mažosiomis, be diakritikų) – abu paieškos raktai vienu kartu."""
+    tikslus = unicodedata.normalize("NFC", vardas.strip().lower())
+    be_diakritiku = "".join(
+        c for c in unicodedata.normalize("NFD", tikslus)
+        if unicodedata.category(c) != "Mn"
+    )
+    return tikslus, be_diakritiku
+
+
+class ImageIndex:
+    """
+    Vieną kartą nuskaito paveikslėlių katalogą ir laiko žodynus
+    „normalizuotas vardas -> kelias“, tad paieška – vienas žodyno kreipinys.
+    Katalogo mtime tikrinamas ne dažniau nei kas `intervalas` sekundžių;
+    pasikeitus (pvz. įkėlus naują failą) indeksas perskaitomas iš naujo.
+    """
+
+    def __init__(self, katalogas, intervalas=2.0):
+        self.katalogas = Path(katalogas)
+        self.intervalas = intervalas
+        self._tikslus = {}
+        self._be_diakritiku = {}
+        self._mtime = None
+        self._skaityta = False
+        self._tikrinta = 0.0
+        self._lock = threading.Lock()
+
+    def atnaujinti(self):
+        """Priverstinai perskaito katalogą (pvz. iškart po failo įrašymo)."""
+        with self._lock:
+            self._skaityti()
+
+    def _skaityti(self):
+        try:
+            mtime = self.katalogas.stat().st_mtime_ns
+            failai = [p for p in self.katalogas.iterdir() if p.suffix.lower() in IMAGE_EXTS]
+        except OSError:
+            mtime, failai = None, []
+        prioritetas = {ext: i for i, ext in enumerate(IMAGE_EXTS)}
+        failai.sort(key=lambda p: (prioritetas[p.suffix.lower()], p.name))
+        tikslus, be_diakritiku = {}, {}
+        for p in failai:
+            t, b = normalizuoti(p.stem)
+            tikslus.setdefault(t, str(p))
+            be_diakritiku.setdefault(b, str(p))
+        # keičiame visus žodynus vienu metu – skaitytojai mato arba seną, arba naują
+        self._tikslus, self._be_diakritiku = tikslus, be_diakritiku
+        self._mtime = mtime
+        self._skaityta = True
+        self._tikrinta = time.monotonic()
+
+    def _patikrinti(self):
+        now = time.monotonic()
+        if self._skaityta and now - self._tikrinta < self.intervalas:
+            return
+        with self._lock:
+            try:
+                mtime = self.katalogas.stat().st_mtime_ns
+            except OSError:
+                mtime = None
+            if not self._skaityta or mtime != self._mtime:
+                self._skaityti()
+            else:
+                self._tikrinta = now
+
+    def rasti(self, zodis: str):
+        """
+        Randa paveikslėlį pagal žodį:
+          1) tiksliai su diakritikais,
+          2) failas, pavadintas žodžiu be diakritikų,
+          3) bet kuris failas, kurio vardas be diakritikų sutampa.
+        """
+        self._patikrinti()
+        t, b = normalizuoti(zodis)
+        return self._tikslus.get(t) or self._tikslus.get(b) or self._be_diakritiku.get(b)
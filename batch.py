@@ -0,0 +1,93 @@
+# batch.py
+"""Daug užduočių lapų vienu kartu: darbai išskirstomi per procesų telkinį (ProcessPoolExecutor)."""
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+# Darbo tipas -> generatoriaus vardas worksheet modulyje
+GENERATORIAI = {
+    "zodziai": "generuoti_zodziu_uzduoti",
+    "paieska": "generuoti_pdf_tinkleli_lentele",
+    "linksniai": "generuoti_linksniu_pdf_custom",
+    "kryziazodis": "kryziazodis_pdf",
+    "sakinys": "generuoti_sakini_pagal_pavyzdi",
+    "gyvunai": "generuoti_gyvunai_ir_vietos",
+    "rinkinys": "generuoti_rinkini",
+}
+
+
+def vykdyti_darba(darbas: dict) -> dict:
+    """
+    Sugeneruoja vieną lapą pagal darbo aprašą:
+      {"tipas": "kryziazodis", "zodziai": [...], "parinktys": {...}, "failas": "out/x.pdf"}
+    "zodziai" gali būti ir kelias į tekstinį failą (pvz. "data/zodziai.txt").
+    "parinktys" – generatoriaus argumentai, pvz. {"profilis": "juodrastis"} (žr. worksheet.PROFILIAI).
+    Grąžina {"tipas", "failas", "laikas", "klaida"} – klaida None, jei pavyko.
+    """
+    import worksheet as ws
+
+    tipas = darbas.get("tipas")
+    failas = darbas.get("failas")
+    pradzia = time.perf_counter()
+    klaida = None
+    try:
+        if tipas not in GENERATORIAI:
+            raise ValueError(f"Nežinomas darbo tipas: {tipas!r}")
+        gen = getattr(ws, GENERATORIAI[tipas])
+        parinktys = dict(darbas.get("parinktys") or {})
+        if failas:
+            Path(failas).parent.mkdir(parents=True, exist_ok=True)
+            parinktys["failas"] = failas
+        zodziai = darbas.get("zodziai") or []
+        if isinstance(zodziai, str):
+            zodziai = list(ws.skaityti_zodzius(zodziai))
+        gen(zodziai, **parinktys)
+    except Exception as e:
+        klaida = f"{type(e).__name__}: {e}"
+        traceback.print_exc()
+    return {
+        "tipas": tipas,
+        "failas": failas,
+        "laikas": time.perf_counter() - pradzia,
+        "klaida": klaida,
+    }
+
+
+def generate_batch(jobs, workers=None):
+    """
+    Sugeneruoja visus darbus lygiagrečiai `workers` procesuose (None – tiek, kiek branduolių).
+    Rezultatai grąžinami ta pačia tvarka kaip `jobs`; klaida viename darbe kitų nestabdo.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return [vykdyti_darba(j) for j in jobs]
+
+    rezultatai = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as ex:
+        futures = {ex.submit(vykdyti_darba, j): i for i, j in enumerate(jobs)}
+        for fut in as_completed(futures):
+            i = futures[fut]
+            try:
+                rezultatai[i] = fut.result()
+            except Exception as e:  # pvz. nukritęs procesas
+                rezultatai[i] = {
+                    "tipas": jobs[i].get("tipas"),
+                    "failas": jobs[i].get("failas"),
+                    "laikas": 0.0,
+                    "klaida": f"{type(e).__name__}: {e}",
+                }
+    return rezultatai
+
+
+def skaityti_darbus(kelias):
+    """Nuskaito darbų failą: JSON sąrašą arba JSON Lines (po vieną darbą eilutėje)."""
+    tekstas = Path(kelias).read_text(encoding="utf-8")
+    if tekstas.lstrip().startswith("["):
+        return json.loads(tekstas)
+    return [json.loads(eil) for eil in tekstas.splitlines() if eil.strip()]
@@ -0,0 +1 @@
+"""Greitaveikos matavimai (paleidžiami ranka, pvz. `python -m benchmarks.bench_kryziazodis`)."""
@@ -0,0 +1,96 @@
+"""
+Klasė vienu metu: 30 mokinių beveik tuo pačiu metu paspaudžia „Generuoti“.
+Lyginama: kiekvienas paspaudimas vykdomas atskirai (kaip anksčiau mygtuko
+apdorojime) prieš darbų eilę (darbai.py) su vienodų darbų sujungimu.
+
+    python -m benchmarks.bench_darbai [--mokiniai 30] [--gijos 4]
+"""
+import argparse
+import random
+import statistics
+import threading
+import time
+
+from benchmarks.zodziai import sintetiniai_zodziai
+
+# Mokytojas išdalina kelis variantus – dauguma mokinių spaudžia tą patį
+VARIANTAI = 4
+
+
+def _prasymai(mokiniai):
+    rng = random.Random(0)
+    variantai = [sintetiniai_zodziai(12, seed=i) for i in range(VARIANTAI)]
+    out = []
+    for _ in range(mokiniai):
+        z = variantai[rng.randrange(VARIANTAI)]
+        if rng.random() < 0.5:
+            out.append(("generuoti_zodziu_uzduoti", (z,), {"failas": None}))
+        else:
+            out.append(("kryziazodis_pdf", (z,), {"failas": None, "seed": 7}))
+    return out
+
+
+def _klase(prasymai, vykdyti):
+    """Kiekvienas mokinys – atskira gija (kaip Streamlit sesija); grąžina (visas laikas, laukimo laikai)."""
+    laukimai = [0.0] * len(prasymai)
+    start = threading.Barrier(len(prasymai) + 1)
+
+    def mokinys(i, p):
+        start.wait()
+        t = time.perf_counter()
+        vykdyti(*p)
+        laukimai[i] = time.perf_counter() - t
+
+    gijos = [threading.Thread(target=mokinys, args=(i, p)) for i, p in enumerate(prasymai)]
+    for g in gijos:
+        g.start()
+    t = time.perf_counter()
+    start.wait()
+    for g in gijos:
+        g.join()
+    return time.perf_counter() - t, laukimai
+
+
+def _eilute(pavadinimas, viso, laukimai):
+    laukimai = sorted(laukimai)
+    p95 = laukimai[int(0.95 * (len(laukimai) - 1))]
+    print(f"{pavadinimas:<28} {viso * 1000:9.0f} ms {statistics.median(laukimai) * 1000:10.0f} ms "
+          f"{p95 * 1000:10.0f} ms")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mokiniai", type=int, default=30)
+    ap.add_argument("--gijos", type=int, default=4)
+    args = ap.parse_args()
+
+    import darbai
+    import worksheet as ws
+
+    ws.PDF_CACHE_ENABLED = False  # matuojame generavimą, ne disko talpyklą
+    prasymai = _prasymai(args.mokiniai)
+    for vardas, a, k in prasymai[:2]:
+        getattr(ws, vardas)(*a, **k)  # sušildymas: šriftas, miniatiūros
+
+    print(f"{args.mokiniai} mokinių, {VARIANTAI} žodžių variantai, eilėje {args.gijos} gijos")
+    print(f"{'':<28} {'visi':>12} {'mediana':>13} {'p95':>13}")
+
+    viso, laukimai = _klase(prasymai, lambda vardas, a, k: getattr(ws, vardas)(*a, **k))
+    _eilute("kiekvienas atskirai", viso, laukimai)
+
+    eile = darbai.DarbuEile(gijos=args.gijos, max_eile=args.mokiniai)
+    unikalus = set()
+
+    def per_eile(vardas, a, k):
+        d = eile.pateikti(getattr(ws, vardas), *a, **k)
+        unikalus.add(d.id)
+        d.laukti()
+
+    viso, laukimai = _klase(prasymai, per_eile)
+    _eilute("darbų eilė + sujungimas", viso, laukimai)
+    print(f"sugeneruota lapų: {len(unikalus)} iš {args.mokiniai} paspaudimų")
+    eile.uzdaryti()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+Visų lapų generatorių matavimai: laikas, didžiausia atmintis ir PDF dydis
+esant skirtingam žodžių kiekiui, tinklelio dydžiui ir su / be paveikslėlių.
+
+    python -m benchmarks.bench_generatoriai                       # visi scenarijai
+    python -m benchmarks.bench_generatoriai --greitai             # mažesni kiekiai
+    python -m benchmarks.bench_generatoriai --json rez.json       # įrašyti rezultatus
+    python -m benchmarks.bench_generatoriai --baseline rez.json   # palyginti su ankstesniais
+    python -m benchmarks.bench_generatoriai --profiliai juodrastis # tik vienas kokybės profilis
+
+Žodžiai ir paveikslėliai sintetiniai, sugeneruojami laikiname kataloge (tinklo ir
+images/ nereikia); PDF talpykla išjungta, miniatiūros – atskiroje laikinoje
+talpykloje. Laikas – geriausias iš --kartai paleidimų (po sušildymo), atmintis –
+tracemalloc maksimumas atskiro paleidimo metu. Su paveikslėliais kiekvienas lapas
+matuojamas kiekvienu kokybės profiliu (worksheet.PROFILIAI), pabaigoje – sumos pagal profilį.
+
+Su --baseline: jei laikas pablogėjo daugiau nei --slenkstis (numatytai 25 %), o
+atmintis ar dydis – daugiau nei 10 %, eilutė pažymima ir programa baigiasi kodu 1.
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.paveiksleliai import sintetiniai_paveiksleliai
+from benchmarks.zodziai import sintetiniai_zodziai
+
+SEED = 1
+LINKSNIAI = ["kas?", "kam?"]
+ATMINTIES_SLENKSTIS = 0.10
+DYDZIO_SLENKSTIS = 0.10
+
+
+def _zodziai(kiekis, max_ilgis=8, seed=0):
+    return sintetiniai_zodziai(kiekis, max_ilgis=max_ilgis, seed=seed * 1000 + kiekis)
+
+
+def scenarijai(greitai=False):
+    """(generatorius, parametrai, žodžiai, funkcija(ws, žodžiai, **kw) -> PDF baitai) be paveikslėlių nuostatos."""
+    kiekiai = (10, 100) if greitai else (10, 100, 500)
+    for n in kiekiai:
+        yield ("generuoti_zodziu_uzduoti", {"zodziai": n}, _zodziai(n),
+               lambda ws, z, **kw: ws.generuoti_zodziu_uzduoti(z, failas=None, **kw))
+    for dydis in ((10, 15) if greitai else (10, 15, 20)):
+        z = _zodziai(max(4, dydis * dydis // 12), max_ilgis=min(9, dydis), seed=1)
+        yield ("generuoti_pdf_tinkleli_lentele", {"dydis": dydis, "zodziai": len(z)}, z,
+               lambda ws, z, dydis=dydis, **kw: ws.generuoti_pdf_tinkleli_lentele(z, dydis=dydis, failas=None,
+                                                                                 seed=SEED, **kw))
+    for n in ((10, 50) if greitai else (10, 50, 200)):
+        yield ("generuoti_linksniu_pdf_custom", {"zodziai": n}, _zodziai(n, seed=2),
+               lambda ws, z, **kw: ws.generuoti_linksniu_pdf_custom(z, LINKSNIAI, failas=None, **kw))
+    for size, n in (((11, 8), (13, 10)) if greitai else ((11, 8), (13, 10), (17, 12))):
+        z = _zodziai(n, max_ilgis=min(9, size), seed=3)
+        yield ("kryziazodis_pdf", {"size": size, "zodziai": n}, z,
+               lambda ws, z, size=size, **kw: ws.kryziazodis_pdf(z, size=size, failas=None, seed=SEED, **kw))
+    for n in kiekiai:
+        yield ("generuoti_sakini_pagal_pavyzdi", {"zodziai": n}, _zodziai(n, seed=4),
+               lambda ws, z, **kw: ws.generuoti_sakini_pagal_pavyzdi(z, "Lapė bėga per mišką.", z[0], failas=None,
+                                                                     **kw))
+    vietos = _zodziai(5, seed=5)
+    for n in ((6, 12) if greitai else (6, 12, 24)):
+        yield ("generuoti_gyvunai_ir_vietos", {"gyvunai": n, "vietos": len(vietos)}, _zodziai(n, seed=6) + vietos,
+               lambda ws, z, n=n, **kw: ws.generuoti_gyvunai_ir_vietos(z[:n], z[n:], failas=None, **kw))
+
+
+def _raktas(r):
+    return r["generatorius"], json.dumps(r["parametrai"], sort_keys=True)
+
+
+def matuoti(fn, kartai):
+    t = time.perf_counter()
+    fn()  # sušildymas: miniatiūros, vaizdų srautai, šriftas, slotų indeksai
+    pirmas = time.perf_counter() - t
+    laikai = []
+    pdf = b""
+    for _ in range(kartai):
+        t = time.perf_counter()
+        pdf = fn()
+        laikai.append(time.perf_counter() - t)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    laikai.sort()
+    return {
+        "laikas_s": laikai[0],
+        "laikas_med_s": laikai[len(laikai) // 2],
+        "pirmas_s": pirmas,
+        "atmintis_mb": peak / 2**20,
+        "dydis_kb": len(pdf) / 1024,
+    }
+
+
+def paleisti(greitai=False, kartai=3, filtras=None, profiliai=None):
+    """profiliai – kokybės profilių vardai (None – visi); be paveikslėlių – tik numatytasis."""
+    import assets
+    import worksheet as ws
+    from assets import ImageIndex
+    from cache import DiskCache
+
+    ws.PDF_CACHE_ENABLED = False
+    profiliai = list(profiliai or ws.PROFILIAI)
+    rezultatai = []
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        assets._thumbs = DiskCache(tmp / "thumbs", max_dydis=500 * 1024 * 1024)
+        assets._srautai = DiskCache(tmp / "srautai", max_dydis=500 * 1024 * 1024)
+        (tmp / "be").mkdir()
+        su, be = ImageIndex(tmp / "su"), ImageIndex(tmp / "be")
+        for vardas, param, zodziai, fn in scenarijai(greitai):
+            if filtras and filtras not in vardas:
+                continue
+            sintetiniai_paveiksleliai(zodziai, tmp / "su")
+            su.atnaujinti()
+            for paveiksleliai, profilis in [(False, ws.NUMATYTAS_PROFILIS)] + [(True, p) for p in profiliai]:
+                ws.vaizdu_indeksas = su if paveiksleliai else be
+                r = {"generatorius": vardas, "parametrai": dict(param, paveiksleliai=paveiksleliai)}
+                if profilis != ws.NUMATYTAS_PROFILIS:  # numatytojo raktas – kaip ankstesniuose rezultatuose
+                    r["parametrai"]["profilis"] = profilis
+                r.update(matuoti(lambda: fn(ws, zodziai, profilis=profilis), kartai))
+                rezultatai.append(r)
+                print(_eilute(r), flush=True)
+    return rezultatai
+
+
+def profiliu_sumos(rezultatai):
+    """Lapų su paveikslėliais laikų ir dydžių sumos pagal kokybės profilį."""
+    import worksheet as ws
+
+    sumos = {}
+    for r in rezultatai:
+        if not r["parametrai"]["paveiksleliai"]:
+            continue
+        s = sumos.setdefault(r["parametrai"].get("profilis", ws.NUMATYTAS_PROFILIS), [0, 0.0, 0.0, 0.0])
+        s[0] += 1
+        s[1] += r.get("pirmas_s", 0.0)
+        s[2] += r["laikas_s"]
+        s[3] += r["dydis_kb"]
+    if sumos:
+        print()
+        print(f"{'profilis':<14} {'lapų':>5} {'pirmas':>12} {'pakartotinis':>13} {'dydis':>12}"
+              f"   (lapai su paveikslėliais)")
+        for profilis, (kiek, pirmas, laikas, dydis) in sumos.items():
+            print(f"{profilis:<14} {kiek:5d} {pirmas * 1000:9.1f} ms {laikas * 1000:10.1f} ms {dydis:8.1f} KiB")
+    return sumos
+
+
+def _eilute(r, bazinis=None, zymes=()):
+    p = ", ".join(f"{k}={v}" for k, v in r["parametrai"].items())
+    s = (f"{r['generatorius']:<31} {p:<62} {r['laikas_s'] * 1000:9.1f} ms "
+         f"{r['atmintis_mb']:7.1f} MB {r['dydis_kb']:8.1f} KiB")
+    if "pirmas_s" in r:
+        s += f" {r['pirmas_s'] * 1000:9.1f} ms pirmas"
+    if bazinis:
+        dt = r["laikas_s"] / bazinis["laikas_s"] - 1
+        s += f"  ({dt:+.0%} laiko)"
+    if zymes:
+        s += "  ⚠ " + ", ".join(zymes)
+    return s
+
+
+def palyginti(rezultatai, baseline, slenkstis):
+    """Grąžina regresijų skaičių; kiekviena eilutė išspausdinama su pokyčiu nuo bazinio."""
+    bazes = {_raktas(r): r for r in baseline["rezultatai"]}
+    regresijos = 0
+    print()
+    print(f"Palyginimas su {baseline.get('meta', {}).get('data', '?')}")
+    for r in rezultatai:
+        b = bazes.get(_raktas(r))
+        if b is None:
+            print(_eilute(r) + "  (naujas)")
+            continue
+        zymes = []
+        if r["laikas_s"] > b["laikas_s"] * (1 + slenkstis):
+            zymes.append("laikas")
+        if r["atmintis_mb"] > b["atmintis_mb"] * (1 + ATMINTIES_SLENKSTIS):
+            zymes.append("atmintis")
+        if r["dydis_kb"] > b["dydis_kb"] * (1 + DYDZIO_SLENKSTIS):
+            zymes.append("dydis")
+        regresijos += bool(zymes)
+        print(_eilute(r, b, zymes))
+    return regresijos
+
+
+def _meta():
+    import reportlab
+    return {
+        "data": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platforma": platform.platform(),
+        "reportlab": reportlab.Version,
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--greitai", action="store_true", help="mažesni kiekiai (greitas patikrinimas)")
+    ap.add_argument("--kartai", type=int, default=3, help="kiek kartų matuoti laiką (imamas geriausias)")
+    ap.add_argument("--tik", help="tik generatoriai, kurių varde yra ši eilutė")
+    ap.add_argument("--json", help="kur įrašyti rezultatus (JSON)")
+    ap.add_argument("--baseline", help="ankstesnių rezultatų JSON palyginimui")
+    ap.add_argument("--slenkstis", type=float, default=0.25, help="leistinas laiko pablogėjimas (0.25 = 25 %%)")
+    ap.add_argument("--profiliai", help="kokybės profiliai kableliais (numatytai – visi)")
+    args = ap.parse_args(argv)
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8")) if args.baseline else None
+    profiliai = [p.strip() for p in args.profiliai.split(",") if p.strip()] if args.profiliai else None
+    rezultatai = paleisti(greitai=args.greitai, kartai=args.kartai, filtras=args.tik, profiliai=profiliai)
+    profiliu_sumos(rezultatai)
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps({"meta": _meta(), "rezultatai": rezultatai}, ensure_ascii=False,
+                                              indent=1), encoding="utf-8")
+        print(f"\nRezultatai įrašyti: {args.json}")
+    if baseline is not None:
+        regresijos = palyginti(rezultatai, baseline, args.slenkstis)
+        print(f"\nRegresijų: {regresijos}")
+        return 1 if regresijos else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
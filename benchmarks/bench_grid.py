@@ -0,0 +1,127 @@
+"""
+Galvosūkių tinkleliai: GridFlowable (drobės primityvai) prieš ankstesnę Table su langeliu kiekvienai raidei.
+
+    python -m benchmarks.bench_grid
+
+Matuojamas doc.build() laikas vienam tinkleliui ir nesuspausto turinio srauto dydis.
+"""
+import io
+import random
+import re
+import time
+
+from benchmarks.zodziai import sintetiniai_zodziai
+
+DYDZIAI = (13, 20, 30)
+
+
+def _tinklelio_komandos(res, dydis):
+    """Ankstesnės raidžių tinklelio Table bazinės komandos (kryžiažodis prie jų pridėdavo savas)."""
+    from reportlab.lib import colors
+    return [
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (-1, -1), res.sriftas()),
+        ('FONTSIZE', (0, 0), (-1, -1), dydis),
+    ]
+
+
+def _table_paieska(res, grid):
+    from reportlab.platypus import Table, TableStyle
+    return Table(grid, colWidths=20, rowHeights=20, style=TableStyle(_tinklelio_komandos(res, 10)))
+
+
+def _table_kryziazodis(res, grid, numeriai, raides):
+    """Ankstesnis kryžiažodžio tinklelis: Table + BACKGROUND/paraštės kiekvienam langeliui + Paragraph numeriams."""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import Paragraph, Table, TableStyle
+    st = res.stiliai()
+    mazas = ParagraphStyle("Small", parent=st["Normal"], fontName=res.sriftas(), fontSize=6, leading=7)
+    N = len(grid)
+    cells = [['' for _ in range(N)] for _ in range(N)]
+    ts = _tinklelio_komandos(res, 12)
+    for r in range(N):
+        for c in range(N):
+            if grid[r][c] == '#':
+                ts.append(('BACKGROUND', (c, r), (c, r), colors.lightgrey))
+                continue
+            letter = grid[r][c] if raides else ''
+            tags = numeriai.get((r, c))
+            if tags:
+                txt = " / ".join(map(str, tags))
+                if letter:
+                    cells[r][c] = Paragraph(f'<para leading=7><font size="6">{txt}</font><br/>'
+                                            f'<font size="12">{letter}</font></para>', st["Normal"])
+                    ts += [('LEFTPADDING', (c, r), (c, r), 2), ('TOPPADDING', (c, r), (c, r), 2)]
+                else:
+                    cells[r][c] = Paragraph(f'<font size="6">{txt}</font>', mazas)
+                    ts += [('LEFTPADDING', (c, r), (c, r), 2), ('TOPPADDING', (c, r), (c, r), 2),
+                           ('ALIGN', (c, r), (c, r), 'LEFT'), ('VALIGN', (c, r), (c, r), 'TOP')]
+            else:
+                cells[r][c] = letter
+    return Table(cells, colWidths=20, rowHeights=20, style=TableStyle(ts))
+
+
+def _kryziazodis(ws, n):
+    words = sintetiniai_zodziai(n + 2, max_ilgis=min(9, n), seed=n)
+    kz = ws.sukurti_kryziazodi(words, size=n, seed=n)
+    numeriai = {}
+    for (r, c, d), nr in kz.nums_map.items():
+        numeriai.setdefault((r, c), []).append((d, nr))
+    return kz.grid, {k: [nr for _, nr in sorted(v)] for k, v in numeriai.items()}
+
+
+def _build(flowable_fn, kartai=5):
+    from reportlab import rl_config
+    from reportlab.lib.pagesizes import A3
+    from reportlab.platypus import SimpleDocTemplate
+    geriausias = None
+    for _ in range(kartai):
+        buf = io.BytesIO()
+        doc = SimpleDocTemplate(buf, pagesize=A3, leftMargin=20, rightMargin=20,
+                                topMargin=20, bottomMargin=20, invariant=1)
+        story = [flowable_fn()]
+        senas, rl_config.pageCompression = rl_config.pageCompression, 0
+        try:
+            t = time.perf_counter()
+            doc.build(story)
+            dt = time.perf_counter() - t
+        finally:
+            rl_config.pageCompression = senas
+        geriausias = dt if geriausias is None else min(geriausias, dt)
+    data = buf.getvalue()
+    turinys = sum(len(m.group(1)) for m in re.finditer(rb"stream\r?\n(.*?)endstream", data, re.S)
+                  if b" Tj" in m.group(1))
+    return geriausias, turinys
+
+
+def main():
+    import resources as res
+    import worksheet as ws
+    from wordsearch import sudelioti_paieska
+
+    print(f"{'tinklelis':<22} | {'Table, ms':>9} {'srautas, B':>10} | {'Grid, ms':>8} {'srautas, B':>10} | {'greitėjimas':>11}")
+    for n in DYDZIAI:
+        grid, _, _ = sudelioti_paieska(sintetiniai_zodziai(n, seed=n), n, rng=random.Random(n))
+        kz_grid, numeriai = _kryziazodis(ws, n)
+        bandymai = (
+            (f"paieška {n}×{n}",
+             lambda: _table_paieska(res, grid),
+             lambda: ws.GridFlowable(grid, langelis=20, dydis=10)),
+            (f"kryžiažodis {n}×{n}",
+             lambda: _table_kryziazodis(res, kz_grid, numeriai, False),
+             lambda: ws.GridFlowable(kz_grid, langelis=20, dydis=12, numeriai=numeriai, raides=False)),
+            ("  su atsakymais",
+             lambda: _table_kryziazodis(res, kz_grid, numeriai, True),
+             lambda: ws.GridFlowable(kz_grid, langelis=20, dydis=12, numeriai=numeriai, raides=True)),
+        )
+        for pavadinimas, senas, naujas in bandymai:
+            s_dt, s_b = _build(senas)
+            n_dt, n_b = _build(naujas)
+            print(f"{pavadinimas:<22} | {s_dt * 1000:9.1f} {s_b:>10} | {n_dt * 1000:8.1f} {n_b:>10} | {s_dt / n_dt:10.1f}×")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Paveikslėlių įkėlimas programoje: ankstesnis save_uploaded_any (kiekvienas failas
+išskleidžiamas ir įrašomas pilnos raiškos PNG kiekvieną paspaudimą) prieš ikelimas.ikelti
+(sha256, sumažinimas iki MAX_KRASTINE, gijos, manifestas).
+
+    python -m benchmarks.bench_ikelimas [--failai 12] [--dydis 2400]
+"""
+import argparse
+import io
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.paveiksleliai import sintetiniai_paveiksleliai
+from benchmarks.zodziai import sintetiniai_zodziai
+
+
+def _senas(failai, katalogas):
+    """Ankstesnis app.save_uploaded_any kiekvienam failui."""
+    from PIL import Image as PILImage
+
+    for vardas, data in failai:
+        img = PILImage.open(io.BytesIO(data))
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA")
+        img.save(Path(katalogas) / f"{Path(vardas).stem}.png")
+
+
+def _dydis(katalogas):
+    return sum(p.stat().st_size for p in Path(katalogas).iterdir() if p.is_file()) / 2**20
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--failai", type=int, default=12)
+    ap.add_argument("--dydis", type=int, default=2400, help="įkeliamų nuotraukų kraštinė, px")
+    args = ap.parse_args()
+
+    import ikelimas
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        sintetiniai_paveiksleliai(sintetiniai_zodziai(args.failai, seed=9), tmp / "ikelti", dydis=args.dydis)
+        failai = [(p.name, p.read_bytes()) for p in sorted((tmp / "ikelti").iterdir())]
+        mb = sum(len(d) for _, d in failai) / 2**20
+        print(f"{len(failai)} failų, {args.dydis}×{args.dydis} px, {mb:.1f} MB")
+        print(f"{'':<34} {'laikas':>10} {'images/':>10}")
+
+        (tmp / "senas").mkdir()
+        for i in (1, 2):
+            t = time.perf_counter()
+            _senas(failai, tmp / "senas")
+            print(f"{f'save_uploaded_any, {i} paspaudimas':<34} {(time.perf_counter() - t) * 1000:7.0f} ms "
+                  f"{_dydis(tmp / 'senas'):7.1f} MB")
+
+        for i in (1, 2):
+            t = time.perf_counter()
+            ikelimas.ikelti(failai, tmp / "naujas")
+            print(f"{f'ikelimas.ikelti, {i} paspaudimas':<34} {(time.perf_counter() - t) * 1000:7.0f} ms "
+                  f"{_dydis(tmp / 'naujas'):7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Kryžiažodžio paieška: naujas variklis (crossword.py) prieš ankstesnį backtracking'ą.
+
+    python -m benchmarks.bench_kryziazodis [--timeout 10]
+
+Senasis variklis paleidžiamas atskirame procese, nes be ribų jis gali „pakibti“.
+"""
+import argparse
+import multiprocessing as mp
+import random
+import time
+
+from benchmarks.zodziai import sintetiniai_zodziai
+
+DYDZIAI = (11, 13, 17)
+KIEKIAI = (5, 10, 15, 20)
+
+
+# ---------- ankstesnis variklis (tik palyginimui) ----------
+# kryptys: dešinė (H), žemyn (V)
+DIRS = [(0, 1, 'H'), (1, 0, 'V')]
+
+
+def _fits(grid, r, c, w, dr, dc):
+    """Ar žodis w telpa nuo (r,c) kryptimi (dr,dc) laikantis kryžiažodžio taisyklių?"""
+    n = len(grid)
+    L = len(w)
+
+    # ribos
+    if not (0 <= r + (L - 1) * dr < n and 0 <= c + (L - 1) * dc < n):
+        return False
+
+    # prieš ir po – siena/riba
+    br, bc = r - dr, c - dc
+    ar, ac = r + L * dr, c + L * dc
+    if 0 <= br < n and 0 <= bc < n and grid[br][bc] not in ('', '#'):
+        return False
+    if 0 <= ar < n and 0 <= ac < n and grid[ar][ac] not in ('', '#'):
+        return False
+
+    for i, ch in enumerate(w):
+        rr, cc = r + i * dr, c + i * dc
+        cell = grid[rr][cc]
+        if cell not in ('', ch):
+            return False
+
+        # be „prisiglaudimų“ iš šonų
+        if dr == 0:  # horizontalus
+            for sr, sc in ((-1, 0), (1, 0)):
+                rr2, cc2 = rr + sr, cc + sc
+                if 0 <= rr2 < n and 0 <= cc2 < n:
+                    # išskyrus kraštinius simbolius ir jau esamą sutapimą
+                    if grid[rr2][cc2] not in ('', '#') and (i != 0 and i != L - 1 or cell == ''):
+                        return False
+        else:        # vertikalus
+            for sr, sc in ((0, -1), (0, 1)):
+                rr2, cc2 = rr + sr, cc + sc
+                if 0 <= rr2 < n and 0 <= cc2 < n:
+                    if grid[rr2][cc2] not in ('', '#') and (i != 0 and i != L - 1 or cell == ''):
+                        return False
+    return True
+
+
+def _place(grid, r, c, w, dr, dc):
+    """Uždeda w, grąžina uždėtų langelių sąrašą (kad būtų galima nuimti)."""
+    placed = []
+    for i, ch in enumerate(w):
+        rr, cc = r + i * dr, c + i * dc
+        if grid[rr][cc] == '':
+            grid[rr][cc] = ch
+            placed.append((rr, cc))
+    return placed
+
+
+def _unplace(grid, placed):
+    for r, c in placed:
+        grid[r][c] = ''
+
+
+def sugeneruoti_kryziazodi_paprastas(words, size=13, rng=None):
+    """Ankstesnis paprastas backtracking’as per visą tinklelį (buvo worksheet.py)."""
+    words = [w.upper() for w in words]
+    words.sort(key=len, reverse=True)  # ilgiausi – pirmi
+    n = size
+    grid = [['' for _ in range(n)] for _ in range(n)]
+    placements = []  # (word, r, c, dr, dc)
+    rng = rng or random
+
+    def score_positions(w):
+        """Kandidatų sąrašas su balais (daugiau susikirtimų – geriau)."""
+        cand = []
+        for r in range(n):
+            for c in range(n):
+                for dr, dc, _ in DIRS:
+                    if _fits(grid, r, c, w, dr, dc):
+                        # paskaičiuojam kiek sutapimų su esamomis raidėmis
+                        s = 0
+                        for i, ch in enumerate(w):
+                            rr, cc = r + i * dr, c + i * dc
+                            if grid[rr][cc] == ch:
+                                s += 1
+                        cand.append(( -s, r, c, dr, dc))  # minus – kad sort būtų mažėjimo
+        cand.sort()
+        top = cand[:3]
+        rng.shuffle(top)  # truputį random, kad gautume įvairių maketų
+        cand[:3] = top
+        return cand
+
+    def backtrack(k):
+        if k == len(words):
+            return True
+        w = words[k]
+        cands = score_positions(w)
+        if not cands and k == 0:
+            # pirmam žodžiui leiskime per centrą bet kuria kryptimi
+            mid = n // 2
+            cands = [(0, mid, max(0, mid - len(w) // 2), 0, 1),
+                     (0, max(0, mid - len(w) // 2), mid, 1, 0)]
+
+        for _, r, c, dr, dc in cands:
+            put = _place(grid, r, c, w, dr, dc)
+            placements.append((w, r, c, dr, dc))
+            if backtrack(k + 1):
+                return True
+            placements.pop()
+            _unplace(grid, put)
+        return False
+
+    backtrack(0)
+
+    # neuždėti langeliai -> #
+    for r in range(n):
+        for c in range(n):
+            if grid[r][c] == '':
+                grid[r][c] = '#'
+    return grid, placements
+
+
+def _senas(words, size, q):
+    random.seed(0)
+    t = time.perf_counter()
+    _, placements = sugeneruoti_kryziazodi_paprastas(words, size=size)
+    q.put((time.perf_counter() - t, len(placements)))
+
+
+def matuoti_sena(words, size, timeout):
+    q = mp.Queue()
+    p = mp.Process(target=_senas, args=(words, size, q))
+    p.start()
+    p.join(timeout)
+    if p.is_alive():
+        p.terminate()
+        p.join()
+        return None, None
+    return q.get()
+
+
+def matuoti_nauja(words, size, kartai=3):
+    from crossword import CrosswordEngine
+    geriausias = None
+    for i in range(kartai):
+        engine = CrosswordEngine(size, rng=random.Random(i))
+        t = time.perf_counter()
+        placements = engine.search(words)
+        dt = time.perf_counter() - t
+        if geriausias is None or dt < geriausias[0]:
+            geriausias = (dt, len(placements), engine.nodes)
+    return geriausias
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--timeout", type=float, default=10.0, help="senojo variklio laiko riba (s)")
+    args = ap.parse_args()
+
+    print(f"{'dydis':>5} {'žodž.':>5} | {'senas, s':>9} {'sudėta':>6} | {'naujas, s':>9} {'sudėta':>6} {'mazgai':>7}")
+    for size in DYDZIAI:
+        for kiekis in KIEKIAI:
+            words = sintetiniai_zodziai(kiekis, max_ilgis=min(9, size), seed=size * 100 + kiekis)
+            s_dt, s_cnt = matuoti_sena(words, size, args.timeout)
+            n_dt, n_cnt, nodes = matuoti_nauja(words, size)
+            senas = f"{s_dt:9.3f} {s_cnt:>6}" if s_dt is not None else f"{'>' + str(args.timeout):>9} {'-':>6}"
+            print(f"{size:>5} {kiekis:>5} | {senas} | {n_dt:9.3f} {n_cnt:>6} {nodes:>7}")
+
+
+if __name__ == "__main__":
+    main()
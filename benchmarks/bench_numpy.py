@@ -0,0 +1,57 @@
+"""
+Grynasis Python prieš NumPy pagrindą (npgrid.py) dideliems tinkleliams.
+
+    python -m benchmarks.bench_numpy
+"""
+import random
+import time
+
+from benchmarks.zodziai import sintetiniai_zodziai
+
+
+def _geriausias(fn, kartai=3):
+    laikai = []
+    rez = None
+    for _ in range(kartai):
+        t = time.perf_counter()
+        rez = fn()
+        laikai.append(time.perf_counter() - t)
+    return min(laikai), rez
+
+
+def main():
+    import npgrid
+    from crossword import CrosswordEngine
+    from wordsearch import sudelioti_paieska
+
+    if not npgrid.prieinama():
+        print("NumPy neįdiegtas – nėra ką lyginti (pip install numpy).")
+        return
+
+    print("Žodžių paieška (8 kryptys)")
+    print(f"{'dydis':>5} {'žodž.':>5} | {'python, ms':>10} | {'numpy, ms':>10} | {'greitėjimas':>11}")
+    for n in (15, 20, 25, 30, 40, 50):
+        words = sintetiniai_zodziai(n * n // 12, max_ilgis=9, seed=n)
+        sudelioti_paieska(words, n, backend="python")  # sušildom slotų indeksą
+        sudelioti_paieska(words, n, backend="numpy")
+        py, _ = _geriausias(lambda: sudelioti_paieska(words, n, rng=random.Random(0), backend="python"))
+        nu, _ = _geriausias(lambda: sudelioti_paieska(words, n, rng=random.Random(0), backend="numpy"))
+        print(f"{n:>5} {len(words):>5} | {py * 1000:10.1f} | {nu * 1000:10.1f} | {py / nu:10.2f}×")
+
+    print()
+    print("Kryžiažodis (ta pati paieška, vienodas mazgų skaičius)")
+    print(f"{'dydis':>5} {'žodž.':>5} | {'python, ms':>10} | {'numpy, ms':>10} | {'greitėjimas':>11}")
+    for n in (13, 17, 21, 25, 30):
+        words = sintetiniai_zodziai(n, max_ilgis=min(9, n), seed=n)
+
+        def paieska(backend):
+            e = CrosswordEngine(n, rng=random.Random(0), backend=backend)
+            return e.search(words, max_nodes=2000, time_limit=None)
+
+        py, _ = _geriausias(lambda: paieska("python"))
+        nu, _ = _geriausias(lambda: paieska("numpy"))
+        print(f"{n:>5} {len(words):>5} | {py * 1000:10.1f} | {nu * 1000:10.1f} | {py / nu:10.2f}×")
+
+
+if __name__ == "__main__":
+    main()
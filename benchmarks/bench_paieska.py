@@ -0,0 +1,84 @@
+"""
+Žodžių paieškos tinklelis: naujas variklis (wordsearch.py) prieš ankstesnį atsitiktinių bandymų variantą.
+
+    python -m benchmarks.bench_paieska
+"""
+import random
+import string
+import time
+
+from benchmarks.zodziai import sintetiniai_zodziai
+
+DYDZIAI = (8, 10, 12, 15, 20, 25, 30)
+
+
+def sugeneruoti_zodziu_paieskos_tinkla_paprastas(zodziai, dydis=15, rng=None):
+    """Ankstesnis atsitiktinių bandymų variantas (buvo worksheet.py)."""
+    rng = rng or random
+    tinklelis = [["" for _ in range(dydis)] for _ in range(dydis)]
+    for zodis in zodziai:
+        U = zodis.upper()
+        ilgis = len(U)
+        for _ in range(200):  # daugiau bandymų dėl ilgesnių žodžių
+            kryptis = rng.choice(["H", "V"])
+            if kryptis == "H":
+                eil = rng.randint(0, dydis - 1)
+                stulp = rng.randint(0, dydis - ilgis)
+                if all(tinklelis[eil][stulp + i] in ["", U[i]] for i in range(ilgis)):
+                    for i in range(ilgis):
+                        tinklelis[eil][stulp + i] = U[i]
+                    break
+            else:  # Vertikaliai
+                eil = rng.randint(0, dydis - ilgis)
+                stulp = rng.randint(0, dydis - 1)
+                if all(tinklelis[eil + i][stulp] in ["", U[i]] for i in range(ilgis)):
+                    for i in range(ilgis):
+                        tinklelis[eil + i][stulp] = U[i]
+                    break
+    # Užpildome likusius langelius
+    for i in range(dydis):
+        for j in range(dydis):
+            if tinklelis[i][j] == "":
+                tinklelis[i][j] = rng.choice(string.ascii_uppercase)
+    # Visi elementai -> str
+    return [[str(ch) for ch in row] for row in tinklelis]
+
+
+def _matuoti(fn, kartai=5):
+    geriausias = None
+    rezultatas = None
+    for _ in range(kartai):
+        t = time.perf_counter()
+        rezultatas = fn()
+        dt = time.perf_counter() - t
+        geriausias = dt if geriausias is None else min(geriausias, dt)
+    return geriausias, rezultatas
+
+
+def _sudeta_senu(tinklelis, words):
+    """Kiek žodžių senajame tinklelyje iš tikrųjų yra (H arba V)."""
+    eil = ["".join(r) for r in tinklelis]
+    stulp = ["".join(c) for c in zip(*tinklelis)]
+    return sum(1 for w in words if any(w.upper() in x for x in eil + stulp))
+
+
+def main():
+    from wordsearch import KRYPTYS_HV, KRYPTYS_VISOS, sudelioti_paieska
+
+    print(f"{'dydis':>5} {'žodž.':>5} | {'senas, ms':>9} {'sudėta':>6} | "
+          f"{'H/V, ms':>8} {'sudėta':>6} | {'8 kr., ms':>9} {'sudėta':>6}")
+    for n in DYDZIAI:
+        kiekis = max(4, (n * n) // 9)  # ~44 žodžiai 20×20 tinkleliui – tankus tinklelis
+        words = sintetiniai_zodziai(kiekis, max_ilgis=min(9, n), seed=n)
+
+        random.seed(0)
+        s_dt, g = _matuoti(lambda: sugeneruoti_zodziu_paieskos_tinkla_paprastas(words, dydis=n))
+        s_cnt = _sudeta_senu(g, words)
+        hv_dt, (_, hv, _) = _matuoti(lambda: sudelioti_paieska(words, n, kryptys=KRYPTYS_HV, rng=random.Random(0)))
+        v_dt, (_, v8, _) = _matuoti(lambda: sudelioti_paieska(words, n, kryptys=KRYPTYS_VISOS, rng=random.Random(0)))
+        print(f"{n:>5} {kiekis:>5} | {s_dt * 1000:9.1f} {s_cnt:>6} | "
+              f"{hv_dt * 1000:8.1f} {len(hv):>6} | {v_dt * 1000:9.1f} {len(v8):>6}")
+
+
+if __name__ == "__main__":
+    main()
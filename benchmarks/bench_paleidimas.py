@@ -0,0 +1,53 @@
+"""
+Paleidimo kaina naujame procese (kaip Streamlit šaltas startas, CLI ar naujas darbininkas):
+modulio importas, šrifto registravimas ir pirmo PDF laukimas – su išnagrinėto
+šrifto talpykla ir be jos.
+
+    python -m benchmarks.bench_paleidimas [--kartai 5]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Vykdoma atskirame interpretatoriuje – kiekvienas matavimas nuo tuščio sys.modules
+_VAIKAS = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import resources as res
+res.SRIFTO_TALPYKLA_ENABLED = {talpykla}
+import worksheet as ws
+t1 = time.perf_counter()
+ws.PDF_CACHE_ENABLED = False
+res.sriftas()
+t2 = time.perf_counter()
+ws.generuoti_zodziu_uzduoti(["kiškis", "lapė", "ežys"], failas=None)
+t3 = time.perf_counter()
+print(json.dumps({{"importas": t1 - t0, "sriftas": t2 - t1, "pirmas_pdf": t3 - t0,
+                   "numpy": "numpy" in sys.modules}}))
+"""
+
+
+def _paleisti(talpykla):
+    out = subprocess.run([sys.executable, "-c", _VAIKAS.format(talpykla=talpykla)],
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--kartai", type=int, default=5)
+    args = ap.parse_args()
+
+    _paleisti(True)  # užpildo šrifto ir miniatiūrų talpyklas, sušildo OS failų podėlį
+    print(f"{'':<22} {'importas':>10} {'šriftas':>10} {'pirmas PDF':>11}   (medianos iš {args.kartai})")
+    for pavadinimas, talpykla in (("TTF skaitomas", False), ("šriftas iš talpyklos", True)):
+        rez = [_paleisti(talpykla) for _ in range(args.kartai)]
+        med = {k: statistics.median(r[k] for r in rez) * 1000 for k in ("importas", "sriftas", "pirmas_pdf")}
+        print(f"{pavadinimas:<22} {med['importas']:8.0f} ms {med['sriftas']:8.0f} ms {med['pirmas_pdf']:9.0f} ms")
+    print(f"NumPy importuotas paleidžiant: {'taip' if rez[-1]['numpy'] else 'ne'}")
+
+
+if __name__ == "__main__":
+    main()
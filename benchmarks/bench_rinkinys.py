@@ -0,0 +1,60 @@
+"""
+Visas rinkinys: vienas generuoti_rinkini() prieš šešis atskirus lapus tam pačiam žodžių sąrašui.
+
+    python -m benchmarks.bench_rinkinys
+
+Talpykla išjungta; kryžiažodžio maketas abiem atvejais tas pats (ta pati sėkla).
+"""
+import time
+
+ZODZIAI = ["arklys", "lapė", "ožka", "kiškis", "miškas", "vilkas", "meška", "ežys"]
+PARINKTYS = {
+    "linksniai": {"linksniai": ["kas?", "ko?", "kam?"]},
+    "kryziazodis": {"atsakymai": True},
+    "sakinys": {"pavyzdys_sakinys": "Lapė bėga.", "pavyzdys_paveikslelis": "lapė"},
+    "gyvunai": {"vietos": ["miškas", "jūra"]},
+}
+SEED = 7
+
+
+def _atskirai(ws):
+    kz = ws.sukurti_kryziazodi(ZODZIAI, seed=SEED)
+    return [
+        ws.generuoti_zodziu_uzduoti(ZODZIAI, failas=None),
+        ws.generuoti_pdf_tinkleli_lentele(ZODZIAI, failas=None, seed=SEED),
+        ws.generuoti_linksniu_pdf_custom(ZODZIAI, ["kas?", "ko?", "kam?"], failas=None),
+        ws.kryziazodis_su_atsakymais_pdf(ZODZIAI, failas=None, viename=True, maketas=kz),
+        ws.generuoti_sakini_pagal_pavyzdi(ZODZIAI, "Lapė bėga.", "lapė", failas=None),
+        ws.generuoti_gyvunai_ir_vietos(ZODZIAI, ["miškas", "jūra"], failas=None),
+    ]
+
+
+def _rinkinys(ws):
+    return [ws.generuoti_rinkini(ZODZIAI, skyriai=tuple(ws.RINKINIO_SKYRIAI), parinktys=PARINKTYS,
+                                 failas=None, seed=SEED)]
+
+
+def _matuoti(fn, kartai=5):
+    geriausias = None
+    pdf = None
+    for _ in range(kartai):
+        t = time.perf_counter()
+        pdf = fn()
+        dt = time.perf_counter() - t
+        geriausias = dt if geriausias is None else min(geriausias, dt)
+    return geriausias, sum(len(d) for d in pdf)
+
+
+def main():
+    import worksheet as ws
+    ws.PDF_CACHE_ENABLED = False
+    _rinkinys(ws)  # sušildom šriftą, miniatiūras, slotų indeksus
+
+    print(f"{'':>18} | {'laikas, ms':>10} | {'dydis, KiB':>10}")
+    for vardas, fn in (("6 atskiri PDF", _atskirai), ("vienas rinkinys", _rinkinys)):
+        dt, dydis = _matuoti(lambda: fn(ws))
+        print(f"{vardas:>18} | {dt * 1000:10.1f} | {dydis / 1024:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Ilgi žodžių lapai iš generatoriaus (kaip skaitant failą): kiek kainuoja puslapis.
+
+    python -m benchmarks.bench_srautas
+
+Kiekvienas matavimas – atskirame procese (spawn), kad RSS maksimumai nesimaišytų.
+Matuojama: generavimo laikas, didžiausia Python atmintis (tracemalloc) ir proceso
+RSS maksimumas. Kas antras žodis – su paveikslėliu.
+"""
+import multiprocessing as mp
+import resource
+import time
+import tracemalloc
+
+from benchmarks.zodziai import sintetiniai_zodziai
+
+KIEKIAI = (1000, 5000, 20000)
+SU_PAVEIKSLELIAIS = ("arklys", "lapė", "ožka", "kiškis", "miškas")
+
+
+def _zodziai(kiekis):
+    """Generatorius, kaip skaitant failą (worksheet jį sudeda į sąrašą prieš maketavimą)."""
+    sint = iter(sintetiniai_zodziai(kiekis, seed=kiekis))
+    for i, z in enumerate(sint):
+        yield SU_PAVEIKSLELIAIS[i // 2 % len(SU_PAVEIKSLELIAIS)] if i % 2 == 0 else z
+
+
+def _matuoti(kiekis, q):
+    import worksheet as ws
+    ws.PDF_CACHE_ENABLED = False
+    ws.generuoti_zodziu_uzduoti(["arklys", "lapė"], failas=None)  # sušildom šriftą, miniatiūras
+    tracemalloc.start()
+    t = time.perf_counter()
+    pdf = ws.generuoti_zodziu_uzduoti(_zodziai(kiekis), failas=None)
+    dt = time.perf_counter() - t
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # Linux – KiB
+    q.put((dt, peak, rss, len(pdf), pdf.count(b"/Type /Page\n")))
+
+
+def matuoti(kiekis):
+    ctx = mp.get_context("spawn")
+    q = ctx.Queue()
+    p = ctx.Process(target=_matuoti, args=(kiekis, q))
+    p.start()
+    rez = q.get()
+    p.join()
+    return rez
+
+
+def main():
+    print(f"{'žodž.':>6} {'psl.':>5} | {'laikas, s':>9} {'py MB':>7} {'RSS MB':>7} | {'PDF MB':>6} {'py KB/psl.':>10}")
+    for kiekis in KIEKIAI:
+        dt, py, rss, dydis, puslapiai = matuoti(kiekis)
+        print(f"{kiekis:>6} {puslapiai:>5} | {dt:9.2f} {py / 2**20:7.1f} {rss / 1024:7.1f} | "
+              f"{dydis / 2**20:6.2f} {py / 1024 / max(1, puslapiai):10.1f}")
+
+
+if __name__ == "__main__":
+    main()
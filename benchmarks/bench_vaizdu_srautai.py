@@ -0,0 +1,72 @@
+"""
+Gyvūnų ir vietų lapas (17 paveikslėlių): PDF surinkimo laikas, kai reportlab kiekvienam
+dokumentui pats išskleidžia ir suspaudžia miniatiūras, prieš paruoštų srautų talpyklą
+(assets.ideti_vaizda) – iš disko (naujas procesas) ir iš atminties.
+
+    python -m benchmarks.bench_vaizdu_srautai [--kartai 20] [--dydis 800]
+"""
+import argparse
+import hashlib
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.paveiksleliai import sintetiniai_paveiksleliai
+from benchmarks.zodziai import sintetiniai_zodziai
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--kartai", type=int, default=20)
+    ap.add_argument("--dydis", type=int, default=800, help="šaltinio paveikslėlių kraštinė, px")
+    args = ap.parse_args()
+
+    import assets
+    import sekimas
+    import worksheet as ws
+    from assets import ImageIndex
+    from cache import DiskCache
+
+    ws.PDF_CACHE_ENABLED = False
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        assets._thumbs = DiskCache(tmp / "thumbs")
+        assets._srautai = DiskCache(tmp / "srautai")
+        zodziai = sintetiniai_zodziai(17, seed=17)
+        sintetiniai_paveiksleliai(zodziai, tmp / "images", dydis=args.dydis)
+        ws.vaizdu_indeksas = ImageIndex(tmp / "images")
+        gyvunai, vietos = zodziai[:12], zodziai[12:]
+        png = sum(p.suffix == ".png" for p in (tmp / "images").iterdir())
+        print(f"{len(zodziai)} paveikslėlių ({png} PNG su alfa, {len(zodziai) - png} JPEG), "
+              f"{args.dydis} px, mediana iš {args.kartai}")
+
+        def lapas():
+            return ws.generuoti_gyvunai_ir_vietos(gyvunai, vietos, failas=None)
+
+        lapas()  # miniatiūros, šriftas
+        budai = (
+            ("reportlab suspaudžia", False, False),
+            ("srautai iš disko", True, True),
+            ("srautai iš atminties", True, False),
+        )
+        print(f"{'':<24} {'lapas':>10} {'įdėjimas':>10}   sha1")
+        for pavadinimas, ijungta, is_disko in budai:
+            assets.SRAUTU_TALPYKLA_ENABLED = ijungta
+            laikai, idejimai = [], []
+            for _ in range(args.kartai):
+                if is_disko:
+                    assets._srautai_atmintyje.clear()
+                with sekimas.sekti() as s:
+                    t = time.perf_counter()
+                    pdf = lapas()
+                    laikai.append(time.perf_counter() - t)
+                etapai = s.paskutinis.kaip_zodynas()["etapai"]
+                idejimai.append(sum(etapai.get(e, {}).get("s", 0.0)
+                                    for e in ("paveiksleliu_idejimas", "srautu_paruosimas")))
+            print(f"{pavadinimas:<24} {statistics.median(laikai) * 1000:7.1f} ms "
+                  f"{statistics.median(idejimai) * 1000:7.1f} ms   {hashlib.sha1(pdf).hexdigest()[:12]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Klasės rinkinys: N skirtingų galvosūkio variantų. Lyginama: vienas lapas, N atskirų
+lapų (N PDF, kiekvienas su savo paveikslėliais ir šriftu, be atsakymų) ir vienas
+variantai=N PDF (bendri paveikslėliai ir šriftas, atsakymų skyrius) – nuosekliai ir
+su maketų paieška procesų telkinyje.
+
+    python -m benchmarks.bench_variantai [--variantai 30] [--workers 4] [--kartai 3]
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.paveiksleliai import sintetiniai_paveiksleliai
+from benchmarks.zodziai import sintetiniai_zodziai
+
+
+def _geriausias(fn, kartai):
+    laikas, rez = float("inf"), None
+    for _ in range(kartai):
+        t = time.perf_counter()
+        rez = fn()
+        laikas = min(laikas, time.perf_counter() - t)
+    return laikas, rez
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--variantai", type=int, default=30)
+    ap.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    ap.add_argument("--kartai", type=int, default=3)
+    args = ap.parse_args()
+
+    import assets
+    import worksheet as ws
+    from assets import ImageIndex
+    from cache import DiskCache
+
+    ws.PDF_CACHE_ENABLED = False
+    n = args.variantai
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        assets._thumbs = DiskCache(tmp / "thumbs")
+        assets._srautai = DiskCache(tmp / "srautai")
+        zodziai = sintetiniai_zodziai(10, seed=25)
+        sintetiniai_paveiksleliai(zodziai, tmp / "images", dydis=400)
+        ws.vaizdu_indeksas = ImageIndex(tmp / "images")
+
+        galvosukiai = (
+            ("žodžių paieška", lambda **kw: ws.generuoti_pdf_tinkleli_lentele(zodziai, failas=None, **kw)),
+            ("kryžiažodis", lambda **kw: ws.kryziazodis_pdf(zodziai, size=15, failas=None, **kw)),
+        )
+        print(f"{len(zodziai)} žodžių su paveikslėliais, {n} variantų, geriausias iš {args.kartai}")
+        print(f"{'':<34} {'laikas':>10} {'× lapas':>8} {'dydis':>11}")
+        for pavadinimas, lapas in galvosukiai:
+            lapas(seed=1)  # miniatiūros, šriftas, srautai
+            seklos = ws._variantu_seklos(1, n)
+            vienas, pdf = _geriausias(lambda: lapas(seed=1), args.kartai)
+            budai = (
+                ("1 lapas", vienas, len(pdf)),
+                (f"{n} atskirų lapų", *_geriausias(lambda: sum(len(lapas(seed=s)) for s in seklos), args.kartai)),
+            )
+            for w in sorted({1, args.workers}):
+                laikas, pdf = _geriausias(lambda: lapas(seed=1, variantai=n, workers=w), args.kartai)
+                budai += ((f"variantai={n}, workers={w}", laikas, len(pdf)),)
+            print(pavadinimas)
+            for vardas, laikas, dydis in budai:
+                print(f"  {vardas:<32} {laikas * 1000:7.0f} ms {laikas / vienas:7.1f}× {dydis / 1024:7.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Žodžių lapai: WordRow (piešiama drobėje) prieš ankstesnes įdėtas Table kiekvienam žodžiui.
+
+    python -m benchmarks.bench_wordrow
+
+Matuojamas tik doc.build() laikas (be talpyklos); kas antras žodis – su paveikslėliu.
+"""
+import io
+import time
+
+from reportlab.platypus import TableStyle
+
+from benchmarks.zodziai import sintetiniai_zodziai
+
+KIEKIAI = (50, 200, 1000)
+SU_PAVEIKSLELIAIS = ("arklys", "lapė", "ožka", "kiškis", "miškas")
+
+
+def _zodziai(kiekis):
+    sint = sintetiniai_zodziai(kiekis, seed=kiekis)
+    return [SU_PAVEIKSLELIAIS[i // 2 % len(SU_PAVEIKSLELIAIS)] if i % 2 == 0 else z
+            for i, z in enumerate(sint)]
+
+
+# ---------- ankstesni (lentelių) variantai ----------
+_BE_PARASCIU = [
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+]
+
+# [paveikslėlis] [3 linijų juosta] – sakinio lapas
+RASYMO_EILUTE = TableStyle([('VALIGN', (0, 0), (-1, -1), 'MIDDLE')] + _BE_PARASCIU + [
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+])
+
+# paieškos lapo pora [ikonėlė] [linijos] ir dviejų porų eilutė
+PORA = TableStyle([('VALIGN', (0, 0), (-1, -1), 'MIDDLE')] + _BE_PARASCIU + [
+    ('TOPPADDING', (0, 0), (-1, -1), 2),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
+PORU_EILUTE = TableStyle(_BE_PARASCIU + [
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+])
+
+
+def _zodziai_lentelemis(ws, res, zodziai):
+    from reportlab.platypus import Paragraph, Spacer, Table
+    st = res.stiliai()
+    story = [Paragraph("Parašyk žodžius:", st["Title"]), Spacer(1, 12)]
+    for z in zodziai:
+        table1 = Table([[ws._paveikslelis(z, 40), Paragraph(z.capitalize(), st["Normal"])]],
+                       colWidths=[50, 500], style=res.ZODZIO_EILUTE)
+        story += [table1, ws.WritingLines(width=500, height=30), Spacer(1, 8)]
+    return story
+
+
+def _poros_lentelemis(ws, res, zodziai):
+    from reportlab.platypus import Spacer, Table
+    pairs = [Table([[ws._paveikslelis(z, 36), ws.WritingLines(width=220, height=26)]],
+                   colWidths=[42, 220], style=PORA) for z in zodziai]
+    story = []
+    for i in range(0, len(pairs), 2):
+        right = pairs[i + 1] if i + 1 < len(pairs) else Spacer(262, 0)
+        story.append(Table([[pairs[i], right]], colWidths=[262, 262], style=PORU_EILUTE))
+    return story
+
+
+def _sakiniai_lentelemis(ws, res, zodziai):
+    from reportlab.platypus import Table
+    return [Table([[ws._paveikslelis(z, 42), ws.WritingLines(width=500, height=30)]],
+                  colWidths=[50, 500], style=RASYMO_EILUTE) for z in zodziai]
+
+
+# ---------- WordRow variantai (tie patys, kaip worksheet.py) ----------
+def _zodziai_wordrow(ws, res, zodziai):
+    from reportlab.platypus import Paragraph, Spacer
+    st = res.stiliai()
+    story = [Paragraph("Parašyk žodžius:", st["Title"]), Spacer(1, 12)]
+    for z in zodziai:
+        story.append(ws.WordRow([(ws.rasti_paveiksleli(z), z.capitalize())], stulpelis=550, ikona=40, ikonos_plotis=50,
+                                stilius=st["Normal"], virsus=3, apacia=4, po_linijos=(500, 30), po_tarpas=8))
+    return story
+
+
+def _poros_wordrow(ws, res, zodziai):
+    pairs = [(ws.rasti_paveiksleli(z), None) for z in zodziai]
+    return [ws.WordRow(pairs[i:i + 2], stulpelis=262, ikona=36, ikonos_plotis=42,
+                       linijos=(220, 26), virsus=2, apacia=10, stulpeliu=2)
+            for i in range(0, len(pairs), 2)]
+
+
+def _sakiniai_wordrow(ws, res, zodziai):
+    return [ws.WordRow([(ws.rasti_paveiksleli(z), None)], stulpelis=550, ikona=42, ikonos_plotis=50,
+                       linijos=(500, 30), virsus=4, apacia=8) for z in zodziai]
+
+
+def _build(ws, story_fn, zodziai, kartai):
+    import resources as res
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate
+    geriausias = None
+    for _ in range(kartai):
+        buf = io.BytesIO()
+        doc = SimpleDocTemplate(buf, pagesize=A4, leftMargin=ws.marge, rightMargin=ws.marge,
+                                topMargin=40, bottomMargin=40, invariant=1)
+        story = story_fn(ws, res, zodziai)
+        t = time.perf_counter()
+        doc.build(story)
+        dt = time.perf_counter() - t
+        geriausias = dt if geriausias is None else min(geriausias, dt)
+    return geriausias, len(buf.getvalue())
+
+
+def main():
+    import worksheet as ws
+
+    lapai = (
+        ("žodžiai", _zodziai_lentelemis, _zodziai_wordrow),
+        ("paieškos poros", _poros_lentelemis, _poros_wordrow),
+        ("sakiniai", _sakiniai_lentelemis, _sakiniai_wordrow),
+    )
+    print(f"{'lapas':<15} {'žodž.':>5} | {'Table, ms':>9} | {'WordRow, ms':>11} | {'greitėjimas':>11}")
+    for pavadinimas, senas, naujas in lapai:
+        for kiekis in KIEKIAI:
+            zodziai = _zodziai(kiekis)
+            kartai = 3 if kiekis < 1000 else 1
+            _build(ws, naujas, zodziai[:10], 1)  # sušildom miniatiūrų talpyklą
+            s_dt, _ = _build(ws, senas, zodziai, kartai)
+            n_dt, _ = _build(ws, naujas, zodziai, kartai)
+            print(f"{pavadinimas:<15} {kiekis:>5} | {s_dt * 1000:9.1f} | {n_dt * 1000:11.1f} | {s_dt / n_dt:10.2f}×")
+
+
+if __name__ == "__main__":
+    main()
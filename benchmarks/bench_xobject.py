@@ -0,0 +1,79 @@
+"""
+Pasikartojantys objektai PDF'e: trijų linijų juosta kaip formos XObject ir
+vienas paveikslėlio XObject visiems to paties šaltinio dydžiams.
+
+    python -m benchmarks.bench_xobject
+"""
+import io
+import re
+import time
+
+from benchmarks.zodziai import sintetiniai_zodziai
+
+SU_PAVEIKSLELIAIS = ("arklys", "lapė", "ožka", "kiškis", "miškas")
+
+
+def _zodziai(kiekis):
+    sint = sintetiniai_zodziai(kiekis, seed=kiekis)
+    return [SU_PAVEIKSLELIAIS[i // 2 % len(SU_PAVEIKSLELIAIS)] if i % 2 == 0 else z
+            for i, z in enumerate(sint)]
+
+
+def _matuoti(fn, kartai=5):
+    geriausias = None
+    for _ in range(kartai):
+        t = time.perf_counter()
+        pdf = fn()
+        dt = time.perf_counter() - t
+        geriausias = dt if geriausias is None else min(geriausias, dt)
+    return geriausias, pdf
+
+
+def main():
+    import worksheet as ws
+    from assets import miniatiura
+    from reportlab.platypus import Image, SimpleDocTemplate
+
+    ws.PDF_CACHE_ENABLED = False
+    zodziai, sakiniai = _zodziai(1000), _zodziai(500)
+    lapai = {
+        "žodžiai (1000)": lambda: ws.generuoti_zodziu_uzduoti(zodziai, failas=None),
+        "sakinys (500)": lambda: ws.generuoti_sakini_pagal_pavyzdi(sakiniai, "Lapė bėga.", "lapė", failas=None),
+    }
+
+    print("Linijų juosta: forma (/Do) prieš linijas kiekvienai juostai")
+    print(f"{'lapas':>16} | {'forma, ms':>9} {'KiB':>7} | {'linijos, ms':>11} {'KiB':>7}")
+    forma = ws._linijos
+    for vardas, fn in lapai.items():
+        ws._linijos = forma
+        f_dt, f_pdf = _matuoti(fn)
+        ws._linijos = ws._trys_linijos
+        l_dt, l_pdf = _matuoti(fn)
+        print(f"{vardas:>16} | {f_dt * 1000:9.1f} {len(f_pdf) / 1024:7.1f} | {l_dt * 1000:11.1f} {len(l_pdf) / 1024:7.1f}")
+    ws._linijos = forma
+
+    print()
+    print("Tie patys paveikslėliai 40/36/42/26 pt viename PDF (kaip rinkinyje)")
+    dydziai = (40, 36, 42, 26)
+    saltiniai = [ws.rasti_paveiksleli(z) for z in SU_PAVEIKSLELIAIS]
+    saltiniai = [k for k in saltiniai if k]
+
+    def sukurti(story):
+        buf = io.BytesIO()
+        SimpleDocTemplate(buf, **ws._pdf_meta()).build(story)
+        return buf.getvalue()
+
+    def po_viena():
+        return sukurti([Image(miniatiura(k, d, d), d, d) for d in dydziai for k in saltiniai] * 5)
+
+    def bendri():
+        return sukurti([ws.Ikona(k, d) for d in dydziai for k in saltiniai] * 5)
+
+    for vardas, fn in (("Image kiekvienam", po_viena), ("Ikona (bendri)", bendri)):
+        dt, pdf = _matuoti(fn)
+        kiek = len(re.findall(rb"/Subtype /Image", pdf))
+        print(f"{vardas:>16} | {dt * 1000:7.1f} ms {len(pdf) / 1024:7.1f} KiB {kiek:>3} vaizdų XObject")
+
+
+if __name__ == "__main__":
+    main()
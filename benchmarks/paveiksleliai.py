@@ -0,0 +1,40 @@
+"""Sintetiniai paveikslėliai matavimams: sugeneruojami vietoje, nereikia jokių failų ar tinklo."""
+import random
+import zlib
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+
+def sintetinis_paveikslelis(kelias, dydis=800, alfa=False, seed=0):
+    """
+    Keli atsitiktiniai spalvoti skrituliai ir stačiakampiai – panašiai kaip piešinys.
+    alfa=True – PNG su permatomu fonu (kaip iškirpti gyvūnai), kitaip – JPEG baltame fone.
+    """
+    rng = random.Random(seed)
+    img = Image.new("RGBA" if alfa else "RGB", (dydis, dydis), (0, 0, 0, 0) if alfa else (255, 255, 255))
+    d = ImageDraw.Draw(img)
+    for _ in range(12):
+        x0, y0 = rng.randrange(dydis), rng.randrange(dydis)
+        x1, y1 = x0 + rng.randrange(dydis // 8, dydis // 2), y0 + rng.randrange(dydis // 8, dydis // 2)
+        spalva = tuple(rng.randrange(256) for _ in range(3))
+        if rng.random() < 0.5:
+            d.ellipse((x0, y0, x1, y1), fill=spalva)
+        else:
+            d.rectangle((x0, y0, x1, y1), fill=spalva)
+    if alfa:
+        img.save(kelias, format="PNG")
+    else:
+        img.save(kelias, format="JPEG", quality=90)
+
+
+def sintetiniai_paveiksleliai(zodziai, katalogas, dydis=800):
+    """Kiekvienam žodžiui – paveikslėlis kataloge (maždaug pusė PNG su alfa, kiti JPEG); esami neperrašomi."""
+    katalogas = Path(katalogas)
+    katalogas.mkdir(parents=True, exist_ok=True)
+    for z in zodziai:
+        seed = zlib.crc32(z.encode("utf-8"))  # tas pats žodis – visada tas pats failas
+        alfa = seed % 2 == 0
+        kelias = katalogas / f"{z}{'.png' if alfa else '.jpg'}"
+        if not kelias.exists():
+            sintetinis_paveikslelis(kelias, dydis=dydis, alfa=alfa, seed=seed)
@@ -0,0 +1,16 @@
+"""Sintetiniai lietuviški žodžiai matavimams (nereikia jokių failų ar tinklo)."""
+import random
+
+BALSES = "AEIOUYĄĘĖĮŲŪ"
+PRIEBALSES = "BCČDFGHJKLMNPRSŠTVZŽ"
+
+
+def sintetiniai_zodziai(kiekis, min_ilgis=3, max_ilgis=8, seed=0):
+    """Sukuria `kiekis` skirtingų ištariamų žodžių (priebalsė + balsė kaitaliojasi)."""
+    rng = random.Random(seed)
+    zodziai = set()
+    while len(zodziai) < kiekis:
+        ilgis = rng.randint(min_ilgis, max_ilgis)
+        raides = [rng.choice(PRIEBALSES if i % 2 == 0 else BALSES) for i in range(ilgis)]
+        zodziai.add("".join(raides).lower())
+    return sorted(zodziai)
@@ -0,0 +1,128 @@
+# cache.py
+"""Paprasta disko talpykla (cache) su dydžio riba ir LRU šalinimu.
+
+Įrašai saugomi kaip atskiri failai viename kataloge, failo vardas – rakto
+maišos (hash) reikšmė. Paskutinio naudojimo laikas – failo mtime: kiekvienas
+pataikymas jį atnaujina, o viršijus ribą pirmiausia trinami seniausi failai.
+Struktūrinius įrašus (šrifto lenteles, vaizdų srautus) saugome kaip paprastus
+duomenis (i_baitus / is_baitu), ne pickle: katalogas rašomas programos, tad
+įkeliant iš jo neturi būti įmanoma įvykdyti kodo.
+"""
+import hashlib
+import marshal
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+CACHE_DIR = Path(".cache")
+
+
+def raktas(*dalys) -> str:
+    """Sudaro stabilų raktą iš bet kokių dalių (str/bytes/skaičių)."""
+    h = hashlib.sha256()
+    for d in dalys:
+        if not isinstance(d, bytes):
+            d = str(d).encode("utf-8")
+        h.update(len(d).to_bytes(8, "little"))
+        h.update(d)
+    return h.hexdigest()
+
+
+def i_baitus(obj) -> bytes:
+    """Paprasti duomenys (dict, list, tuple, str, bytes, int, float, bool, None) -> baitai (marshal)."""
+    _tik_duomenys(obj)
+    return marshal.dumps(obj)
+
+
+def is_baitu(data: bytes):
+    """Atvirkščiai i_baitus; kas nors kita (pvz. kodo objektas) – ValueError, niekas nevykdoma."""
+    obj = marshal.loads(data)
+    _tik_duomenys(obj)
+    return obj
+
+
+_PAPRASTI = (str, bytes, int, float, bool, type(None))
+
+
+def _tik_duomenys(obj):
+    stekas = [obj]
+    while stekas:
+        o = stekas.pop()
+        if type(o) is dict:
+            stekas.extend(o.keys())
+            stekas.extend(o.values())
+        elif type(o) in (list, tuple):
+            stekas.extend(o)
+        elif type(o) not in _PAPRASTI:
+            raise ValueError(f"Talpykloje – tik paprasti duomenys, ne {type(o).__name__}")
+
+
+class DiskCache:
+    """Failų talpykla kataloge `katalogas`, ne didesnė nei `max_dydis` baitų."""
+
+    def __init__(self, katalogas, max_dydis=200 * 1024 * 1024):
+        self.katalogas = Path(katalogas)
+        self.max_dydis = max_dydis
+        self._dydis = None  # suskaičiuojamas tingiai, pirmą kartą įrašant
+        self._lock = threading.Lock()
+
+    def kelias(self, raktas: str, pletinys: str = "") -> Path:
+        return self.katalogas / f"{raktas}{pletinys}"
+
+    def gauti(self, raktas: str, pletinys: str = ""):
+        """Grąžina įrašo kelią arba None. Pataikymas atnaujina LRU laiką."""
+        p = self.kelias(raktas, pletinys)
+        try:
+            os.utime(p)
+        except OSError:
+            return None
+        return p
+
+    def ideti(self, raktas: str, data: bytes, pletinys: str = "") -> Path:
+        """Įrašo duomenis atomiškai (per laikiną failą) ir prireikus išvalo seniausius."""
+        self.katalogas.mkdir(parents=True, exist_ok=True)
+        p = self.kelias(raktas, pletinys)
+        fd, tmp = tempfile.mkstemp(dir=self.katalogas, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, p)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        with self._lock:
+            if self._dydis is not None:
+                self._dydis += len(data)
+            if self._dydis is None or self._dydis > self.max_dydis:
+                self._isvalyti()
+        return p
+
+    def _isvalyti(self):
+        """Trina seniausiai naudotus įrašus, kol bendras dydis tampa ≤ 90 % ribos."""
+        irasai = []
+        viso = 0
+        for p in self.katalogas.iterdir():
+            if p.suffix == ".tmp" or not p.is_file():
+                continue
+            try:
+                s = p.stat()
+            except OSError:
+                continue
+            irasai.append((s.st_mtime, s.st_size, p))
+            viso += s.st_size
+        if viso > self.max_dydis:
+            riba = self.max_dydis * 0.9
+            irasai.sort()
+            for _, dydis, p in irasai:
+                if viso <= riba:
+                    break
+                try:
+                    p.unlink()
+                    viso -= dydis
+                except OSError:
+                    pass
+        self._dydis = viso
@@ -0,0 +1,310 @@
+# crossword.py
+"""
+Kryžiažodžio maketo paieška su kompaktišku tinkleliu.
+
+Tinklelis – bytearray (0 = tuščia, kitaip raidės kodas), papildomai laikoma,
+kuriuos langelius jau dengia horizontalus / vertikalus žodis, ir indeksas
+„raidė -> langeliai“. Kandidatai imami tik iš vietų, kur žodis kerta jau
+esančią tokią pačią raidę, tad nereikia tikrinti viso tinklelio kiekvienam žodžiui.
+Paieška ribojama mazgų skaičiumi ir laiku; nepavykus sudėti visų žodžių,
+grąžinamas geriausias rastas dalinis maketas.
+"""
+import math
+import os
+import random
+import time
+
+import npgrid
+import procesai
+import sekimas
+
+H, V = "H", "V"
+
+# Nuo kokio tinklelio dydžio automatiškai naudojamas NumPy pagrindas (jei įdiegtas)
+NUMPY_NUO = 21
+
+# Apytikslis paieškos greitis (mazgų per sekundę, 13×13, ~15 žodžių) – laiko
+# biudžetą paverčia mazgų biudžetu, kad rezultatas priklausytų tik nuo sėklos
+MAZGU_PER_S = 8000
+# Mazgų biudžetas, kai laiko biudžetas nenurodytas (budget=0/None)
+NUMATYTA_MAZGU = 50000
+
+
+class _Stop(Exception):
+    pass
+
+
+class CrosswordEngine:
+    def __init__(self, size, rng=None, backend=None):
+        self.n = size
+        self.rng = rng or random.Random()
+        # backend: "python", "numpy" arba None (automatiškai pagal dydį ir ar yra NumPy)
+        if backend is None:
+            backend = "numpy" if size >= NUMPY_NUO and npgrid.prieinama() else "python"
+        if backend == "numpy" and not npgrid.prieinama():
+            raise RuntimeError("NumPy neįdiegtas")
+        self.backend = backend
+        self.grid = bytearray(size * size)
+        self.used_h = bytearray(size * size)  # langelį dengia horizontalus žodis
+        self.used_v = bytearray(size * size)  # langelį dengia vertikalus žodis
+        self.pozicijos = {}  # raidės kodas -> {langelio indeksai}
+        self.kodai = {}      # raidė -> kodas (1..255)
+        self.raides = [""]   # kodas -> raidė
+        self.placements = []  # (word, r, c, dr, dc)
+        self.susikirtimai = 0
+        self.nodes = 0
+
+    # --- kodavimas ---
+    def uzkoduoti(self, w):
+        out = []
+        for ch in w:
+            k = self.kodai.get(ch)
+            if k is None:
+                k = len(self.raides)
+                if k > 255:
+                    raise ValueError("Per daug skirtingų raidžių kryžiažodyje")
+                self.kodai[ch] = k
+                self.raides.append(ch)
+            out.append(k)
+        return bytes(out)
+
+    # --- tikrinimas / dėjimas ---
+    def fits(self, kodas, r, c, d):
+        """Grąžina susikirtimų skaičių arba -1, jei žodis čia netelpa."""
+        n = self.n
+        L = len(kodas)
+        g = self.grid
+        if d == H:
+            if r < 0 or c < 0 or c + L > n:
+                return -1
+            step, side, used = 1, n, self.used_h
+            pirmas = c == 0
+            paskutinis = c + L == n
+        else:
+            if c < 0 or r < 0 or r + L > n:
+                return -1
+            step, side, used = n, 1, self.used_v
+            pirmas = r == 0
+            paskutinis = r + L == n
+        start = r * n + c
+        if not pirmas and g[start - step]:
+            return -1
+        if not paskutinis and g[start + L * step]:
+            return -1
+        # šoniniai kaimynai: H – eilutės aukščiau/žemiau, V – stulpeliai kairėje/dešinėje
+        if d == H:
+            turi_a, turi_b = r > 0, r < n - 1
+        else:
+            turi_a, turi_b = c > 0, c < n - 1
+        cross = 0
+        idx = start
+        for k in kodas:
+            cell = g[idx]
+            if cell:
+                if cell != k or used[idx]:
+                    return -1
+                cross += 1
+            elif (turi_a and g[idx - side]) or (turi_b and g[idx + side]):
+                return -1
+            idx += step
+        if cross == L:
+            return -1
+        return cross
+
+    def place(self, w, kodas, r, c, d):
+        n = self.n
+        step = 1 if d == H else n
+        used = self.used_h if d == H else self.used_v
+        idx = r * n + c
+        naujai = []
+        cross = 0
+        for k in kodas:
+            if self.grid[idx]:
+                cross += 1
+            else:
+                self.grid[idx] = k
+                self.pozicijos.setdefault(k, set()).add(idx)
+                naujai.append(idx)
+            used[idx] = 1
+            idx += step
+        dr, dc = (0, 1) if d == H else (1, 0)
+        self.placements.append((w, r, c, dr, dc))
+        self.susikirtimai += cross
+        return naujai, cross
+
+    def unplace(self, w, kodas, r, c, d, naujai, cross):
+        n = self.n
+        step = 1 if d == H else n
+        used = self.used_h if d == H else self.used_v
+        idx = r * n + c
+        for _ in kodas:
+            used[idx] = 0
+            idx += step
+        for idx in naujai:
+            self.pozicijos[self.grid[idx]].discard(idx)
+            self.grid[idx] = 0
+        self.placements.pop()
+        self.susikirtimai -= cross
+
+    # --- kandidatai ---
+    def candidates(self, kodas):
+        """(r, c, d) vietos, kertančios esamą tokią pačią raidę; daugiausia susikirtimų – pirmos."""
+        n = self.n
+        seen = set()
+        cand = []
+        for i, k in enumerate(kodas):
+            for pos in self.pozicijos.get(k, ()):
+                r, c = divmod(pos, n)
+                for key in ((r, c - i, H), (r - i, c, V)):
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    s = self.fits(kodas, *key)
+                    if s > 0:
+                        cand.append((-s, self.rng.random(), *key))
+        cand.sort()
+        return [(r, c, d) for _, _, r, c, d in cand]
+
+    def laisvos_vietos(self, kodas, kiek=None):
+        """Vietos be susikirtimų (pirmam žodžiui – centras); `kiek` – atsitiktinai atrinktų skaičius."""
+        n = self.n
+        L = len(kodas)
+        if not self.placements:
+            mid = n // 2
+            start = max(0, mid - L // 2)
+            return [(mid, start, H), (start, mid, V)]
+        cand = [(r, c, d) for r in range(n) for c in range(n) for d in (H, V)
+                if self.fits(kodas, r, c, d) == 0]
+        self.rng.shuffle(cand)
+        return cand[:kiek] if kiek else cand
+
+    def visi_kandidatai(self, kodas):
+        """Kertančios vietos (geriausios pirmos) + keli atsitiktiniai laisvi variantai."""
+        if self.backend == "numpy" and self.placements:
+            vietos = npgrid.kryziazodzio_vietos(self.grid, self.used_h, self.used_v, self.n, kodas)
+            kertancios = sorted((-s, self.rng.random(), r, c, d) for s, r, c, d in vietos if s > 0)
+            cands = [(r, c, d) for _, _, r, c, d in kertancios]
+            laisvos = [(r, c, d) for s, r, c, d in vietos if s == 0]
+            self.rng.shuffle(laisvos)
+            return cands + laisvos[:4 if cands else 16]
+        cands = self.candidates(kodas)
+        # be susikirtimų – tik kaip atsarginis variantas (keli atsitiktiniai)
+        return cands + self.laisvos_vietos(kodas, kiek=4 if cands else 16)
+
+    # --- paieška ---
+    def search(self, words, max_nodes=50000, time_limit=1.0):
+        """
+        Backtracking paieška su galimybe praleisti žodį. Grąžina geriausią
+        maketą (daugiausia žodžių, po to daugiausia susikirtimų) kaip placements sąrašą.
+        """
+        words = sorted((w.upper() for w in words), key=len, reverse=True)
+        kodai = [self.uzkoduoti(w) for w in words]
+        total = len(words)
+        deadline = time.perf_counter() + time_limit if time_limit else None
+        best = {"score": (-1, -1), "placements": []}
+
+        def rec(k):
+            self.nodes += 1
+            if self.nodes > max_nodes or (deadline and self.nodes % 64 == 0 and time.perf_counter() > deadline):
+                raise _Stop
+            score = (len(self.placements), self.susikirtimai)
+            if score > best["score"]:
+                best["score"] = score
+                best["placements"] = list(self.placements)
+            if len(self.placements) == total:
+                return True
+            if k == total or len(self.placements) + (total - k) <= best["score"][0]:
+                return False
+            w, kodas = words[k], kodai[k]
+            if len(kodas) <= self.n:
+                for r, c, d in self.visi_kandidatai(kodas):
+                    naujai, cross = self.place(w, kodas, r, c, d)
+                    if rec(k + 1):
+                        return True
+                    self.unplace(w, kodas, r, c, d, naujai, cross)
+            return rec(k + 1)  # praleidžiam šį žodį
+
+        try:
+            rec(0)
+        except _Stop:
+            pass
+        return best["placements"]
+
+
+
+def tinklelis(placements, size):
+    """Sudaro įprastą tinklelį (sąrašų sąrašas, '#' – tuščias langelis) iš placements."""
+    grid = [["#"] * size for _ in range(size)]
+    for w, r, c, dr, dc in placements:
+        for i, ch in enumerate(w):
+            grid[r + i * dr][c + i * dc] = ch
+    return grid
+
+
+def ivertinti(placements):
+    """
+    Maketo balas (didesnis – geresnis): sudėtų žodžių skaičius, susikirtimai,
+    kompaktiškumas (mažesnis užimtas stačiakampis).
+    """
+    if not placements:
+        return (0, 0, 0)
+    langeliai = {}
+    for w, r, c, dr, dc in placements:
+        for i in range(len(w)):
+            cell = (r + i * dr, c + i * dc)
+            langeliai[cell] = langeliai.get(cell, 0) + 1
+    susikirtimai = sum(1 for v in langeliai.values() if v > 1)
+    eil = [r for r, _ in langeliai]
+    stulp = [c for _, c in langeliai]
+    plotas = (max(eil) - min(eil) + 1) * (max(stulp) - min(stulp) + 1)
+    return (len(placements), susikirtimai, -plotas)
+
+
+def _viena_paieska(words, size, seed, max_nodes, time_limit):
+    """(placements, mazgai) – mazgų skaičius grąžinamas, nes paieška gali vykti kitame procese."""
+    engine = CrosswordEngine(size, rng=random.Random(seed))
+    return engine.search(words, max_nodes=max_nodes, time_limit=time_limit), engine.nodes
+
+
+def geriausias_maketas(words, size=13, starts=1, workers=1, budget=1.0, seed=None, max_nodes=None,
+                       deterministinis=True):
+    """
+    Paleidžia `starts` nepriklausomų atsitiktinių paieškų (sėklos seed, seed+1, ...)
+    per `workers` procesus ir grąžina geriausią (pagal ivertinti) maketą kaip placements.
+    `budget` – bendras paieškos biudžetas sekundėmis; max_nodes – papildoma (nebūtina)
+    mazgų riba vienai paieškai.
+    deterministinis=True (numatytai) – biudžetas paverčiamas mazgais (MAZGU_PER_S), todėl ta
+    pati sėkla visada duoda tą patį maketą, nepriklausomai nuo kompiuterio greičio ar apkrovos.
+    deterministinis=False – biudžetas matuojamas laikrodžiu (maketas priklauso ir nuo apkrovos).
+    """
+    starts = max(1, starts)
+    workers = max(1, min(workers or os.cpu_count() or 1, starts))
+    if seed is None:
+        seed = random.randrange(2**31)
+    bangos = math.ceil(starts / workers)  # kiek paieškų iš eilės tenka vienam procesui
+    riba = budget / bangos if budget else None
+    if deterministinis:
+        mazgai = int(riba * MAZGU_PER_S) if riba else NUMATYTA_MAZGU
+        max_nodes = max(1, mazgai if max_nodes is None else min(max_nodes, mazgai))
+        riba = None
+    elif max_nodes is None:
+        max_nodes = math.inf
+    args = [(words, size, seed + i, max_nodes, riba) for i in range(starts)]
+
+    if workers == 1:
+        rezultatai = [_viena_paieska(*a) for a in args]
+    else:
+        with procesai.telkinys(workers) as ex:
+            rezultatai = list(ex.map(_viena_paieska, *zip(*args)))
+    sekimas.skaiciuoti("mazgai", sum(n for _, n in rezultatai))
+    return max((p for p, _ in rezultatai), key=ivertinti)
+
+
+def sudelioti_kryziazodi(words, size=13, max_nodes=50000, time_limit=1.0, rng=None):
+    """
+    Sukuria kryžiažodį naujuoju varikliu. Grąžina (grid, placements) tokiu pat
+    formatu kaip worksheet.sugeneruoti_kryziazodi.
+    """
+    engine = CrosswordEngine(size, rng=rng)
+    placements = engine.search(words, max_nodes=max_nodes, time_limit=time_limit)
+    return tinklelis(placements, size), placements
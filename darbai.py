@@ -0,0 +1,169 @@
+# darbai.py
+"""
+Foninių darbų eilė interaktyviai programai (app.py).
+
+Lapas generuojamas ne mygtuko apdorojime, o bendrame ribotame gijų telkinyje:
+naudotojo sesija gauna Darbas ir tik tikrina jo būseną, tad lėtas kryžiažodis
+neblokuoja puslapio, o perpiešimas (pvz. pajudinus slankiklį) darbo nekartoja.
+Vienu metu vykdomi vienodi darbai (ta pati funkcija ir argumentai) sujungiami –
+visi laukiantys gauna tą patį rezultatą. Eilė ribota: kai ji pilna, naujo darbo
+pateikti nepavyksta (EilePilna), užuot be galo kaupus darbus. Lygiagreti paieška (workers)
+visuose darbuose naudoja vieną bendrą procesų telkinį (procesai.py), tad procesų skaičius
+irgi ribotas.
+"""
+import itertools
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import procesai
+import sekimas
+from cache import raktas
+
+
+class EilePilna(RuntimeError):
+    """Per daug nebaigtų darbų – bandykite vėliau."""
+
+
+class Darbas:
+    """Vienas pateiktas generavimas: būsena, rezultatas arba klaida ir (jei sekta) etapų įrašai."""
+
+    def __init__(self, darbo_id, vardas, raktas):
+        self.id = darbo_id
+        self.vardas = vardas
+        self.raktas = raktas
+        self.pateikta = time.monotonic()
+        self.pradeta = None
+        self.baigta = None
+        self.rezultatas = None
+        self.klaida = None
+        self.sekimas = None
+        self._ivykis = threading.Event()
+
+    def busena(self):
+        if self.baigta is not None:
+            return "klaida" if self.klaida else "baigta"
+        return "eileje" if self.pradeta is None else "vykdoma"
+
+    def laukti(self, timeout=None):
+        """True, jei darbas baigtas (sėkmingai ar su klaida) per `timeout` sekundžių."""
+        return self._ivykis.wait(timeout)
+
+
+class DarbuEile:
+    """
+    gijos    – kiek darbų vykdoma vienu metu (bendras visoms sesijoms)
+    max_eile – kiek daugiausia nebaigtų darbų (vykdomų + laukiančių)
+    laikyti  – kiek sekundžių baigtas darbas (ir jo PDF) laikomas, kad sesija jį pasiimtų
+    procesu  – bendro procesų telkinio dydis darbų workers > 1 paieškai
+    """
+
+    def __init__(self, gijos=2, max_eile=64, laikyti=600.0, procesu=1):
+        self.gijos = gijos
+        self.procesu = procesu
+        self.max_eile = max_eile
+        self.laikyti = laikyti
+        self._telkinys = ThreadPoolExecutor(max_workers=gijos, thread_name_prefix="darbas")
+        self._procesai = procesai.bendras(procesu)
+        self._lock = threading.Lock()
+        self._darbai = {}      # id -> Darbas (nebaigti ir dar laikomi baigti)
+        self._vykdomi = {}     # raktas -> nebaigtas Darbas (vienodiems sujungti)
+        self._laukia = []      # eilėje esantys darbai pateikimo tvarka
+        self._trukmes = {}     # vardas -> slankusis vidurkis (s), progresui įvertinti
+        self._ids = itertools.count(1)
+
+    def pateikti(self, fn, *args, sujungti=True, sekti=False, jsonl=None, **kwargs):
+        """
+        Įdeda fn(*args, **kwargs) į eilę ir grąžina Darbas. Jei toks pats darbas jau
+        vykdomas ar laukia – grąžinamas tas pats Darbas. sujungti=False – visada naujas
+        (pvz. atsitiktinis lapas be sėklos); sekti – darbo metu renkami sekimas.py įrašai.
+        """
+        vardas = getattr(fn, "__name__", str(fn))
+        r = _darbo_raktas(fn, args, kwargs) if sujungti else None
+        with self._lock:
+            self._isvalyti()
+            if r is not None and r in self._vykdomi:
+                return self._vykdomi[r]
+            if sum(d.baigta is None for d in self._darbai.values()) >= self.max_eile:
+                raise EilePilna(f"Eilėje jau {self.max_eile} darbų")
+            d = Darbas(next(self._ids), vardas, r)
+            self._darbai[d.id] = d
+            self._laukia.append(d)
+            if r is not None:
+                self._vykdomi[r] = d
+        self._telkinys.submit(self._vykdyti, d, fn, args, kwargs, sekti, jsonl)
+        return d
+
+    def _vykdyti(self, d, fn, args, kwargs, sekti, jsonl):
+        with self._lock:
+            self._laukia.remove(d)
+            d.pradeta = time.monotonic()
+        try:
+            with procesai.naudoti(self._procesai):
+                if sekti or jsonl:
+                    with sekimas.sekti(jsonl=jsonl) as s:
+                        d.rezultatas = fn(*args, **kwargs)
+                    d.sekimas = s
+                else:
+                    d.rezultatas = fn(*args, **kwargs)
+        except Exception as e:
+            d.klaida = f"{type(e).__name__}: {e}"
+        finally:
+            with self._lock:
+                d.baigta = time.monotonic()
+                if d.raktas is not None and self._vykdomi.get(d.raktas) is d:
+                    del self._vykdomi[d.raktas]
+                if not d.klaida:
+                    trukme = d.baigta - d.pradeta
+                    buvusi = self._trukmes.get(d.vardas)
+                    self._trukmes[d.vardas] = trukme if buvusi is None else 0.7 * buvusi + 0.3 * trukme
+            d._ivykis.set()
+
+    def _isvalyti(self):
+        riba = time.monotonic() - self.laikyti
+        for i in [i for i, d in self._darbai.items() if d.baigta is not None and d.baigta < riba]:
+            del self._darbai[i]
+
+    def gauti(self, darbo_id):
+        """Darbas pagal id arba None (nežinomas ar jau išmestas)."""
+        with self._lock:
+            return self._darbai.get(darbo_id)
+
+    def vieta_eileje(self, d):
+        """1 – kitas vykdomas; 0 – jau vykdomas arba baigtas."""
+        with self._lock:
+            try:
+                return self._laukia.index(d) + 1
+            except ValueError:
+                return 0
+
+    def progresas(self, d):
+        """Apytikslė dalis 0..1: vykdomo darbo laikas, palyginti su ankstesnių tokių pat darbų vidurkiu."""
+        if d.baigta is not None:
+            return 1.0
+        if d.pradeta is None:
+            return 0.0
+        vidurkis = self._trukmes.get(d.vardas)
+        if not vidurkis:
+            return 0.5
+        return min(0.95, (time.monotonic() - d.pradeta) / vidurkis)
+
+    def statistika(self):
+        with self._lock:
+            nebaigti = [d for d in self._darbai.values() if d.baigta is None]
+            return {"vykdoma": sum(d.pradeta is not None for d in nebaigti),
+                    "eileje": sum(d.pradeta is None for d in nebaigti)}
+
+    def uzdaryti(self):
+        self._telkinys.shutdown(wait=False, cancel_futures=True)
+        self._procesai.shutdown(wait=False, cancel_futures=True)
+
+
+def _darbo_raktas(fn, args, kwargs):
+    """Funkcija + argumentai kaip raktas; None – argumentų nesuhešuosime (tokie darbai nesujungiami)."""
+    try:
+        a = json.dumps([args, kwargs], sort_keys=True, ensure_ascii=False)
+    except TypeError:
+        return None
+    return raktas(getattr(fn, "__module__", ""), getattr(fn, "__qualname__", repr(fn)), a)
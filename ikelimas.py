@@ -0,0 +1,191 @@
+# ikelimas.py
+"""
+Įkeltų paveikslėlių priėmimas į images/ katalogą.
+
+Kiekvieno įkelto failo baitų sha256 palyginamas su manifestu (images/manifestas.json):
+jei tas pats turinys tam pačiam žodžiui jau priimtas – failas praleidžiamas neatidarius;
+jei toks turinys jau yra kito žodžio vardu – nukopijuojamas jau paruoštas failas. Kitaip
+paveikslėlis sumažinamas iki MAX_KRASTINE ir išsaugomas tuo pačiu formatu (JPEG lieka
+JPEG, PNG – PNG); pakankamai mažas ir tinkamai pasuktas įrašomas baitas į baitą.
+Keli failai apdorojami lygiagrečiai gijose (PIL dekoduodamas atleidžia GIL).
+
+Žodis – failo vardas be plėtinio. Jei žodis jau turėjo kitą paveikslėlį, senas failas
+perkeliamas į images/.pakeisti/ ir rezultate pažymimas „pakeista“ – niekas neperrašoma tyliai.
+"""
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from assets import IMAGE_EXTS, normalizuoti
+
+# Didžiausia saugoma kraštinė (px): didžiausia lapų ikona 48 pt net 300 DPI – 200 px, su atsarga
+MAX_KRASTINE = 512
+JPEG_QUALITY = 90
+MANIFESTAS = "manifestas.json"
+PAKEISTI = ".pakeisti"
+GIJOS = 4
+
+_lock = threading.Lock()
+
+
+def _manifestas(katalogas):
+    try:
+        m = json.loads((katalogas / MANIFESTAS).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        m = {}
+    m.setdefault("zodziai", {})  # žodis -> {"failas", "sha256", "dydis", "ikelta"}
+    return m
+
+
+def _irasyti_manifesta(katalogas, m):
+    fd, tmp = tempfile.mkstemp(dir=katalogas, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(m, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp, katalogas / MANIFESTAS)
+
+
+def _paruosti(data):
+    """(baitai, plėtinys, (plotis, aukštis)) – originalūs baitai, jei jų keisti nereikia."""
+    from PIL import Image as PILImage, ImageOps
+
+    with PILImage.open(io.BytesIO(data)) as img:
+        formatas = img.format
+        pasukta = formatas == "JPEG" and img.getexif().get(0x0112, 1) != 1
+        tinka = formatas in ("PNG", "JPEG") and img.mode in ("RGB", "RGBA", "L", "LA", "P")
+        if tinka and max(img.size) <= MAX_KRASTINE and not pasukta:
+            return data, ".png" if formatas == "PNG" else ".jpg", img.size
+        img.load()
+        img = ImageOps.exif_transpose(img)
+        alfa = img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info)
+        img = img.convert("RGBA" if alfa else "RGB")
+        img.thumbnail((MAX_KRASTINE, MAX_KRASTINE), PILImage.LANCZOS)
+    buf = io.BytesIO()
+    if formatas == "JPEG" and not alfa:
+        img.save(buf, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+        return buf.getvalue(), ".jpg", img.size
+    img.save(buf, format="PNG", optimize=True)
+    return buf.getvalue(), ".png", img.size
+
+
+def _rasyti(kelias, data):
+    fd, tmp = tempfile.mkstemp(dir=kelias.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, kelias)
+
+
+def _pagal_zodi(katalogas):
+    """
+    Katalogo paveikslėliai pagal tą patį raktą kaip ImageIndex (normalizuoti: NFC, mažosios):
+    „Kiškis.jpg“, „kiškis.png“ ir „KIŠKIS.png“ – to paties žodžio failai.
+    """
+    rodykle = {}
+    try:
+        failai = [p for p in katalogas.iterdir() if p.is_file() and p.suffix.lower() in IMAGE_EXTS]
+    except OSError:
+        return rodykle
+    for p in failai:
+        rodykle.setdefault(normalizuoti(p.stem)[0], []).append(p)
+    return rodykle
+
+
+def _seni_failai(rodykle, zodis, naujas):
+    """Kiti to paties žodžio paveikslėliai (kitas plėtinys ar raidžių dydis) – ImageIndex jais užgožtų naują."""
+    return [p for p in rodykle.get(normalizuoti(zodis)[0], []) if p.name != naujas]
+
+
+def _atideti(katalogas, kelias):
+    """Senas failas ne trinamas, o perkeliamas į .pakeisti/ (vardas + laiko žymė)."""
+    aplankas = katalogas / PAKEISTI
+    aplankas.mkdir(exist_ok=True)
+    shutil.move(str(kelias), aplankas / f"{kelias.stem}.{time.strftime('%Y%m%d-%H%M%S')}{kelias.suffix}")
+
+
+def ikelti(failai, katalogas):
+    """
+    failai – [(failo vardas, baitai)]; grąžina po vieną {"zodis", "failas", "busena", "klaida"}
+    kiekvienam. busena: "praleista" (jau yra), "nukopijuota" (tas pats turinys kitu vardu),
+    "issaugota", "pakeista" (žodis turėjo kitą paveikslėlį) arba "klaida".
+    """
+    katalogas = Path(katalogas)
+    katalogas.mkdir(parents=True, exist_ok=True)
+    darbai = []
+    for vardas, data in failai:
+        zodis = Path(vardas).stem
+        darbai.append((zodis, data, hashlib.sha256(data).hexdigest()))
+
+    with _lock:
+        m = _manifestas(katalogas)
+    zodziai = m["zodziai"]
+    pagal_turini = {v["sha256"]: v["failas"] for v in zodziai.values()}
+    rodykle = _pagal_zodi(katalogas)
+
+    def apdoroti(darbas):
+        zodis, data, h = darbas
+        buvo = zodziai.get(zodis)
+        if buvo and buvo["sha256"] == h and (katalogas / buvo["failas"]).exists():
+            return {"zodis": zodis, "failas": buvo["failas"], "busena": "praleista", "klaida": None}
+        try:
+            # tas pats failas jau įdėtas ranka (ne per manifestą) – tik užregistruojame
+            for p in rodykle.get(normalizuoti(zodis)[0], []):
+                if hashlib.sha256(p.read_bytes()).hexdigest() == h:
+                    return {"zodis": zodis, "failas": p.name, "busena": "praleista", "klaida": None,
+                            "_data": None, "_irasas": {"failas": p.name, "sha256": h, "dydis": None}}
+            jau = pagal_turini.get(h)
+            if jau and (katalogas / jau).exists():
+                paruosta = (katalogas / jau).read_bytes()
+                failas = zodis + Path(jau).suffix
+                dydis = zodziai.get(Path(jau).stem, {}).get("dydis")
+                busena = "nukopijuota"
+            else:
+                paruosta, ext, dydis = _paruosti(data)
+                failas = zodis + ext
+                dydis = list(dydis)
+                busena = "issaugota"
+        except (OSError, ValueError) as e:
+            return {"zodis": zodis, "failas": None, "busena": "klaida", "klaida": f"{type(e).__name__}: {e}"}
+        return {"zodis": zodis, "failas": failas, "busena": busena, "klaida": None,
+                "_data": paruosta, "_irasas": {"failas": failas, "sha256": h, "dydis": dydis}}
+
+    # vienodo vardo failai tame pačiame įkėlime: galioja paskutinis
+    unikalus = {}
+    for d in darbai:
+        unikalus[d[0]] = d
+    with ThreadPoolExecutor(max_workers=max(1, min(GIJOS, len(unikalus)))) as ex:
+        paruosti = dict(zip(unikalus, ex.map(apdoroti, unikalus.values())))
+
+    with _lock:
+        m = _manifestas(katalogas)  # kitos sesijos galėjo įrašyti savo
+        rodykle = _pagal_zodi(katalogas)
+        pakeista = False
+        for zodis, r in paruosti.items():
+            data = r.pop("_data", None)
+            irasas = r.pop("_irasas", None)
+            if irasas is None:
+                continue
+            if data is None:  # failas jau vietoje – tik manifeste
+                m["zodziai"][zodis] = dict(irasas, ikelta=time.strftime("%Y-%m-%dT%H:%M:%S"))
+                pakeista = True
+                continue
+            kelias = katalogas / r["failas"]
+            seni = _seni_failai(rodykle, zodis, r["failas"])
+            buvo = m["zodziai"].get(zodis)
+            if kelias.exists() and (buvo is None or buvo["sha256"] != irasas["sha256"]):
+                seni.append(kelias)
+            for s in seni:
+                _atideti(katalogas, s)
+            if seni:
+                r["busena"] = "pakeista"
+            _rasyti(kelias, data)
+            m["zodziai"][zodis] = dict(irasas, ikelta=time.strftime("%Y-%m-%dT%H:%M:%S"))
+            pakeista = True
+        if pakeista:
+            _irasyti_manifesta(katalogas, m)
+    return [paruosti[d[0]] for d in darbai]
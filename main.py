@@ -2,12 +2,11 @@
 import os
 import random
 import string
+import time
 import unicodedata
 from pathlib import Path
 
 from reportlab.lib.pagesizes import A4
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus import (
     Table, TableStyle, SimpleDocTemplate, Spacer, Paragraph, Image, Flowable, KeepTogether
 )
@@ -19,18 +18,13 @@ from reportlab.lib.styles import ParagraphStyle
 
 import re
 
+from assets import ImageIndex
+import resources as res
+
 # ---------- Nustatymai ----------
-FONTS_DIR = Path("fonts")
 IMAGES_DIR = Path("images")
 OUT_DIR = Path("out")
-FONT_NAME = "DejaVuSans"
-FONT_FILE = FONTS_DIR / "DejaVuSans.ttf"
-
-# Registruojame šriftą lietuviškoms raidėms
-if not FONT_FILE.exists():
-    print("⚠️  Dėmesio: nerastas fonts/DejaVuSans.ttf. Įkelk šriftą, kitaip LT raidės gali nerodytis.")
-else:
-    pdfmetrics.registerFont(TTFont(FONT_NAME, str(FONT_FILE)))
+# Šriftas registruojamas pirmą kartą prireikus (res.sriftas()), ne importuojant modulį
 
 # Bendri puslapio dydžiai
 puslapio_plotis, puslapio_aukstis = A4
@@ -49,21 +43,16 @@ def strip_diacritics(s: str) -> str:
         if unicodedata.category(c) != "Mn"
     )
 
+# Vienas bendras indeksas visiems generatoriams (katalogas skaitomas tik pasikeitus)
+vaizdu_indeksas = ImageIndex(IMAGES_DIR)
+
 def rasti_paveiksleli(zodis: str):
     """Ieško images/ kataloge failo pagal žodį:
        1) tiksliai su diakritikais (lowercase)
        2) be diakritikų (fallback)
+       3) failas, kurio vardas be diakritikų sutampa (pvz. „lape“ -> lapė.png)
     """
-    candidates = []
-    lower = zodis.lower()
-    ascii_name = strip_diacritics(lower)
-    for base in (lower, ascii_name):
-        for ext in (".png", ".jpg", ".jpeg"):
-            candidates.append(IMAGES_DIR / f"{base}{ext}")
-    for p in candidates:
-        if p.exists():
-            return str(p)
-    return None
+    return vaizdu_indeksas.rasti(zodis)
 
 # ---------- 1. Žodžių rašymo užduotis ----------
 def generuoti_zodziu_uzduoti(zodziai, failas="out/uzduotis-zodziai.pdf"):
@@ -73,7 +62,7 @@ def generuoti_zodziu_uzduoti(zodziai, failas="out/uzduotis-zodziai.pdf"):
         leftMargin=marge, rightMargin=marge, topMargin=40, bottomMargin=40
     )
     st = getSampleStyleSheet()
-    font = FONT_NAME if FONT_FILE.exists() else "Helvetica"
+    font = res.sriftas()
     st["Title"].fontName = font
     st["Normal"].fontName = font
 
@@ -172,7 +161,7 @@ def generuoti_pdf_tinkleli_lentele(zodziai, dydis=15, failas="out/uzduotis-paies
     OUT_DIR.mkdir(exist_ok=True)
     doc = SimpleDocTemplate(failas, pagesize=A4, leftMargin=marge, rightMargin=marge, topMargin=40, bottomMargin=40)
     st = getSampleStyleSheet()
-    font = FONT_NAME if FONT_FILE.exists() else "Helvetica"
+    font = res.sriftas()
     st["Title"].fontName = font
     st["Normal"].fontName = font
 
@@ -233,7 +222,7 @@ def generuoti_linksniu_pdf(zodziai, failas="out/uzduotis-linksniai.pdf"):
         leftMargin=marge, rightMargin=marge, topMargin=40, bottomMargin=40
     )
     st = getSampleStyleSheet()
-    font = FONT_NAME if FONT_FILE.exists() else "Helvetica"
+    font = res.sriftas()
     st["Title"].fontName = font
     st["Normal"].fontName = font
 
@@ -293,7 +282,7 @@ def generuoti_linksniu_pdf(zodziai, failas="out/uzduotis-linksniai.pdf"):
         leftMargin=marge, rightMargin=marge, topMargin=40, bottomMargin=40
     )
     st = getSampleStyleSheet()
-    font = FONT_NAME if FONT_FILE.exists() else "Helvetica"
+    font = res.sriftas()
     st["Title"].fontName = font
     st["Normal"].fontName = font
 
@@ -495,7 +484,7 @@ def kryziazodis_pdf(words, show_answers=False, size=13, failas="out/kryziazodis.
                             leftMargin=marge, rightMargin=marge,
                             topMargin=36, bottomMargin=36)
     st = getSampleStyleSheet()
-    font = FONT_NAME if FONT_FILE.exists() else "Helvetica"
+    font = res.sriftas()
     for k in ("Title", "Normal"):
         st[k].fontName = font
 
@@ -585,7 +574,7 @@ def generuoti_sakini_pagal_pavyzdi(
     )
 
     st = getSampleStyleSheet()
-    font = FONT_NAME if FONT_FILE.exists() else "Helvetica"
+    font = res.sriftas()
     st["Title"].fontName = font
     st["Normal"].fontName = font
 
@@ -681,7 +670,7 @@ def generuoti_gyvunai_ir_vietos(
         leftMargin=marge, rightMargin=marge, topMargin=36, bottomMargin=36
     )
     st = getSampleStyleSheet()
-    font = FONT_NAME if FONT_FILE.exists() else "Helvetica"
+    font = res.sriftas()
     st["Title"].fontName = font
     st["Normal"].fontName = font
 
@@ -727,9 +716,10 @@ def paleisti_programa():
     elif pasirinkimas == "3":
         generuoti_linksniu_pdf(zodziai)
     elif pasirinkimas == "4":
-        kryziazodis_pdf(zodziai, show_answers=False, size=13, failas="out/kryziazodis.pdf")
-    # atsakymų versija:
-        kryziazodis_pdf(zodziai, show_answers=True, size=13, failas="out/kryziazodis-atsakymai.pdf")
+        # abi versijos iš to paties maketo (atsakymai atitinka mokinio lapą)
+        from worksheet import kryziazodis_su_atsakymais_pdf
+        kryziazodis_su_atsakymais_pdf(zodziai, size=13, failas="out/kryziazodis.pdf",
+                                      failas_atsakymai="out/kryziazodis-atsakymai.pdf")
     elif pasirinkimas == "5":
         pavyzdys_sakinys = input("Įvesk pavyzdinį sakinį (pvz. „Kiškis yra pilkos spalvos“): ").strip()
         pavyzdzio_img_zodis = input("Kokio žodžio paveikslėlį naudoti pavyzdyje? (palik tuščią, jei nereikia): ").strip()
@@ -753,5 +743,29 @@ def paleisti_programa():
     else:
         print("❌ Netinkamas pasirinkimas.")
 
+# ---------- Paketinis generavimas ----------
+def paleisti_paketa(darbu_failas, workers=None):
+    """Sugeneruoja visus darbus iš failo (JSON / JSON Lines) per procesų telkinį."""
+    from batch import generate_batch, skaityti_darbus
+
+    darbai = skaityti_darbus(darbu_failas)
+    pradzia = time.perf_counter()
+    rezultatai = generate_batch(darbai, workers=workers)
+    for r in rezultatai:
+        zyme = "❌" if r["klaida"] else "✅"
+        print(f"{zyme} {r['tipas']:<12} {r['laikas']:6.2f} s  {r['failas'] or ''}  {r['klaida'] or ''}")
+    klaidos = sum(1 for r in rezultatai if r["klaida"])
+    print(f"Iš viso: {len(rezultatai)} darbų, klaidų: {klaidos}, laikas: {time.perf_counter() - pradzia:.2f} s")
+    return 1 if klaidos else 0
+
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Užduočių lapų generatorius")
+    parser.add_argument("--jobs", help="darbų failas (JSON arba JSON Lines) paketiniam generavimui")
+    parser.add_argument("--workers", type=int, default=None, help="procesų skaičius (numatytasis – visi branduoliai)")
+    args = parser.parse_args()
+
+    if args.jobs:
+        raise SystemExit(paleisti_paketa(args.jobs, workers=args.workers))
     paleisti_programa()
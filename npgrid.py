@@ -0,0 +1,112 @@
+# npgrid.py
+"""
+Nebūtinas NumPy pagrindas galvosūkių tinkleliams.
+
+Vietoj langelis-po-langelio tikrinimo Python cikluose, žodžio suderinamumas
+su VISOMIS pradžiomis ir kryptimis suskaičiuojamas vienu vektoriniu žingsniu
+(slenkantys langai / indeksų masyvai). Jei NumPy neįdiegtas, `prieinama()`
+grąžina False ir varikliai naudoja grynąjį Python kelią.
+
+NumPy importuojamas tik pirmą kartą iškvietus `prieinama()` (t. y. tik dideliam
+tinkleliui) – mažiems lapams ir programos paleidimui jo importo laikas nemokamas.
+"""
+import functools
+
+np = None
+sliding_window_view = None
+_bandyta = False
+
+
+def prieinama():
+    global np, sliding_window_view, _bandyta
+    if not _bandyta:
+        try:
+            import numpy
+            from numpy.lib.stride_tricks import sliding_window_view as langai
+        except ImportError:  # NumPy – nebūtinas
+            pass
+        else:
+            np, sliding_window_view = numpy, langai
+        _bandyta = True
+    return np is not None
+
+
+# ---------- Žodžių paieška ----------
+@functools.lru_cache(maxsize=256)
+def slotu_masyvai(n, kryptys, L):
+    """(starts, steps, idx) visiems ilgio L slotams; idx – (S, L) langelių indeksai plokščiame tinklelyje."""
+    from wordsearch import slot_index
+    vietos = slot_index(n, kryptys).vietos(L)
+    if not vietos:
+        z = np.zeros(0, dtype=np.intp)
+        return z, z, np.zeros((0, L), dtype=np.intp)
+    arr = np.asarray(vietos, dtype=np.intp)
+    starts, steps = arr[:, 0], arr[:, 1]
+    idx = starts[:, None] + steps[:, None] * np.arange(L, dtype=np.intp)
+    return starts, steps, idx
+
+
+def kodai(w):
+    """Žodis -> uint32 Unicode kodų masyvas."""
+    return np.fromiter((ord(ch) for ch in w), dtype=np.uint32, count=len(w))
+
+
+def paieskos_atitikmenys(plokscias, n, kryptys, w):
+    """
+    Vienu žingsniu visiems slotams: (starts, steps, persidengimai) tik tiems,
+    kur žodis telpa (kiekvienas langelis tuščias arba ta pati raidė, ne visas žodis jau yra).
+    """
+    L = len(w)
+    starts, steps, idx = slotu_masyvai(n, kryptys, L)
+    if not len(starts):
+        return starts, steps, starts
+    cells = plokscias[idx]
+    eq = cells == kodai(w)
+    ok = np.all(eq | (cells == 0), axis=1)
+    ov = eq.sum(axis=1)
+    ok &= ov < L
+    return starts[ok], steps[ok], ov[ok]
+
+
+# ---------- Kryžiažodis ----------
+def _kryptis(g, used, k):
+    """Horizontalios vietos tinklelyje g: (ok, susikirtimai) masyvai formos (n, n-L+1)."""
+    n = g.shape[0]
+    L = len(k)
+    P = np.pad(g, 1)
+    W = sliding_window_view(g, L, axis=1)
+    U = sliding_window_view(used, L, axis=1)
+    A = sliding_window_view(P[:-2, 1:-1], L, axis=1)  # eilutė aukščiau
+    B = sliding_window_view(P[2:, 1:-1], L, axis=1)   # eilutė žemiau
+    pries = P[1:-1, 0:n - L + 1]
+    po = P[1:-1, L + 1:n + 2]
+    uzpildyta = W != 0
+    ok = (pries == 0) & (po == 0)
+    ok &= np.all(~uzpildyta | ((W == k) & (U == 0)), axis=-1)
+    ok &= np.all(uzpildyta | ((A == 0) & (B == 0)), axis=-1)
+    cross = uzpildyta.sum(axis=-1)
+    ok &= cross < L
+    return ok, cross
+
+
+def kryziazodzio_vietos(grid, used_h, used_v, n, kodas):
+    """
+    Visos vietos, kur kryžiažodžio žodis telpa (tos pačios taisyklės kaip
+    CrosswordEngine.fits). grid/used_* – bytearray (0 = tuščia), kodas – bytes.
+    Grąžina [(susikirtimai, r, c, 'H'|'V')].
+    """
+    L = len(kodas)
+    if L > n:
+        return []
+    g = np.frombuffer(grid, dtype=np.uint8).reshape(n, n)
+    uh = np.frombuffer(used_h, dtype=np.uint8).reshape(n, n)
+    uv = np.frombuffer(used_v, dtype=np.uint8).reshape(n, n)
+    k = np.frombuffer(kodas, dtype=np.uint8)
+    out = []
+    ok, cross = _kryptis(g, uh, k)
+    for r, c in zip(*np.nonzero(ok)):
+        out.append((int(cross[r, c]), int(r), int(c), "H"))
+    ok, cross = _kryptis(g.T, uv.T, k)
+    for i, j in zip(*np.nonzero(ok)):
+        out.append((int(cross[i, j]), int(j), int(i), "V"))  # transponuota: (i, j) -> (r=j, c=i)
+    return out
@@ -0,0 +1,43 @@
+# procesai.py
+"""
+Procesų telkinys lygiagrečiai paieškai (crossword.geriausias_maketas, worksheet._lygiagreciai).
+
+Skriptuose kiekvienas kvietimas su workers > 1 kuria savo ProcessPoolExecutor. Programoje
+(app.py) lapai generuojami gijose, tad kiekvienas darbas kurtų dar po telkinį ir procesų
+būtų gijos × workers, be to, 'fork' iš daugiagijio proceso gali užstrigti. Todėl
+darbai.DarbuEile turi vieną bendrą 'spawn' telkinį ir darbo metu jį įdeda į kontekstą
+(naudoti): tada workers tik nurodo, į kiek užduočių darbas skaidomas, o procesų niekada
+nebūna daugiau nei bendrame telkinyje.
+"""
+import contextlib
+import contextvars
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+_telkinys = contextvars.ContextVar("procesu_telkinys", default=None)
+
+
+def bendras(procesu):
+    """Naujas `procesu` dydžio telkinys, saugus kurti iš daugiagijio proceso ('spawn')."""
+    return ProcessPoolExecutor(max_workers=procesu, mp_context=multiprocessing.get_context("spawn"))
+
+
+@contextlib.contextmanager
+def naudoti(ex):
+    """Bloko viduje (šioje gijoje) telkinys() grąžina `ex`, užuot kūręs naują."""
+    zetonas = _telkinys.set(ex)
+    try:
+        yield ex
+    finally:
+        _telkinys.reset(zetonas)
+
+
+@contextlib.contextmanager
+def telkinys(workers):
+    """Bendras telkinys, jei įdėtas naudoti(); kitaip – naujas su `workers` procesų (uždaromas išeinant)."""
+    ex = _telkinys.get()
+    if ex is not None:
+        yield ex
+        return
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        yield ex
@@ -0,0 +1,153 @@
+# resources.py
+"""
+Bendri dokumentų ištekliai: šriftas, pastraipų stiliai ir dažniausios TableStyle.
+
+Visi generatoriai naudoja tuos pačius objektus – jie sukuriami vieną kartą
+procese (šriftas ir stiliai – pirmą kartą prireikus), o ne kiekvienam lapui
+ar kiekvienai eilutei iš naujo. Bendrų objektų NEKEISKITE – jei reikia kitokio
+stiliaus, kurkite naują su parent=...
+
+TTF failo nagrinėjimas (glifų lentelės, pločiai) – brangiausia šrifto registravimo
+dalis, todėl išnagrinėtos lentelės saugomos disko talpykloje pagal šrifto failo
+sha256 ir reportlab versiją; kitą kartą jos tik įkeliamos (paprasti duomenys, ne pickle).
+"""
+import functools
+import hashlib
+import operator
+from pathlib import Path
+from weakref import WeakKeyDictionary
+
+import reportlab
+from reportlab.lib import colors
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTEncoding, TTFNameBytes, TTFont, TTFontFace
+from reportlab.platypus import TableStyle
+
+from cache import CACHE_DIR, DiskCache, i_baitus, is_baitu, raktas
+
+FONTS_DIR = Path("fonts")
+FONT_NAME = "DejaVuSans"
+FONT_FILE = FONTS_DIR / "DejaVuSans.ttf"
+
+SRIFTO_TALPYKLA_ENABLED = True
+_sriftu_talpykla = DiskCache(CACHE_DIR / "sriftai", max_dydis=20 * 1024 * 1024)
+
+
+@functools.lru_cache(maxsize=1)
+def sriftas() -> str:
+    """Užregistruoja lietuvišką šriftą (vieną kartą) ir grąžina jo vardą; nesant failo – Helvetica."""
+    if not FONT_FILE.exists():
+        print("⚠️  Dėmesio: nerastas fonts/DejaVuSans.ttf. Įkelk šriftą, kitaip LT raidės gali nerodytis.")
+        return "Helvetica"
+    pdfmetrics.registerFont(_ttfont(FONT_NAME, FONT_FILE))
+    return FONT_NAME
+
+
+def _ttfont(vardas, kelias):
+    """TTFont iš išnagrinėtų lentelių talpykloje; nėra ar netinka – TTF skaitomas iš naujo ir įdedamas."""
+    if not SRIFTO_TALPYKLA_ENABLED:
+        return TTFont(vardas, str(kelias))
+    ttf = Path(kelias).read_bytes()
+    r = raktas(hashlib.sha256(ttf).hexdigest(), vardas, reportlab.Version)
+    p = _sriftu_talpykla.gauti(r, ".marshal")
+    if p is not None:
+        try:
+            return _is_lenteliu(p.read_bytes(), ttf, kelias)
+        except Exception:  # sugadintas ar kitos reportlab versijos įrašas – skaitome TTF
+            pass
+    sr = TTFont(vardas, str(kelias))
+    try:
+        _sriftu_talpykla.ideti(r, _lenteles(sr), ".marshal")
+    except (OSError, ValueError, TypeError, AttributeError):
+        pass  # talpykla – tik pagreitis
+    return sr
+
+
+def _lenteles(sr):
+    """
+    TTFont būsena kaip paprasti duomenys: be failo baitų, WeakKeyDictionary, lambda ir
+    TTEncoding (jie atkuriami įkeliant); vardai (TTFNameBytes) – kaip bytes, jų laukai išvardijami.
+    """
+    sriftas = {k: v for k, v in vars(sr).items() if k not in ("face", "state", "encoding")}
+    veidas = {k: v for k, v in vars(sr.face).items() if k not in ("_ttf_data", "_pdfScale")}
+    vardai = [k for k, v in veidas.items() if isinstance(v, TTFNameBytes)]
+    veidas.update((k, bytes(veidas[k])) for k in vardai)
+    return i_baitus((sriftas, veidas, vardai))
+
+
+def _is_lenteliu(data, ttf, kelias):
+    sriftas, veidas, vardai = is_baitu(data)
+    veidas.update((k, TTFNameBytes(veidas[k])) for k in vardai)
+    face = TTFontFace.__new__(TTFontFace)
+    face.__dict__.update(veidas)
+    face.filename = str(kelias)
+    face._ttf_data = ttf
+    # kaip TTFontFile.extractInfo: šrifto vienetai -> 1/1000 em
+    face._pdfScale = _tas_pats if face.unitsPerEm == 1000 else functools.partial(operator.mul,
+                                                                                  1000 / face.unitsPerEm)
+    sr = TTFont.__new__(TTFont)
+    sr.__dict__.update(sriftas)
+    sr.encoding = TTEncoding()
+    sr.face = face
+    sr.state = WeakKeyDictionary()
+    return sr
+
+
+def _tas_pats(x):
+    return x
+
+
+@functools.lru_cache(maxsize=1)
+def stiliai():
+    """getSampleStyleSheet() su mūsų šriftu ir papildomu stiliumi SampleSentence."""
+    font = sriftas()
+    st = getSampleStyleSheet()
+    st["Title"].fontName = font
+    st["Normal"].fontName = font
+    st.add(ParagraphStyle("SampleSentence", parent=st["Normal"], fontName=font,
+                          fontSize=22, leading=26, spaceAfter=0))
+    return st
+
+
+# ---------- TableStyle be šrifto (sukuriamos importuojant) ----------
+_BE_PARASCIU = [
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+]
+
+# [paveikslėlis] [žodis] – žodžių rašymo lapas, pavyzdinis sakinys
+ZODZIO_EILUTE = TableStyle([('VALIGN', (0, 0), (-1, -1), 'MIDDLE')] + _BE_PARASCIU + [
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+])
+
+# linksnių lentelės pirmas langelis [paveikslėlis] [žodis]
+LINKSNIO_LANGELIS = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 2),
+])
+
+# lentelė be jokių paraščių (paveikslėlių eilė)
+BE_TARPU = TableStyle(_BE_PARASCIU + [
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+])
+
+# kryžiažodis: [tinklelis] [užuominos]
+MAKETAS = TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP')] + _BE_PARASCIU)
+
+# variantų atsakymai: maži tinkleliai po kelis eilėje
+ATSAKYMAI = TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP'), ('ALIGN', (0, 0), (-1, -1), 'CENTER')]
+                       + _BE_PARASCIU + [('BOTTOMPADDING', (0, 0), (-1, -1), 14)])
+
+
+# ---------- TableStyle su šriftu (sukuriamos pirmą kartą prireikus) ----------
+@functools.lru_cache(maxsize=1)
+def uzuominu_stilius():
+    return TableStyle([
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (-1, -1), sriftas()),
+    ])
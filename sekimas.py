@@ -0,0 +1,150 @@
+# sekimas.py
+"""
+Nebūtinas generatorių sekimas: kiek laiko užtruko kiekvienas etapas (paveikslėlių
+paieška, miniatiūros, galvosūkio paieška, turinio kūrimas, maketavimas) ir keli
+skaitikliai (rasti paveikslėliai, talpyklos pataikymai, paieškos mazgai, puslapiai).
+
+    with sekimas.sekti(jsonl="out/sekimas.jsonl") as s:
+        pdf = ws.generuoti_zodziu_uzduoti(zodziai, failas=None)
+    print(s.paskutinis.kaip_zodynas())
+
+Kiekvienas generatoriaus kvietimas bloke – vienas Irasas (ir viena JSON eilutė).
+Etapų laikas – be vidinių etapų laiko (pvz. paveikslėlių paieška, vykdoma
+maketuojant, į maketavimą neįskaičiuojama), todėl etapų suma – visas laikas.
+Be `sekti()` bloko etapas() ir skaiciuoti() nieko nedaro.
+"""
+import contextlib
+import contextvars
+import functools
+import json
+import threading
+import time
+from pathlib import Path
+
+_sekimas = contextvars.ContextVar("sekimas", default=None)
+_irasas = contextvars.ContextVar("sekimo_irasas", default=None)
+_NIEKO = contextlib.nullcontext()
+
+# Laikas, nepriskirtas jokiam etapui (argumentai, PDF įrašymas ir pan.)
+KITA = "kita"
+
+
+class Irasas:
+    """Vieno generatoriaus kvietimo etapai {vardas: [sekundės, kartai]} ir skaitikliai {vardas: kiekis}."""
+
+    def __init__(self, generatorius):
+        self.generatorius = generatorius
+        self.etapai = {}
+        self.skaitikliai = {}
+        self.viso = 0.0
+        self._stekas = [0.0]  # atvirų etapų vidinių etapų laikas; [0] – paties įrašo
+
+    @contextlib.contextmanager
+    def etapas(self, vardas):
+        self._stekas.append(0.0)
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            dt = time.perf_counter() - t
+            vidus = self._stekas.pop()
+            self._stekas[-1] += dt
+            e = self.etapai.setdefault(vardas, [0.0, 0])
+            e[0] += dt - vidus
+            e[1] += 1
+
+    def skaiciuoti(self, vardas, kiek=1):
+        self.skaitikliai[vardas] = self.skaitikliai.get(vardas, 0) + kiek
+
+    def kaip_zodynas(self):
+        etapai = {k: {"s": round(s, 6), "kartai": n} for k, (s, n) in self.etapai.items()}
+        etapai[KITA] = {"s": round(max(0.0, self.viso - self._stekas[0]), 6), "kartai": 1}
+        return {
+            "generatorius": self.generatorius,
+            "laikas_s": round(self.viso, 6),
+            "etapai": etapai,
+            "skaitikliai": dict(self.skaitikliai),
+        }
+
+
+class Sekimas:
+    """Visi `sekti()` bloke įvykę generatorių kvietimai; jsonl – kelias ar failo objektas eilutėms."""
+
+    def __init__(self, jsonl=None):
+        self.irasai = []
+        self.jsonl = jsonl
+        self._lock = threading.Lock()
+
+    @property
+    def paskutinis(self):
+        return self.irasai[-1] if self.irasai else None
+
+    def _uzbaigti(self, ir):
+        with self._lock:
+            self.irasai.append(ir)
+            if self.jsonl is None:
+                return
+            eilute = dict(ir.kaip_zodynas(), data=time.strftime("%Y-%m-%dT%H:%M:%S"))
+            eilute = json.dumps(eilute, ensure_ascii=False) + "\n"
+            if hasattr(self.jsonl, "write"):
+                self.jsonl.write(eilute)
+            else:
+                Path(self.jsonl).parent.mkdir(parents=True, exist_ok=True)
+                with open(self.jsonl, "a", encoding="utf-8") as f:
+                    f.write(eilute)
+
+
+@contextlib.contextmanager
+def sekti(jsonl=None):
+    """Įjungia sekimą šiam blokui (šioje gijoje); grąžina Sekimas su visais įrašais."""
+    s = Sekimas(jsonl)
+    zenklas = _sekimas.set(s)
+    try:
+        yield s
+    finally:
+        _sekimas.reset(zenklas)
+
+
+def aktyvus():
+    return _irasas.get() is not None
+
+
+@contextlib.contextmanager
+def _irasyti(s, generatorius):
+    ir = Irasas(generatorius)
+    zenklas = _irasas.set(ir)
+    t = time.perf_counter()
+    try:
+        yield ir
+    finally:
+        ir.viso = time.perf_counter() - t
+        _irasas.reset(zenklas)
+        s._uzbaigti(ir)
+
+
+def irasas(generatorius):
+    """Naujas įrašas generatoriaus kvietimui; įdėtiniai kvietimai skaičiuojami išoriniame įraše."""
+    s = _sekimas.get()
+    if s is None or _irasas.get() is not None:
+        return _NIEKO
+    return _irasyti(s, generatorius)
+
+
+def sekamas(fn):
+    """Dekoratorius: kiekvienas kvietimas `sekti()` bloke – atskiras įrašas."""
+    @functools.wraps(fn)
+    def apvalkalas(*args, **kwargs):
+        with irasas(fn.__name__):
+            return fn(*args, **kwargs)
+    return apvalkalas
+
+
+def etapas(vardas):
+    ir = _irasas.get()
+    return _NIEKO if ir is None else ir.etapas(vardas)
+
+
+def skaiciuoti(vardas, kiek=1):
+    ir = _irasas.get()
+    if ir is not None:
+        ir.skaiciuoti(vardas, kiek)
@@ -0,0 +1,255 @@
+# wordsearch.py
+"""
+Žodžių paieškos tinklelio generavimas.
+
+Visos galimos žodžio vietos (pradžia + kryptis) kiekvienam ilgiui suskaičiuojamos
+vieną kartą. Žodžiai dedami nuo ilgiausio: pirmiausia bandomos vietos, kur jie
+persidengia su jau esančiomis raidėmis, po to – atsitiktinės laisvos vietos;
+nepavykus grįžtama atgal (backtracking). Netilpę žodžiai grąžinami atskirai,
+likę langeliai užpildomi pagal lietuvių kalbos raidžių dažnius.
+"""
+import functools
+import random
+
+import npgrid
+import sekimas
+
+# (dr, dc): H, V, įstrižai žemyn ir aukštyn + visos atbulinės
+KRYPTYS_HV = ((0, 1), (1, 0))
+KRYPTYS_VISOS = ((0, 1), (1, 0), (1, 1), (-1, 1), (0, -1), (-1, 0), (-1, -1), (1, -1))
+
+# Apytiksliai lietuvių kalbos raidžių dažniai (%)
+LT_DAZNIAI = {
+    "A": 11.9, "Ą": 0.6, "B": 1.3, "C": 0.4, "Č": 0.4, "D": 2.6, "E": 5.8, "Ę": 0.2,
+    "Ė": 1.7, "F": 0.1, "G": 1.9, "H": 0.1, "I": 14.4, "Į": 0.6, "Y": 1.4, "J": 2.4,
+    "K": 4.7, "L": 3.1, "M": 3.5, "N": 5.1, "O": 6.1, "P": 2.7, "R": 5.4, "S": 7.9,
+    "Š": 1.0, "T": 6.0, "U": 4.4, "Ų": 1.1, "Ū": 0.5, "V": 2.4, "Z": 0.2, "Ž": 0.8,
+}
+_RAIDES = list(LT_DAZNIAI)
+_SVORIAI = list(LT_DAZNIAI.values())
+
+# Nuo kokio tinklelio dydžio automatiškai naudojamas NumPy pagrindas (jei įdiegtas)
+NUMPY_NUO = 40
+
+
+class _Stop(Exception):
+    pass
+
+
+class SlotIndex:
+    """Visos leistinos vietos (start, step) kiekvienam žodžio ilgiui – skaičiuojamos vieną kartą."""
+
+    def __init__(self, n, kryptys=KRYPTYS_VISOS):
+        self.n = n
+        self.kryptys = tuple(kryptys)
+        self._pagal_ilgi = {}
+        self._aibes = {}
+
+    def vietos(self, L):
+        v = self._pagal_ilgi.get(L)
+        if v is None:
+            n = self.n
+            v = []
+            d = L - 1
+            for dr, dc in self.kryptys:
+                step = dr * n + dc
+                eilutes = range(max(0, -d * dr), min(n, n - d * dr))
+                stulpeliai = range(max(0, -d * dc), min(n, n - d * dc))
+                v.extend((r * n + c, step) for r in eilutes for c in stulpeliai)
+            self._pagal_ilgi[L] = v
+            self._aibes[L] = set(v)
+        return v
+
+    def ar_leistina(self, L, start, step):
+        self.vietos(L)
+        return (start, step) in self._aibes[L]
+
+
+@functools.lru_cache(maxsize=32)
+def slot_index(n, kryptys=KRYPTYS_VISOS):
+    """Bendras SlotIndex tam pačiam dydžiui ir kryptims (kartojant generavimą nieko neperskaičiuojama)."""
+    return SlotIndex(n, kryptys)
+
+
+class WordSearchEngine:
+    def __init__(self, n, kryptys=KRYPTYS_VISOS, rng=None, backend=None):
+        self.n = n
+        self.rng = rng or random.Random()
+        # kryptys gali ateiti ir kaip sąrašų sąrašas (JSON) – slot_index raktui reikia tuple
+        self.slots = slot_index(n, tuple(tuple(k) for k in kryptys))
+        # backend: "python", "numpy" arba None (automatiškai pagal dydį ir ar yra NumPy)
+        if backend is None:
+            backend = "numpy" if n >= NUMPY_NUO and npgrid.prieinama() else "python"
+        if backend == "numpy" and not npgrid.prieinama():
+            raise RuntimeError("NumPy neįdiegtas")
+        self.backend = backend
+        self.kodai = npgrid.np.zeros(n * n, dtype=npgrid.np.uint32) if backend == "numpy" else None
+        self.langeliai = [""] * (n * n)
+        self.pozicijos = {}  # raidė -> {langelių indeksai}
+        self.vietos = []     # (žodis, r, c, dr, dc)
+        self.nodes = 0
+
+    def _tinka(self, w, start, step):
+        """Persidengimų skaičius arba -1, jei žodis čia netelpa."""
+        g = self.langeliai
+        s = 0
+        idx = start
+        for ch in w:
+            cell = g[idx]
+            if cell:
+                if cell != ch:
+                    return -1
+                s += 1
+            idx += step
+        return -1 if s == len(w) else s
+
+    def kandidatai(self, w, atsitiktiniu=24):
+        """Pirma vietos su persidengimais (daugiausia – pirmos), po to keli atsitiktiniai laisvi slotai."""
+        if self.backend == "numpy":
+            yield from self._kandidatai_np(w, atsitiktiniu)
+            return
+        L = len(w)
+        n = self.n
+        seen = set()
+        su_persidengimu = []
+        for i, ch in enumerate(w):
+            for p in self.pozicijos.get(ch, ()):
+                for dr, dc in self.slots.kryptys:
+                    step = dr * n + dc
+                    start = p - i * step
+                    key = (start, step)
+                    if key in seen or not self.slots.ar_leistina(L, start, step):
+                        continue
+                    seen.add(key)
+                    s = self._tinka(w, start, step)
+                    if s > 0:
+                        su_persidengimu.append((-s, self.rng.random(), start, step))
+        su_persidengimu.sort()
+        for _, _, start, step in su_persidengimu:
+            yield start, step
+
+        # laisvi slotai generuojami tik tada, kai jų prireikia (dažniausiai – ne)
+        visi = self.slots.vietos(L)
+        bandymai = 0
+        laisvi = 0
+        while laisvi < atsitiktiniu and bandymai < len(visi):
+            start, step = visi[self.rng.randrange(len(visi))]
+            bandymai += 1
+            if (start, step) not in seen and self._tinka(w, start, step) == 0:
+                seen.add((start, step))
+                laisvi += 1
+                yield start, step
+
+    def _kandidatai_np(self, w, atsitiktiniu):
+        """Tas pats, tik visi slotai patikrinami vienu vektoriniu žingsniu."""
+        starts, steps, ov = npgrid.paieskos_atitikmenys(self.kodai, self.n, self.slots.kryptys, w)
+        su = [(-int(o), self.rng.random(), int(s), int(st))
+              for s, st, o in zip(starts[ov > 0], steps[ov > 0], ov[ov > 0])]
+        su.sort()
+        for _, _, start, step in su:
+            yield start, step
+        laisvi = npgrid.np.nonzero(ov == 0)[0]
+        for i in self.rng.sample(range(len(laisvi)), min(atsitiktiniu, len(laisvi))):
+            j = laisvi[i]
+            yield int(starts[j]), int(steps[j])
+
+    def place(self, w, start, step):
+        naujai = []
+        idx = start
+        for ch in w:
+            if not self.langeliai[idx]:
+                self.langeliai[idx] = ch
+                self.pozicijos.setdefault(ch, set()).add(idx)
+                naujai.append(idx)
+                if self.kodai is not None:
+                    self.kodai[idx] = ord(ch)
+            idx += step
+        r, c = divmod(start, self.n)
+        dr, dc = self._kryptis(step)
+        self.vietos.append((w, r, c, dr, dc))
+        return naujai
+
+    def unplace(self, naujai):
+        for idx in naujai:
+            self.pozicijos[self.langeliai[idx]].discard(idx)
+            self.langeliai[idx] = ""
+            if self.kodai is not None:
+                self.kodai[idx] = 0
+        self.vietos.pop()
+
+    def _kryptis(self, step):
+        n = self.n
+        for dr, dc in self.slots.kryptys:
+            if dr * n + dc == step:
+                return dr, dc
+        raise ValueError(step)
+
+    def search(self, zodziai, max_nodes=20000):
+        """Sudeda kuo daugiau žodžių; grąžina geriausią rastą vietų sąrašą."""
+        zodziai = sorted(zodziai, key=len, reverse=True)
+        total = len(zodziai)
+        best = {"vietos": [], "kiek": -1}
+
+        def rec(k):
+            self.nodes += 1
+            if self.nodes > max_nodes:
+                raise _Stop
+            if len(self.vietos) > best["kiek"]:
+                best["kiek"] = len(self.vietos)
+                best["vietos"] = list(self.vietos)
+            if len(self.vietos) == total:
+                return True
+            if k == total or len(self.vietos) + (total - k) <= best["kiek"]:
+                return False
+            w = zodziai[k]
+            if len(w) <= self.n:
+                for start, step in self.kandidatai(w):
+                    naujai = self.place(w, start, step)
+                    if rec(k + 1):
+                        return True
+                    self.unplace(naujai)
+            return rec(k + 1)  # šio žodžio nepavyko sudėti
+
+        try:
+            rec(0)
+        except _Stop:
+            pass
+        return best["vietos"]
+
+
+def _svarus(zodis):
+    """Tinklelyje – tik raidės (be tarpų ir brūkšnelių), didžiosiomis."""
+    return "".join(ch for ch in zodis.upper() if ch.isalpha())
+
+
+def sudelioti_paieska(zodziai, dydis=15, kryptys=KRYPTYS_VISOS, rng=None, max_nodes=20000, backend=None):
+    """
+    Sukuria žodžių paieškos tinklelį.
+    Grąžina (tinklelis, vietos, nepavyko):
+      tinklelis – dydis×dydis sąrašas iš vienos raidės eilučių,
+      vietos    – [(ŽODIS, r, c, dr, dc)],
+      nepavyko  – žodžiai (kaip įvesti), kurių nepavyko sudėti.
+    """
+    rng = rng or random.Random()
+    svarus = {}
+    for z in zodziai:
+        s = _svarus(z)
+        if s:
+            svarus.setdefault(s, z)
+    engine = WordSearchEngine(dydis, kryptys=kryptys, rng=rng, backend=backend)
+    vietos = engine.search(list(svarus), max_nodes=max_nodes)
+    sekimas.skaiciuoti("mazgai", engine.nodes)
+
+    g = [""] * (dydis * dydis)
+    for w, r, c, dr, dc in vietos:
+        for i, ch in enumerate(w):
+            g[(r + i * dr) * dydis + (c + i * dc)] = ch
+    tuscios = [i for i, ch in enumerate(g) if not ch]
+    for i, ch in zip(tuscios, rng.choices(_RAIDES, weights=_SVORIAI, k=len(tuscios))):
+        g[i] = ch
+
+    sudeti = {w for w, *_ in vietos}
+    nepavyko = [z for s, z in svarus.items() if s not in sudeti]
+    nepavyko += [z for z in zodziai if not _svarus(z)]
+    tinklelis = [g[r * dydis:(r + 1) * dydis] for r in range(dydis)]
+    return tinklelis, vietos, nepavyko
@@ -1,36 +1,39 @@
 # main.py
+import functools
+import inspect
+import io
+import itertools
+import json
 import os
 import random
-import string
 import unicodedata
 from pathlib import Path
 
 from reportlab.lib.pagesizes import A4
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus import (
-    Table, TableStyle, SimpleDocTemplate, Spacer, Paragraph, Image, Flowable, KeepTogether
+    Table, TableStyle, SimpleDocTemplate, Spacer, Paragraph, Flowable, KeepTogether, PageBreak,
+    BaseDocTemplate, Frame, NextPageTemplate, PageTemplate
 )
 from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfgen import canvas
 
-from reportlab.lib.styles import ParagraphStyle
-
 import re
 
+from assets import ImageIndex, failo_hash, ideti_vaizda, miniatiura
+from cache import CACHE_DIR, DiskCache, raktas
+from crossword import geriausias_maketas, tinklelis
+import procesai
+import resources as res
+import sekimas
+from resources import FONT_FILE
+from wordsearch import KRYPTYS_VISOS, sudelioti_paieska
+
 # ---------- Nustatymai ----------
-FONTS_DIR = Path("fonts")
 IMAGES_DIR = Path("images")
 OUT_DIR = Path("out")
-FONT_NAME = "DejaVuSans"
-FONT_FILE = FONTS_DIR / "DejaVuSans.ttf"
-
-# Registruojame šriftą lietuviškoms raidėms
-if not FONT_FILE.exists():
-    print("⚠️  Dėmesio: nerastas fonts/DejaVuSans.ttf. Įkelk šriftą, kitaip LT raidės gali nerodytis.")
-else:
-    pdfmetrics.registerFont(TTFont(FONT_NAME, str(FONT_FILE)))
+# Šriftas, stiliai ir dažnos TableStyle – resources.py (kuriami vieną kartą procese)
 
 # Bendri puslapio dydžiai
 puslapio_plotis, puslapio_aukstis = A4
@@ -49,96 +52,340 @@ def strip_diacritics(s: str) -> str:
         if unicodedata.category(c) != "Mn"
     )
 
+# Vienas bendras indeksas visiems generatoriams (katalogas skaitomas tik pasikeitus)
+vaizdu_indeksas = ImageIndex(IMAGES_DIR)
+
 def rasti_paveiksleli(zodis: str):
     """Ieško images/ kataloge failo pagal žodį:
        1) tiksliai su diakritikais (lowercase)
        2) be diakritikų (fallback)
+       3) failas, kurio vardas be diakritikų sutampa (pvz. „lape“ -> lapė.png)
     """
-    candidates = []
-    lower = zodis.lower()
-    ascii_name = strip_diacritics(lower)
-    for base in (lower, ascii_name):
-        for ext in (".png", ".jpg", ".jpeg"):
-            candidates.append(IMAGES_DIR / f"{base}{ext}")
-    for p in candidates:
-        if p.exists():
-            return str(p)
-    return None
+    with sekimas.etapas("paveiksleliu_paieska"):
+        kelias = vaizdu_indeksas.rasti(zodis)
+    sekimas.skaiciuoti("paveiksleliai_rasti" if kelias else "paveiksleliai_nerasti")
+    return kelias
 
-# ---------- 1. Žodžių rašymo užduotis ----------
-def generuoti_zodziu_uzduoti(zodziai, failas="out/uzduotis-zodziai.pdf"):
-    OUT_DIR.mkdir(exist_ok=True)
-    doc = SimpleDocTemplate(
-        failas, pagesize=A4,
-        leftMargin=marge, rightMargin=marge, topMargin=40, bottomMargin=40
-    )
-    st = getSampleStyleSheet()
-    font = FONT_NAME if FONT_FILE.exists() else "Helvetica"
-    st["Title"].fontName = font
-    st["Normal"].fontName = font
-
-    # Naujas stilius didesniam šriftui
-    word_style = ParagraphStyle(
-        "WordStyle",
-        parent=st["Normal"],
-        fontName=font,
-        fontSize=80,
-        leading=22
-    )
+# Jau įdėta to paties paveikslėlio miniatiūra naudojama ir šiek tiek didesnei ikonai (iki 1/0.9)
+IKONOS_TOLERANCIJA = 0.9
 
-    story = [Paragraph("Parašyk žodžius:", st["Title"]), Spacer(1, 12)]
+def _dokumento_ikona(c, kelias, dydis):
+    """
+    Miniatiūra piešimui drobėje `c`. reportlab tą patį kelią visame PDF įdeda vienu
+    XObject, tad čia tik užtikrinama, kad tas pats šaltinis dokumente virstų tuo pačiu
+    keliu – net jei skirtingose lapo dalyse ikonos šiek tiek skirtingo dydžio.
+    """
+    ikonos = getattr(c, "_ikonos", None)
+    if ikonos is None:
+        ikonos = c._ikonos = {}
+    buvusi = ikonos.get(kelias)
+    if buvusi and buvusi[0] >= dydis * IKONOS_TOLERANCIJA:
+        sekimas.skaiciuoti("ikonos_dokumente")
+        return buvusi[1]
+    p = getattr(c, "_profilis", None) or _profilis(None)
+    with sekimas.etapas("miniatiuros"):
+        mini = miniatiura(kelias, dydis, dydis, dpi=p["dpi"], kokybe=p["jpeg"])
+    if not buvusi or dydis > buvusi[0]:
+        ikonos[kelias] = (dydis, mini)
+    return mini
+
+def _piesti_ikona(c, kelias, x, y, dydis):
+    mini = _dokumento_ikona(c, kelias, dydis)
+    with sekimas.etapas("paveiksleliu_idejimas"):
+        ideti_vaizda(c, mini)  # paruoštas srautas – drawImage failo nebeskaito ir nesuspaudžia
+        c.drawImage(mini, x, y, dydis, dydis, mask="auto")
+
+def _paveikslelis(zodis: str, dydis):
+    """Kvadratinis žodžio paveikslėlis (sumažinta kopija iš talpyklos) arba tuščias tarpas."""
+    kelias = rasti_paveiksleli(zodis) if zodis else None
+    if not kelias:
+        return Spacer(dydis, dydis)
+    return Ikona(kelias, dydis)
+
+def _irasyti(buf, failas):
+    """Grąžina sugeneruoto PDF baitus; jei nurodytas `failas` (kelias ar failo objektas) – ir įrašo."""
+    data = buf.getvalue()
+    if failas is None:
+        return data
+    if hasattr(failas, "write"):
+        failas.write(data)
+    else:
+        Path(failas).parent.mkdir(parents=True, exist_ok=True)
+        Path(failas).write_bytes(data)
+        print(f"✅ PDF sukurtas: {failas}")
+    return data
+
+def _sekla(seed):
+    """
+    Sėkla kaip sveikasis skaičius: nurodytas int, ištrauktas iš random.Random
+    arba (kai None) naujas atsitiktinis. Šį skaičių įrašome į PDF, kad lapą būtų
+    galima atkurti.
+    """
+    if isinstance(seed, random.Random):
+        return seed.randrange(2**31)
+    if seed is None:
+        return random.SystemRandom().randrange(2**31)
+    return int(seed)
+
+# ---------- Kokybės profiliai ----------
+# dpi – miniatiūrų raiška, jpeg – jų JPEG kokybė, suspaudimas – puslapių turinio Flate
+# (pageCompression), invariant – 1: be kūrimo datos ir atsitiktinio dokumento ID.
+# Šriftas visuose profiliuose įdedamas poaibiu – reportlab TTF kitaip neįdeda.
+PROFILIAI = {
+    "juodrastis": {"dpi": 96, "jpeg": 60, "suspaudimas": 1, "invariant": 1},     # peržiūrai ekrane
+    "spausdinimas": {"dpi": 300, "jpeg": 85, "suspaudimas": 1, "invariant": 1},  # klasės spausdintuvui
+    "archyvas": {"dpi": 600, "jpeg": 95, "suspaudimas": 1, "invariant": 0},      # su kūrimo data ir ID
+}
+NUMATYTAS_PROFILIS = "spausdinimas"
+
+def _profilis(vardas):
+    try:
+        return PROFILIAI[vardas or NUMATYTAS_PROFILIS]
+    except KeyError:
+        raise ValueError(f"Nežinomas kokybės profilis: {vardas!r} (galimi: {', '.join(PROFILIAI)})") from None
+
+def _pdf_meta(seed=None, profilis=None):
+    """
+    Bendri SimpleDocTemplate parametrai iš profilio: invariant=1 – tie patys duomenys ->
+    tie patys baitai; puslapių suspaudimas; sėkla – į raktinius žodžius.
+    """
+    p = _profilis(profilis)
+    meta = {"invariant": p["invariant"], "pageCompression": p["suspaudimas"]}
+    if seed is not None:
+        meta["keywords"] = [f"seed={seed}"]
+    return meta
+
+# ---------- Ilgi žodžių sąrašai ----------
+def skaityti_zodzius(kelias):
+    """Žodžiai iš tekstinio failo (po vieną eilutėje arba atskirti kableliais); failas skaitomas po eilutę."""
+    with open(kelias, encoding="utf-8-sig") as f:
+        for eilute in f:
+            for z in eilute.split(","):
+                z = z.strip()
+                if z:
+                    yield z
+
+def _turinys(story_fn, *args):
+    """
+    story_fn(*args) kaip sekimo etapas „turinys“; generatorius (ilgiems žodžių
+    sąrašams iš failo) čia pat sudedamas į sąrašą – doc.build() reikia sąrašo.
+    """
+    with sekimas.etapas("turinys"):
+        story = story_fn(*args)
+        return story if isinstance(story, list) else list(story)
+
+def _drobe(profilis):
+    """Canvas kūrėjas doc.build()'ui: profilis lieka drobėje, kad ikonos būtų jo raiškos."""
+    p = _profilis(profilis)
+
+    def sukurti(*args, **kwargs):
+        c = canvas.Canvas(*args, **kwargs)
+        c._profilis = p
+        return c
+    return sukurti
+
+def _maketuoti(doc, story, profilis=None):
+    with sekimas.etapas("maketavimas"):
+        doc.build(story, canvasmaker=_drobe(profilis))
+    sekimas.skaiciuoti("puslapiai", doc.page)
+
+# ---------- Sugeneruotų PDF talpykla ----------
+# Tie patys žodžiai + parinktys + paveikslėliai + šriftas -> tas pats PDF, todėl
+# pakartotinai generuojant doc.build() visai nekviečiamas.
+PDF_CACHE_ENABLED = True
+_pdf_cache = DiskCache(CACHE_DIR / "pdf", max_dydis=300 * 1024 * 1024)
+pdf_cache_stats = {"hit": 0, "miss": 0, "skip": 0}
+
+# Moduliai, nuo kurių priklauso lapo išvaizda – pakeitus kodą seni įrašai nebetinka
+_KODO_FAILAI = ("worksheet.py", "resources.py", "assets.py", "crossword.py", "wordsearch.py", "npgrid.py")
+
+@functools.lru_cache(maxsize=1)
+def _kodo_versija():
+    base = Path(__file__).resolve().parent
+    dalys = []
+    for f in _KODO_FAILAI:
+        try:
+            dalys.append(failo_hash(base / f))
+        except OSError:
+            dalys.append("-")
+    return raktas(*dalys)
+
+def _tekstai(x):
+    """Visos eilutės (str) argumentuose – rekursiškai per sąrašus ir žodynus."""
+    if isinstance(x, str):
+        yield x
+    elif isinstance(x, dict):
+        for k, v in x.items():
+            yield from _tekstai(k)
+            yield from _tekstai(v)
+    elif isinstance(x, (list, tuple, set, frozenset)):
+        for v in x:
+            yield from _tekstai(v)
+
+def _paveiksleliu_hashai(argumentai):
+    """(žodis, failo hash) kiekvienam argumentuose minimam paveikslėliui."""
+    out = set()
+    for t in _tekstai(argumentai):
+        kelias = vaizdu_indeksas.rasti(t) if t else None  # ne rasti_paveiksleli – į sekimo skaitiklius nepatenka
+        if not kelias and t and os.path.isfile(t):
+            kelias = t
+        if kelias:
+            try:
+                out.add((t, failo_hash(kelias)))
+            except OSError:
+                pass
+    return sorted(out)
+
+def _pdf_raktas(vardas, argumentai):
+    """Raktas iš generatoriaus vardo, argumentų, paveikslėlių ir šrifto; None – netalpinama."""
+    try:
+        args_json = json.dumps(argumentai, sort_keys=True, ensure_ascii=False)
+    except TypeError:
+        return None  # pvz. jau paruoštas maketas – tokių argumentų patikimai nesuhešuosime
+    sriftas = failo_hash(FONT_FILE) if FONT_FILE.exists() else "-"
+    return raktas(vardas, args_json, json.dumps(_paveiksleliu_hashai(argumentai), ensure_ascii=False),
+                  sriftas, _kodo_versija())
+
+def talpinamas(atsitiktinis=False):
+    """
+    Dekoratorius PDF generatoriui: rezultatas (baitai) saugomas disko talpykloje.
+    atsitiktinis=True – lapas priklauso nuo atsitiktinumo, todėl talpinamas tik
+    tada, kai nurodytas `seed` (kitaip kiekvienas paspaudimas turi duoti naują lapą).
+    """
+    def dekoruoti(fn):
+        parasas = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def apvalkalas(*args, **kwargs):
+            with sekimas.irasas(fn.__name__):
+                data = _generuoti(*args, **kwargs)
+                sekimas.skaiciuoti("pdf_baitai", len(data))
+                return data
+
+        def _generuoti(*args, **kwargs):
+            b = parasas.bind(*args, **kwargs)
+            b.apply_defaults()
+            argumentai = dict(b.arguments)
+            failas = argumentai.pop("failas", None)
+            r = None
+            with sekimas.etapas("pdf_talpykla"):
+                if PDF_CACHE_ENABLED and not (atsitiktinis and argumentai.get("seed") is None):
+                    r = _pdf_raktas(fn.__name__, argumentai)
+                p = _pdf_cache.gauti(r, ".pdf") if r is not None else None
+                data = None
+                if p is not None:
+                    try:
+                        data = p.read_bytes()
+                    except OSError:  # įrašą ką tik ištrynė kitas procesas
+                        pass
+            if r is None:
+                pdf_cache_stats["skip"] += 1
+                sekimas.skaiciuoti("pdf_talpykla_netalpinta")
+                return fn(*args, **kwargs)
+            if data is not None:
+                pdf_cache_stats["hit"] += 1
+                sekimas.skaiciuoti("pdf_talpykla_pataikyta")
+                return _irasyti(io.BytesIO(data), failas)
+
+            pdf_cache_stats["miss"] += 1
+            sekimas.skaiciuoti("pdf_talpykla_praleista")
+            b.arguments["failas"] = None
+            data = fn(*b.args, **b.kwargs)
+            _pdf_cache.ideti(r, data, ".pdf")
+            return _irasyti(io.BytesIO(data), failas)
+
+        return apvalkalas
+    return dekoruoti
+
+def talpyklos_statistika():
+    """Pataikymai / praleidimai / netalpinti kvietimai nuo proceso pradžios."""
+    return dict(pdf_cache_stats)
 
-    for z in zodziai:
-        img_path = rasti_paveiksleli(z)
-        img = Image(img_path, width=40, height=40) if img_path else Spacer(40, 40)
+# ---------- 1. Žodžių rašymo užduotis ----------
+def _zodziu_story(zodziai):
+    st = res.stiliai()
+    yield Paragraph("Parašyk žodžius:", st["Title"])
+    yield Spacer(1, 12)
 
-        # Eilutė su paveikslėliu ir žodžiu
-        row1 = [img, Paragraph(z.capitalize(), st["Normal"])]
-        table1 = Table([row1], colWidths=[50, 500])
-        table1.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ]))
+    # Eilutė su paveikslėliu ir žodžiu, po ja – linijos rašymui
+    for z in zodziai:
+        yield WordRow([(rasti_paveiksleli(z), z.capitalize())], stulpelis=550, ikona=40, ikonos_plotis=50,
+                      stilius=st["Normal"], virsus=3, apacia=4, po_linijos=(500, 30), po_tarpas=8)
 
-        # Linijos rašymui
-        lines = WritingLines(width=500, height=30)
+@talpinamas()
+def generuoti_zodziu_uzduoti(zodziai, failas="out/uzduotis-zodziai.pdf", profilis=NUMATYTAS_PROFILIS):
+    """
+    zodziai – sąrašas arba bet koks iteruojamas (pvz. skaityti_zodzius("data/zodziai.txt"));
+    prieš maketavimą visos eilutės sudedamos į sąrašą (_turinys), tad atmintis auga su žodžių skaičiumi.
+    profilis – kokybės profilis iš PROFILIAI (visuose generatoriuose).
+    """
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buf, pagesize=A4,
+        leftMargin=marge, rightMargin=marge, topMargin=40, bottomMargin=40,
+        **_pdf_meta(profilis=profilis)
+    )
+    _maketuoti(doc, _turinys(_zodziu_story, zodziai), profilis)
+    return _irasyti(buf, failas)
 
-        story += [table1, lines, Spacer(1, 8)]
+# ---------- 2. Žodžių paieška: tinklelis + paveikslėliai + 3 linijų forma ----------
+def sugeneruoti_zodziu_paieskos_tinkla(zodziai, dydis=15, kryptys=KRYPTYS_VISOS, seed=None):
+    """
+    Žodžių paieškos tinklelis (wordsearch.py): visos 8 kryptys (arba tik H/V),
+    persidengimai skatinami, likę langeliai – pagal LT raidžių dažnius.
+    Grąžina (tinklelis, nepavyko); netilpę žodžiai dar ir išvardijami įspėjime.
+    seed – int arba random.Random.
+    """
+    rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+    with sekimas.etapas("galvosukis"):
+        tinklelis, _, nepavyko = sudelioti_paieska(zodziai, dydis=dydis, kryptys=kryptys, rng=rng)
+    if nepavyko:
+        print(f"⚠️  Netilpo žodžiai: {', '.join(nepavyko)}")
+    return tinklelis, nepavyko
+
+def _trys_linijos(c, plotis, aukstis, line_width=1):
+    """Apatinė pilna, vidurinė punktyrinė, viršutinė pilna – nuo (0, 0) drobėje."""
+    c.setLineWidth(line_width)
+    apacia = 0
+    vidurys = aukstis / 2
+    virsus = aukstis
+    # apatinė pilna
+    c.setDash()
+    c.line(0, apacia, plotis, apacia)
+    # vidurinė punktyrinė
+    c.setDash(1, 3)
+    c.line(0, vidurys, plotis, vidurys)
+    # viršutinė pilna
+    c.setDash()
+    c.line(0, virsus, plotis, virsus)
+
+def _linijos(c, plotis, aukstis, line_width=1):
+    """
+    Trijų linijų juosta kaip formos XObject: kiekvienas dydis PDF'e aprašomas vieną
+    kartą, o kiekviena juosta puslapyje – tik „/Forma Do“.
+    """
+    vardas = f"Linijos_{plotis:g}_{aukstis:g}_{line_width:g}".replace(".", "_")
+    if not c.hasForm(vardas):
+        c.beginForm(vardas, -line_width, -line_width, plotis + line_width, aukstis + line_width)
+        _trys_linijos(c, plotis, aukstis, line_width)
+        c.endForm()
+    c.doForm(vardas)
+
+class Ikona(Flowable):
+    """
+    Kvadratinis paveikslėlis iš failo. Skirtingai nei platypus Image, piešiamas pagal
+    kelią: failas neišskleidžiamas kiekvienam pasikartojimui, o PDF'e lieka vienas XObject.
+    """
+    def __init__(self, kelias, dydis):
+        super().__init__()
+        self.kelias = kelias
+        self.width = self.height = dydis
 
-    doc.build(story)
-    print(f"✅ PDF sukurtas: {failas}")
+    def wrap(self, availWidth, availHeight):
+        return (self.width, self.height)
 
-# ---------- 2. Žodžių paieška: tinklelis + paveikslėliai + 3 linijų forma ----------
-def sugeneruoti_zodziu_paieskos_tinkla(zodziai, dydis=15):
-    tinklelis = [["" for _ in range(dydis)] for _ in range(dydis)]
-    for zodis in zodziai:
-        U = zodis.upper()
-        ilgis = len(U)
-        for _ in range(200):  # daugiau bandymų dėl ilgesnių žodžių
-            kryptis = random.choice(["H", "V"])
-            if kryptis == "H":
-                eil = random.randint(0, dydis - 1)
-                stulp = random.randint(0, dydis - ilgis)
-                if all(tinklelis[eil][stulp + i] in ["", U[i]] for i in range(ilgis)):
-                    for i in range(ilgis):
-                        tinklelis[eil][stulp + i] = U[i]
-                    break
-            else:  # Vertikaliai
-                eil = random.randint(0, dydis - ilgis)
-                stulp = random.randint(0, dydis - 1)
-                if all(tinklelis[eil + i][stulp] in ["", U[i]] for i in range(ilgis)):
-                    for i in range(ilgis):
-                        tinklelis[eil + i][stulp] = U[i]
-                    break
-    # Užpildome likusius langelius
-    for i in range(dydis):
-        for j in range(dydis):
-            if tinklelis[i][j] == "":
-                tinklelis[i][j] = random.choice(string.ascii_uppercase)
-    # Visi elementai -> str
-    return [[str(ch) for ch in row] for row in tinklelis]
+    def draw(self):
+        _piesti_ikona(self.canv, self.kelias, 0, 0, self.width)
 
 class WritingLines(Flowable):
     """Trijų eilučių „pirmos klasės“ rašymo forma: viršutinė pilna, vidurinė punktyrinė, apatinė pilna."""
@@ -152,95 +399,313 @@ class WritingLines(Flowable):
     def wrap(self, availWidth, availHeight):
         return (self.width, self.height)
 
+    def draw(self):
+        _linijos(self.canv, self.width, self.height, self.line_width)
+
+class WordRow(Flowable):
+    """
+    Žodžio eilutė be vidinių lentelių: [paveikslėlis] [užrašas arba trijų linijų juosta],
+    pakartota kiekvienam `langeliai` elementui, ir (nebūtinai) rašymo juosta po ja.
+    Viskas piešiama tiesiai drobėje; geometrija tokia pati kaip vienos eilutės
+    Table su VALIGN=MIDDLE ir nurodytomis paraštėmis, tik be Table wrap/split kaštų.
+
+      langeliai   – [(paveikslėlio failas arba None, užrašas arba None), ...]; miniatiūra – piešiant
+      stulpelis   – vieno langelio plotis; stulpeliu – kiek stulpelių užima eilutė (numatytai – len(langeliai))
+      ikona / ikonos_plotis – paveikslėlio kraštinė ir jo stulpelis
+      linijos     – (plotis, aukštis) juosta šalia paveikslėlio (kai užrašo nėra)
+      virsus, apacia – paraštės virš ir po turiniu
+      po_linijos  – (plotis, aukštis) rašymo juosta po eilute (nuo rėmelio kairės), po_tarpas – tarpas po jos
+
+    Netilpusi į puslapį eilutė su `po_linijos` skaidoma į antraštę, WritingLines ir Spacer –
+    lygiai ten pat, kur skaidytųsi atskiri flowable'ai.
+    """
+    def __init__(self, langeliai, stulpelis, ikona=40, ikonos_plotis=50, stilius=None, linijos=None,
+                 virsus=3, apacia=4, po_linijos=None, po_tarpas=0, stulpeliu=None):
+        super().__init__()
+        self.hAlign = "CENTER"  # kaip Table – kad pakeitus lentelę niekas nepasislinktų
+        self.langeliai = langeliai
+        self.stulpelis = stulpelis
+        self.ikona = ikona
+        self.ikonos_plotis = ikonos_plotis
+        self.stilius = stilius
+        self.linijos = linijos
+        self.virsus = virsus
+        self.apacia = apacia
+        self.po_linijos = po_linijos
+        self.po_tarpas = po_tarpas
+        self.stulpeliu = stulpeliu or len(langeliai)
+
+        turinys = ikona
+        if stilius is not None and any(t for _, t in langeliai):
+            turinys = max(turinys, stilius.leading)
+        if linijos:
+            turinys = max(turinys, linijos[1])
+        self._turinys = turinys
+        self.galva = turinys + virsus + apacia
+        self.width = stulpelis * self.stulpeliu
+        self.height = self.galva + (po_linijos[1] + po_tarpas if po_linijos else 0)
+        self._aw = self.width
+
+    def wrap(self, availWidth, availHeight):
+        self._aw = availWidth
+        return (self.width, self.height)
+
+    def split(self, availWidth, availHeight):
+        if not self.po_linijos or availHeight < self.galva:
+            return []
+        galva = WordRow(self.langeliai, self.stulpelis, self.ikona, self.ikonos_plotis, self.stilius,
+                        self.linijos, self.virsus, self.apacia, stulpeliu=self.stulpeliu)
+        dalys = [galva, WritingLines(width=self.po_linijos[0], height=self.po_linijos[1])]
+        if self.po_tarpas:
+            dalys.append(Spacer(1, self.po_tarpas))
+        return dalys
+
     def draw(self):
         c = self.canv
-        c.setLineWidth(self.line_width)
-        apacia = 0
-        vidurys = self.height / 2
-        virsus = self.height
-        # apatinė pilna
-        c.setDash()
-        c.line(0, apacia, self.width, apacia)
-        # vidurinė punktyrinė
-        c.setDash(1, 3)
-        c.line(0, vidurys, self.width, vidurys)
-        # viršutinė pilna
-        c.setDash()
-        c.line(0, virsus, self.width, virsus)
-
-def generuoti_pdf_tinkleli_lentele(zodziai, dydis=15, failas="out/uzduotis-paieska.pdf"):
-    OUT_DIR.mkdir(exist_ok=True)
-    doc = SimpleDocTemplate(failas, pagesize=A4, leftMargin=marge, rightMargin=marge, topMargin=40, bottomMargin=40)
-    st = getSampleStyleSheet()
-    font = FONT_NAME if FONT_FILE.exists() else "Helvetica"
-    st["Title"].fontName = font
-    st["Normal"].fontName = font
-
-    # 1) Tinklelis
-    tinklelis = sugeneruoti_zodziu_paieskos_tinkla(zodziai, dydis=dydis)
-    grid = Table(tinklelis, colWidths=20, rowHeights=20)
-    grid.setStyle(TableStyle([
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, -1), font),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-    ]))
+        y0 = self.height - self.galva + self.apacia  # turinio apačia
+        st = self.stilius
+        for i, (kelias, tekstas) in enumerate(self.langeliai):
+            x = i * self.stulpelis
+            if kelias:
+                _piesti_ikona(c, kelias, x, y0 + (self._turinys - self.ikona) / 2, self.ikona)
+            if tekstas and st is not None:
+                # Paragraph bazinė linija: viršus – fontSize; pastraipa centruojama pagal leading
+                y = y0 + (self._turinys - st.leading) / 2 + st.leading - st.fontSize
+                c.setFont(st.fontName, st.fontSize)
+                c.setFillColor(st.textColor)
+                c.drawString(x + self.ikonos_plotis, y, tekstas)
+            elif self.linijos:
+                w, h = self.linijos
+                c.saveState()
+                c.translate(x + self.ikonos_plotis, y0 + (self._turinys - h) / 2)
+                _linijos(c, w, h)
+                c.restoreState()
+        if self.po_linijos:
+            w, h = self.po_linijos
+            c.saveState()
+            c.translate((self.width - self._aw) / 2, self.po_tarpas)  # nuo rėmelio kairės, kaip LEFT flowable
+            _linijos(c, w, h)
+            c.restoreState()
+
+class GridFlowable(Flowable):
+    """
+    Galvosūkio tinklelis, nupieštas drobės primityvais: visos linijos – vienas kelias,
+    visi užtamsinti langeliai – vienas užpildymo kelias, raidės ir maži numeriai – drawString.
+    Išdėstymas (raidžių bazinės linijos, numerių laužymas) atkartoja ankstesnę Table
+    su raidžių langeliais ir kryžiažodžio Paragraph numeriais (žr. benchmarks/bench_grid.py).
+
+      tinklelis – eilučių sąrašas; langelis '#' – užtamsintas, '' – tuščias
+      dydis     – raidžių šrifto dydis
+      numeriai  – {(r, c): [nr, ...]} – maži numeriai kairiajame viršutiniame kampe
+      raides    – ar rodyti raides (kryžiažodžio mokinio lape – ne)
+      pazymeti  – {(r, c)} langeliai, nuspalvinami šviesiai (paieškos atsakymuose – rasti žodžiai)
+      leading   – raidės centravimui langelyje (numatytai – kaip Table, 12; mažiems tinkleliams – ~1.2 × dydis)
+      forma     – raidės piešiamos kaip formos XObject šiuo vardu (kad kitas tinklelis galėtų jas pakartoti)
+      raides_is – GridFlowable su `forma`: jo jau nupieštos raidės įdedamos sumažintos, nerenkant teksto iš naujo
+                  (atsakymų tinkleliai); jei forma dar nenupiešta – raidės piešiamos įprastai
+    """
+    NR_DYDIS = 6
+    PAZYMETA = colors.Color(1, 0.85, 0.4)
+    NR_LEADING = 7
+    TABLE_LEADING = 12  # Table langelio leading, kai nustatytas tik FONTSIZE
+
+    def __init__(self, tinklelis, langelis=20, dydis=10, numeriai=None, raides=True, pazymeti=None, leading=None,
+                 forma=None, raides_is=None):
+        super().__init__()
+        self.hAlign = "CENTER"  # kaip Table
+        self.tinklelis = tinklelis
+        self.langelis = langelis
+        self.dydis = dydis
+        self.numeriai = numeriai or {}
+        self.raides = raides
+        self.pazymeti = pazymeti or ()
+        if leading is not None:
+            self.TABLE_LEADING = leading
+        self.forma = forma
+        self.raides_is = raides_is
+        self.width = langelis * (len(tinklelis[0]) if tinklelis else 0)
+        self.height = langelis * len(tinklelis)
+
+    def wrap(self, availWidth, availHeight):
+        return (self.width, self.height)
+
+    def draw(self):
+        c = self.canv
+        L = self.langelis
+        H = self.height
+        c.saveState()
+
+        # 1) užtamsinti langeliai – vienas kelias
+        blokai = c.beginPath()
+        yra_bloku = False
+        for r, eil in enumerate(self.tinklelis):
+            for k, ch in enumerate(eil):
+                if ch == '#':
+                    blokai.rect(k * L, H - (r + 1) * L, L, L)
+                    yra_bloku = True
+        if yra_bloku:
+            c.setFillColor(colors.lightgrey)
+            c.drawPath(blokai, stroke=0, fill=1)
+        if self.pazymeti:
+            zymes = c.beginPath()
+            for r, k in self.pazymeti:
+                zymes.rect(k * L, H - (r + 1) * L, L, L)
+            c.setFillColor(self.PAZYMETA)
+            c.drawPath(zymes, stroke=0, fill=1)
+
+        # 2) raidės ir numeriai: iš kito tinklelio formos, į savo formą arba tiesiog į puslapį
+        saltinis = self.raides_is
+        if saltinis is not None and saltinis.forma and c.hasForm(saltinis.forma):
+            c.saveState()
+            c.scale(L / saltinis.langelis, L / saltinis.langelis)
+            c.doForm(saltinis.forma)
+            c.restoreState()
+        elif self.forma:
+            c.beginForm(self.forma, 0, 0, self.width, H)
+            c.drawText(self._raides(c))
+            c.endForm()
+            c.doForm(self.forma)
+        else:
+            c.setFillColor(colors.black)
+            c.drawText(self._raides(c))
+
+        # 3) linijos – vienas kelias
+        linijos = c.beginPath()
+        for k in range(len(self.tinklelis[0]) + 1 if self.tinklelis else 0):
+            linijos.moveTo(k * L, 0)
+            linijos.lineTo(k * L, H)
+        for r in range(len(self.tinklelis) + 1):
+            linijos.moveTo(0, H - r * L)
+            linijos.lineTo(self.width, H - r * L)
+        c.setStrokeColor(colors.black)
+        c.setLineWidth(1)
+        c.setLineCap(1)
+        c.setLineJoin(1)
+        c.drawPath(linijos, stroke=1, fill=0)
+        c.restoreState()
+
+    def _raides(self, c):
+        """Raidės (centruotos kaip Table VALIGN=MIDDLE) ir numeriai – vienas teksto objektas."""
+        L = self.langelis
+        H = self.height
+        font = res.sriftas()
+        t = c.beginText()
+        dy = (L + self.TABLE_LEADING) / 2 - self.dydis
+        nr_plotis = L - 8  # Paragraph plotis langelyje: kairė paraštė 2, dešinė 6
+        for r, eil in enumerate(self.tinklelis):
+            apacia = H - (r + 1) * L
+            for k, ch in enumerate(eil):
+                if ch == '#':
+                    continue
+                raide = ch if self.raides else ''
+                nr = self.numeriai.get((r, k))
+                if not nr:
+                    if raide:
+                        t.setFont(font, self.dydis)
+                        t.setTextOrigin(k * L + L / 2 - pdfmetrics.stringWidth(raide, font, self.dydis) / 2,
+                                        apacia + dy)
+                        t.textOut(raide)
+                    continue
+                eilutes = simpleSplit(" / ".join(map(str, nr)), font, self.NR_DYDIS, nr_plotis)
+                x = k * L + 2
+                if raide:
+                    # numeriai + raidė viena pastraipa (leading 7), centruota vertikaliai
+                    h = (len(eilutes) + 1) * self.NR_LEADING
+                    y = apacia + (L + 1 + h) / 2 - self.NR_DYDIS
+                else:
+                    y = apacia + L - 2 - self.NR_DYDIS
+                t.setFont(font, self.NR_DYDIS)
+                for e in eilutes:
+                    t.setTextOrigin(x, y)
+                    t.textOut(e)
+                    y -= self.NR_LEADING
+                if raide:
+                    t.setFont(font, self.dydis)
+                    t.setTextOrigin(x, y)
+                    t.textOut(raide)
+        return t
+
+@talpinamas(atsitiktinis=True)
+def generuoti_pdf_tinkleli_lentele(zodziai, dydis=15, failas="out/uzduotis-paieska.pdf", kryptys=KRYPTYS_VISOS,
+                                   seed=None, profilis=NUMATYTAS_PROFILIS, variantai=1, workers=1):
+    """
+    seed – int arba random.Random; tas pats seed -> baitas į baitą tas pats PDF.
+    variantai > 1 – klasės rinkinys: tiek skirtingų tinklelių (po lapą mokiniui) viename PDF
+    ir atsakymų skyrius pabaigoje; workers – kiek procesų variantus dėlioja lygiagrečiai.
+    Netilpę žodžiai į lapą (paveikslėlių eilutes) neįtraukiami – žr. paieskos_netilpe().
+    """
+    seed = _sekla(seed)
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, pagesize=A4, leftMargin=marge, rightMargin=marge, topMargin=40, bottomMargin=40,
+                            **_pdf_meta(seed, profilis))
+    if variantai > 1:
+        story = _turinys(_paieskos_variantu_story, zodziai, dydis, kryptys, seed, variantai, workers)
+    else:
+        story = _turinys(_paieskos_story, zodziai, dydis, kryptys, seed)
+    _maketuoti(doc, story, profilis)
+    return _irasyti(buf, failas)
+
+def paieskos_netilpe(zodziai, dydis=15, kryptys=KRYPTYS_VISOS, seed=None, variantai=1, workers=1):
+    """
+    Žodžiai, kurių generuoti_pdf_tinkleli_lentele su tais pačiais argumentais nesudėjo
+    (bent viename variante). seed – tas pats int, kuris perduotas generatoriui.
+    """
+    if seed is None or isinstance(seed, random.Random):
+        raise ValueError("paieskos_netilpe reikia tos pačios sėklos (int), kaip ir PDF")
+    variantai = max(1, variantai)
+    rez = _paieskos_maketai(tuple(zodziai), dydis, _kryptys(kryptys), int(seed), variantai,
+                            workers if variantai > 1 else 1)
+    return sorted({z for _, (_, _, n) in rez for z in n})
+
+def _paieskos_story(zodziai, dydis, kryptys, seed):
+    # 1) Tinklelis – per tą pačią atmintį kaip variantai, kad paieskos_netilpe jo neieškotų iš naujo
+    zodziai = list(zodziai)
+    [(_, (tinklelis, _, nepavyko))] = _paieskos_maketai(tuple(zodziai), dydis, _kryptys(kryptys), seed, 1, 1)
+    if nepavyko:
+        print(f"⚠️  Netilpo žodžiai: {', '.join(nepavyko)}")
+    return _paieskos_lapas(zodziai, tinklelis, nepavyko=nepavyko)
+
+def _paieskos_lapas(zodziai, tinklelis, pavadinimas="Rask žodžius tinklelyje", grid=None, nepavyko=()):
+    """Tinklelis ir paveikslėlių eilutės – tik sudėtiems žodžiams (netilpusių mokinys neras)."""
+    st = res.stiliai()
+    grid = grid or GridFlowable(tinklelis, langelis=20, dydis=10)
 
     story = []
-    story.append(Paragraph("Rask žodžius tinklelyje", st["Title"]))
+    story.append(Paragraph(pavadinimas, st["Title"]))
     story.append(Spacer(1, 12))
     story.append(grid)
     story.append(Spacer(1, 24))
 
     # 2) Paveikslėliai + trijų linijų forma PO DVI PORAS Į EILĘ
-    pairs = []
-    for z in zodziai:
-        img_path = rasti_paveiksleli(z)
-        img = Image(img_path, width=36, height=36) if img_path else Spacer(36, 36)
-
-        # viena pora: [ikonėlė] [trijų linijų juosta]
-        pair = Table([[img, WritingLines(width=220, height=26)]], colWidths=[42, 220])
-        pair.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-            ('TOPPADDING', (0, 0), (-1, -1), 2),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
-        pairs.append(pair)
-
-    # sudedame po 2 poras į vieną eilę (kad tilptų daugiau)
+    # viena pora: [ikonėlė] [trijų linijų juosta]; sudedame po 2 į eilę (kad tilptų daugiau)
+    nepavyko = set(nepavyko)
+    pairs = [(rasti_paveiksleli(z), None) for z in zodziai if z not in nepavyko]
     for i in range(0, len(pairs), 2):
-        left = pairs[i]
-        right = pairs[i+1] if i+1 < len(pairs) else Spacer(262, 0)
-        row = Table([[left, right]], colWidths=[262, 262])
-        row.setStyle(TableStyle([
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-            ('TOPPADDING', (0, 0), (-1, -1), 0),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ]))
-        story.append(row)
-
-    doc.build(story)
-    print(f"✅ PDF sukurtas: {failas}")
+        story.append(WordRow(pairs[i:i + 2], stulpelis=262, ikona=36, ikonos_plotis=42,
+                             linijos=(220, 26), virsus=2, apacia=10, stulpeliu=2))
+    return story
 
 # ---------- 3. Linksnių lentelė ----------
+@talpinamas()
 def generuoti_linksniu_pdf_custom(
     zodziai,
     linksniai,  # pvz. ["kas?", "kam?"]
     rodyti_vns=True,
     rodyti_dgs=True,
     failas="out/uzduotis-linksniai-custom.pdf",
-    rodyti_zodi_salia_paveikslelio=True
+    rodyti_zodi_salia_paveikslelio=True,
+    profilis=NUMATYTAS_PROFILIS
 ):
-    OUT_DIR.mkdir(exist_ok=True)
-    doc = SimpleDocTemplate(failas, pagesize=A4, leftMargin=marge, rightMargin=marge, topMargin=40, bottomMargin=40)
-    st = getSampleStyleSheet()
-    font = FONT_NAME if FONT_FILE.exists() else "Helvetica"
-    st["Title"].fontName = font
-    st["Normal"].fontName = font
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, pagesize=A4, leftMargin=marge, rightMargin=marge, topMargin=40, bottomMargin=40,
+                            **_pdf_meta(profilis=profilis))
+    _maketuoti(doc, _turinys(_linksniu_story, zodziai, linksniai, rodyti_vns, rodyti_dgs,
+                             rodyti_zodi_salia_paveikslelio), profilis)
+    return _irasyti(buf, failas)
+
+def _linksniu_story(zodziai, linksniai, rodyti_vns, rodyti_dgs, rodyti_zodi_salia_paveikslelio):
+    st = res.stiliai()
+    font = res.sriftas()
 
     # 2 eilių antraštės
     top_header = ["Žodis"]
@@ -257,15 +722,10 @@ def generuoti_linksniu_pdf_custom(
 
     # Eilutės
     for z in zodziai:
-        img_path = rasti_paveiksleli(z)
-        img = Image(img_path, width=26, height=26) if img_path else Spacer(26, 26)
+        img = _paveikslelis(z, 26)
         if rodyti_zodi_salia_paveikslelio:
-            cell = Table([[img, Paragraph(z.capitalize(), st["Normal"])]], colWidths=[28, 97])
-            cell.setStyle(TableStyle([
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                ('LEFTPADDING', (0,0), (-1,-1), 0),
-                ('RIGHTPADDING', (0,0), (-1,-1), 2),
-            ]))
+            cell = Table([[img, Paragraph(z.capitalize(), st["Normal"])]], colWidths=[28, 97],
+                         style=res.LINKSNIO_LANGELIS)
             first_w = 130
         else:
             cell = img
@@ -301,125 +761,28 @@ def generuoti_linksniu_pdf_custom(
     if rodyti_dgs:
         t.setStyle([('SPAN', (col_index, 0), (col_index + len(linksniai) - 1, 0))])
 
-    story = [Paragraph("Linksnių lentelė", st["Title"]), Spacer(1, 10), t]
-    doc.build(story)
-    print(f"✅ PDF sukurtas: {failas}")
+    return [Paragraph("Linksnių lentelė", st["Title"]), Spacer(1, 10), t]
 
 
 # ======= KRYŽIAŽODIS =======
 
-# kryptys: dešinė (H), žemyn (V)
-DIRS = [(0, 1, 'H'), (1, 0, 'V')]
-
-def _fits(grid, r, c, w, dr, dc):
-    """Ar žodis w telpa nuo (r,c) kryptimi (dr,dc) laikantis kryžiažodžio taisyklių?"""
-    n = len(grid)
-    L = len(w)
-
-    # ribos
-    if not (0 <= r + (L - 1) * dr < n and 0 <= c + (L - 1) * dc < n):
-        return False
-
-    # prieš ir po – siena/riba
-    br, bc = r - dr, c - dc
-    ar, ac = r + L * dr, c + L * dc
-    if 0 <= br < n and 0 <= bc < n and grid[br][bc] not in ('', '#'):
-        return False
-    if 0 <= ar < n and 0 <= ac < n and grid[ar][ac] not in ('', '#'):
-        return False
-
-    for i, ch in enumerate(w):
-        rr, cc = r + i * dr, c + i * dc
-        cell = grid[rr][cc]
-        if cell not in ('', ch):
-            return False
-
-        # be „prisiglaudimų“ iš šonų
-        if dr == 0:  # horizontalus
-            for sr, sc in ((-1, 0), (1, 0)):
-                rr2, cc2 = rr + sr, cc + sc
-                if 0 <= rr2 < n and 0 <= cc2 < n:
-                    # išskyrus kraštinius simbolius ir jau esamą sutapimą
-                    if grid[rr2][cc2] not in ('', '#') and (i != 0 and i != L - 1 or cell == ''):
-                        return False
-        else:        # vertikalus
-            for sr, sc in ((0, -1), (0, 1)):
-                rr2, cc2 = rr + sr, cc + sc
-                if 0 <= rr2 < n and 0 <= cc2 < n:
-                    if grid[rr2][cc2] not in ('', '#') and (i != 0 and i != L - 1 or cell == ''):
-                        return False
-    return True
-
-def _place(grid, r, c, w, dr, dc):
-    """Uždeda w, grąžina uždėtų langelių sąrašą (kad būtų galima nuimti)."""
-    placed = []
-    for i, ch in enumerate(w):
-        rr, cc = r + i * dr, c + i * dc
-        if grid[rr][cc] == '':
-            grid[rr][cc] = ch
-            placed.append((rr, cc))
-    return placed
-
-def _unplace(grid, placed):
-    for r, c in placed:
-        grid[r][c] = ''
-
-def sugeneruoti_kryziazodi(words, size=13):
-    """Sukuria kryžiažodį backtracking’u, skatinant susikirtimus."""
-    words = [w.upper() for w in words]
-    words.sort(key=len, reverse=True)  # ilgiausi – pirmi
-    n = size
-    grid = [['' for _ in range(n)] for _ in range(n)]
-    placements = []  # (word, r, c, dr, dc)
-
-    import random
-
-    def score_positions(w):
-        """Kandidatų sąrašas su balais (daugiau susikirtimų – geriau)."""
-        cand = []
-        for r in range(n):
-            for c in range(n):
-                for dr, dc, _ in DIRS:
-                    if _fits(grid, r, c, w, dr, dc):
-                        # paskaičiuojam kiek sutapimų su esamomis raidėmis
-                        s = 0
-                        for i, ch in enumerate(w):
-                            rr, cc = r + i * dr, c + i * dc
-                            if grid[rr][cc] == ch:
-                                s += 1
-                        cand.append(( -s, r, c, dr, dc))  # minus – kad sort būtų mažėjimo
-        cand.sort()
-        random.shuffle(cand[:3])  # truputį random, kad gautume įvairių maketų
-        return cand
-
-    def backtrack(k):
-        if k == len(words):
-            return True
-        w = words[k]
-        cands = score_positions(w)
-        if not cands and k == 0:
-            # pirmam žodžiui leiskime per centrą bet kuria kryptimi
-            mid = n // 2
-            cands = [(0, mid, max(0, mid - len(w) // 2), 0, 1),
-                     (0, max(0, mid - len(w) // 2), mid, 1, 0)]
-
-        for _, r, c, dr, dc in cands:
-            put = _place(grid, r, c, w, dr, dc)
-            placements.append((w, r, c, dr, dc))
-            if backtrack(k + 1):
-                return True
-            placements.pop()
-            _unplace(grid, put)
-        return False
-
-    backtrack(0)
-
-    # neuždėti langeliai -> #
-    for r in range(n):
-        for c in range(n):
-            if grid[r][c] == '':
-                grid[r][c] = '#'
-    return grid, placements
+def sugeneruoti_kryziazodi(words, size=13, budget=1.0, workers=1, starts=None, max_nodes=None, seed=None):
+    """
+    Sukuria kryžiažodį (crossword.CrosswordEngine): kandidatai tik ten, kur žodis
+    kerta tokią pačią raidę, paieška ribota mazgų biudžetu (budget s × crossword.MAZGU_PER_S,
+    max_nodes – nebūtina papildoma riba). Jei visų žodžių
+    sudėti nepavyksta – grąžinamas geriausias dalinis maketas.
+    Su workers > 1 paleidžiama `starts` (numatytai – po dvi kiekvienam procesui)
+    atsitiktinių paieškų lygiagrečiai ir imamas tankiausias maketas.
+    seed – int arba random.Random; biudžetas skaičiuojamas mazgais, todėl ta pati
+    sėkla (ir tie patys budget/workers/starts) visada duoda tą patį maketą.
+    """
+    if starts is None:
+        starts = 1 if workers == 1 else workers * 2
+    with sekimas.etapas("galvosukis"):
+        placements = geriausias_maketas(words, size=size, starts=starts, workers=workers,
+                                        budget=budget, max_nodes=max_nodes, seed=_sekla(seed))
+    return tinklelis(placements, size), placements
 
 def numeruoti_pradzias(grid, placements):
     """
@@ -457,174 +820,271 @@ def numeruoti_pradzias(grid, placements):
     numbered.sort(key=lambda x: x[0])
     return nums_map, numbered
 
-def kryziazodis_pdf(words, show_answers=False, size=13, failas="out/kryziazodis.pdf"):
-    """
-    Sugeneruoja PDF:
-      - kairėje: tinklelis su mažais numeriais starto langeliuose
-      - dešinėje: sunumeruoti paveikslėliai (užuominos)
-    """
-    OUT_DIR.mkdir(exist_ok=True)
-    grid, placements = sugeneruoti_kryziazodi(words, size=size)
-    nums_map, numbered = numeruoti_pradzias(grid, placements)
-
-    doc = SimpleDocTemplate(failas, pagesize=A4,
-                            leftMargin=marge, rightMargin=marge,
-                            topMargin=36, bottomMargin=36)
-    st = getSampleStyleSheet()
-    font = FONT_NAME if FONT_FILE.exists() else "Helvetica"
-    for k in ("Title", "Normal"):
-        st[k].fontName = font
+class Kryziazodis:
+    """Vieną kartą sudėtas kryžiažodis: tinklelis, žodžių vietos ir numeracija.
+    Iš to paties objekto piešiamas ir mokinio lapas, ir atsakymai – jie visada sutampa."""
+    def __init__(self, grid, placements, seed=None):
+        self.grid = grid
+        self.placements = placements
+        self.seed = seed  # iš kurios sėklos gautas maketas (įrašoma į PDF)
+        self.nums_map, self.numbered = numeruoti_pradzias(grid, placements)
+
+@sekimas.sekamas
+def sukurti_kryziazodi(words, size=13, budget=1.0, workers=1, seed=None):
+    """Suranda maketą ir jį sunumeruoja (brangiausias žingsnis – atliekamas vieną kartą)."""
+    seed = _sekla(seed)
+    grid, placements = sugeneruoti_kryziazodi(words, size=size, budget=budget, workers=workers, seed=seed)
+    return Kryziazodis(grid, placements, seed=seed)
+
+def _kryziazodzio_story(kz, show_answers, st, font, pavadinimas="Išspręsk kryžiažodį"):
+    """Kryžiažodžio lapo turinys (flowables) iš jau paruošto maketo."""
+    grid, nums_map, numbered = kz.grid, kz.nums_map, kz.numbered
 
     # --- tinklelis ---
     N = len(grid)
-    cells = [['' for _ in range(N)] for _ in range(N)]
-    ts = [
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, -1), font),
-        ('FONTSIZE', (0, 0), (-1, -1), 12),
-    ]
-    small = ParagraphStyle("small", parent=st["Normal"],
-                           fontName=font, fontSize=6, leading=7)
-
-    for r in range(N):
-        for c in range(N):
-            if grid[r][c] == '#':
-                ts.append(('BACKGROUND', (c, r), (c, r), colors.lightgrey))
-                continue
-
-            letter = grid[r][c] if show_answers else ''
-            tags = []
-            if (r, c, 'H') in nums_map: tags.append(nums_map[(r, c, 'H')])
-            if (r, c, 'V') in nums_map: tags.append(nums_map[(r, c, 'V')])
-
-            if tags:
-                if show_answers and letter:
-                    html = f'<para leading=7><font size="6">{" / ".join(map(str, tags))}</font><br/><font size="12">{letter}</font></para>'
-                    cells[r][c] = Paragraph(html, st["Normal"])
-                    ts += [('LEFTPADDING', (c, r), (c, r), 2),
-                           ('TOPPADDING', (c, r), (c, r), 2)]
-                else:
-                    cells[r][c] = Paragraph(f'<font size="6">{" / ".join(map(str, tags))}</font>', small)
-                    ts += [('LEFTPADDING', (c, r), (c, r), 2),
-                           ('TOPPADDING', (c, r), (c, r), 2),
-                           ('ALIGN', (c, r), (c, r), 'LEFT'),
-                           ('VALIGN', (c, r), (c, r), 'TOP')]
-            else:
-                cells[r][c] = letter
-
-    table = Table(cells, colWidths=20, rowHeights=20)
-    table.setStyle(TableStyle(ts))
+    numeriai = {}
+    for (r, c, d), nr in nums_map.items():
+        numeriai.setdefault((r, c), []).append((d, nr))
+    numeriai = {k: [nr for _, nr in sorted(v)] for k, v in numeriai.items()}  # H pirma, po to V
+    table = GridFlowable(grid, langelis=20, dydis=12, numeriai=numeriai, raides=show_answers)
 
     # --- užuominos (paveikslėliai) ---
     hint_rows = []
     for nr, w, *_ in numbered:
-        img_path = rasti_paveiksleli(w.lower())
-        img = Image(img_path, width=40, height=40) if img_path else Spacer(40, 40)
+        img = _paveikslelis(w.lower(), 40)
         hint_rows.append([Paragraph(str(nr), st["Normal"]), img])
 
-    hints = Table(hint_rows, colWidths=[18, 44])
-    hints.setStyle(TableStyle([
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, -1), font),
-    ]))
+    hints = Table(hint_rows, colWidths=[18, 44], style=res.uzuominu_stilius())
+    layout = Table([[table, hints]], colWidths=[N * 20 + 10, 80], style=res.MAKETAS)
 
-    layout = Table([[table, hints]], colWidths=[N * 20 + 10, 80])
-    layout.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-    ]))
+    return [Paragraph(pavadinimas, st["Title"]), Spacer(1, 8), layout]
 
-    story = [Paragraph("Išspręsk kryžiažodį", st["Title"]), Spacer(1, 8), layout]
-    doc.build(story)
-    print(f"✅ PDF sukurtas: {failas}")
+def _kryziazodzio_dokumentas(buf, seed=None, profilis=None):
+    doc = SimpleDocTemplate(buf, pagesize=A4,
+                            leftMargin=marge, rightMargin=marge,
+                            topMargin=36, bottomMargin=36, **_pdf_meta(seed, profilis))
+    return doc, res.stiliai(), res.sriftas()
 
+@talpinamas(atsitiktinis=True)
+def kryziazodis_pdf(words, show_answers=False, size=13, failas="out/kryziazodis.pdf", budget=1.0, workers=1,
+                    maketas=None, seed=None, profilis=NUMATYTAS_PROFILIS, variantai=1, atsakymu_skyrius=True):
+    """
+    Sugeneruoja PDF:
+      - kairėje: tinklelis su mažais numeriais starto langeliuose
+      - dešinėje: sunumeruoti paveikslėliai (užuominos)
+    budget – maketo paieškos laikas (s), workers – kiek procesų ieško lygiagrečiai.
+    maketas – jau paruoštas Kryziazodis (tada words/size/budget/workers/seed nenaudojami).
+    seed – int arba random.Random; ta pati sėkla -> tas pats PDF.
+    variantai > 1 – klasės rinkinys: tiek skirtingų maketų (po lapą mokiniui, be atsakymų)
+    ir atsakymų skyrius pabaigoje (atsakymu_skyrius=False – be jo); workers tada skirstomi
+    variantams (po vieną paiešką).
+    """
+    if variantai > 1:
+        if maketas is not None:
+            raise ValueError("Su keliais variantais maketas neperduodamas – jie ieškomi pagal seed")
+        seed = _sekla(seed)
+        buf = io.BytesIO()
+        doc, st, font = _kryziazodzio_dokumentas(buf, seed, profilis)
+        _maketuoti(doc, _turinys(_kryziazodzio_variantu_story, words, size, budget, seed, variantai, workers,
+                                 st, font, atsakymu_skyrius), profilis)
+        return _irasyti(buf, failas)
+    buf = io.BytesIO()
+    kz = maketas or sukurti_kryziazodi(words, size=size, budget=budget, workers=workers, seed=seed)
+    doc, st, font = _kryziazodzio_dokumentas(buf, kz.seed, profilis)
+    _maketuoti(doc, _turinys(_kryziazodzio_story, kz, show_answers, st, font), profilis)
+    return _irasyti(buf, failas)
+
+@sekimas.sekamas
+def kryziazodis_su_atsakymais_pdf(words, size=13, failas="out/kryziazodis.pdf",
+                                  failas_atsakymai="out/kryziazodis-atsakymai.pdf",
+                                  budget=1.0, workers=1, viename=False, maketas=None, seed=None,
+                                  profilis=NUMATYTAS_PROFILIS):
+    """
+    Mokinio lapas ir atsakymai iš VIENO maketo (paieška atliekama tik kartą).
+    viename=False – grąžina (pdf, pdf_atsakymai) ir įrašo į du failus;
+    viename=True  – grąžina vieną dviejų puslapių PDF (įrašo į `failas`).
+    """
+    kz = maketas or sukurti_kryziazodi(words, size=size, budget=budget, workers=workers, seed=seed)
+    if not viename:
+        return (kryziazodis_pdf(words, show_answers=False, failas=failas, maketas=kz, profilis=profilis),
+                kryziazodis_pdf(words, show_answers=True, failas=failas_atsakymai, maketas=kz, profilis=profilis))
+
+    buf = io.BytesIO()
+    doc, st, font = _kryziazodzio_dokumentas(buf, kz.seed, profilis)
+    story = _turinys(_kryziazodzio_story, kz, False, st, font)
+    story += [PageBreak()] + _turinys(_kryziazodzio_story, kz, True, st, font)
+    _maketuoti(doc, story, profilis)
+    return _irasyti(buf, failas)
+
+
+# ---------- Klasės rinkinys: skirtingi to paties galvosūkio variantai ----------
+# Visi variantai – viename doc.build(): stiliai, šriftas ir kiekvienas paveikslėlis PDF'e
+# įdedami vieną kartą. Brangiausia dalis – maketų paieška – vyksta procesų telkinyje.
+
+def _variantu_seklos(seed, kiek):
+    """Pirmas variantas – pati sėkla (toks pat kaip vienas lapas), kiti – iš jos išvestos."""
+    rng = random.Random(seed)
+    return [seed] + [rng.randrange(2**31) for _ in range(kiek - 1)]
+
+def _lygiagreciai(fn, argumentai, workers):
+    """[fn(*a) for a in argumentai] per `workers` procesus (1 – šiame procese); tvarka išlaikoma."""
+    workers = max(1, min(workers or os.cpu_count() or 1, len(argumentai)))
+    if workers == 1:
+        return [fn(*a) for a in argumentai]
+    with procesai.telkinys(workers) as ex:
+        return list(ex.map(fn, *zip(*argumentai)))
+
+def _variantai(fn, argumentai, tapatybe, seed, kiek, workers):
+    """
+    [(sėkla, fn(*argumentai(sėkla)))] – `kiek` skirtingų pagal tapatybe(rezultatas). Jei dalis
+    maketų sutampa (labai trumpas žodžių sąrašas), vietoj jų dar du kartus bandomos naujos
+    sėklos; nepavykus – trūkstami užpildomi pasikartojančiais, kad lapų būtų `kiek`.
+    """
+    seklos = _variantu_seklos(seed, kiek)
+    rng = random.Random(seklos[-1])
+    gauti, matyti = [], set()
+    for _ in range(3):
+        for s, rez in zip(seklos, _lygiagreciai(fn, [argumentai(s) for s in seklos], workers)):
+            t = tapatybe(rez)
+            if t not in matyti:
+                matyti.add(t)
+                gauti.append((s, rez))
+        if len(gauti) >= kiek:
+            break
+        seklos = [rng.randrange(2**31) for _ in range(kiek - len(gauti))]
+    if len(gauti) < kiek:
+        print(f"⚠️  Skirtingų variantų pavyko sudaryti tik {len(gauti)} iš {kiek} – kiti kartojasi")
+        gauti += [gauti[i % len(gauti)] for i in range(kiek - len(gauti))]
+    return gauti[:kiek]
+
+def _atsakymu_lentele(tinkleliai, dydis, st, stulpeliai=3):
+    """
+    Atsakymų skyrius: [(antraštė, tinklelis, pažymėti langeliai, mokinio lapo GridFlowable arba None)] –
+    maži tinkleliai po `stulpeliai` eilėje. Jei mokinio lape raidės jau nupieštos kaip forma,
+    atsakyme ta forma tik sumažinama – 30 atsakymų nerenka 30 × dydis² raidžių iš naujo.
+    """
+    plotis = (puslapio_plotis - 2 * marge) / stulpeliai
+    L = min(12, (plotis - 12) / dydis)
+    raide = round(L * 0.65, 1)
+    langeliai = [[Paragraph(antraste, st["Normal"]), Spacer(1, 2),
+                  GridFlowable(t, langelis=L, dydis=raide, pazymeti=zymes, leading=raide * 1.2,
+                               raides_is=saltinis)]
+                 for antraste, t, zymes, saltinis in tinkleliai]
+    eilutes = [langeliai[i:i + stulpeliai] for i in range(0, len(langeliai), stulpeliai)]
+    eilutes[-1] += [""] * (stulpeliai - len(eilutes[-1]))
+    return Table(eilutes, colWidths=[plotis] * stulpeliai, style=res.ATSAKYMAI)
+
+def _variantu_lapai(lapai, atsakymai=True):
+    """Kiekvienas variantas – naujame puslapyje ir su žyme PDF turinyje; pabaigoje – atsakymų žymė."""
+    story = []
+    for i, lapas in enumerate(lapai, 1):
+        if i > 1:
+            story.append(PageBreak())
+        story.append(_Zyma(f"{i} variantas", f"variantas-{i}"))
+        story += lapas
+    if atsakymai:
+        story += [PageBreak(), _Zyma("Atsakymai", "atsakymai")]
+    return story
+
+def _paieskos_variantas(zodziai, dydis, kryptys, seed):
+    """Vienas paieškos tinklelis (vykdomas ir kitame procese): (tinklelis, vietos, nepavyko)."""
+    return sudelioti_paieska(zodziai, dydis=dydis, kryptys=kryptys, rng=random.Random(seed))
+
+def _kryptys(kryptys):
+    """Kryptys kaip tuple iš tuple (iš JSON ateina sąrašai) – tinka raktui."""
+    return tuple(tuple(k) for k in kryptys)
+
+@functools.lru_cache(maxsize=16)
+def _paieskos_maketai(zodziai, dydis, kryptys, seed, variantai, workers):
+    """
+    [(sėkla, (tinklelis, vietos, nepavyko))] visiems variantams. Atmintyje, kad programa
+    netilpusius žodžius (paieskos_netilpe) gautų ką tik sugeneruoto PDF maketų neieškodama iš naujo.
+    """
+    with sekimas.etapas("galvosukis"):
+        return _variantai(_paieskos_variantas, lambda s: (list(zodziai), dydis, kryptys, s),
+                          lambda r: tuple(sorted(r[1])), seed, variantai, workers)
+
+def _paieskos_variantu_story(zodziai, dydis, kryptys, seed, variantai, workers):
+    zodziai = list(zodziai)
+    st = res.stiliai()
+    rez = _paieskos_maketai(tuple(zodziai), dydis, _kryptys(kryptys), seed, variantai, workers)
+    nepavyko = sorted({z for _, (_, _, n) in rez for z in n})
+    if nepavyko:
+        print(f"⚠️  Netilpo žodžiai: {', '.join(nepavyko)}")
+
+    lapai, atsakymai = [], []
+    for i, (_, (t, vietos, netilpo)) in enumerate(rez, 1):
+        grid = GridFlowable(t, langelis=20, dydis=10, forma=f"paieska-{i}")
+        lapai.append(_paieskos_lapas(zodziai, t, f"Rask žodžius tinklelyje ({i} variantas)", grid, netilpo))
+        zymes = {(r + k * dr, c + k * dc) for w, r, c, dr, dc in vietos for k in range(len(w))}
+        atsakymai.append((f"{i} variantas", t, zymes, grid))
+    story = _variantu_lapai(lapai)
+    story.append(_atsakymu_lentele(atsakymai, dydis, st))
+    return story
+
+def _kryziazodzio_variantas(words, size, budget, seed):
+    """Vienas kryžiažodžio maketas (vykdomas ir kitame procese): (tinklelis, placements)."""
+    return sugeneruoti_kryziazodi(words, size=size, budget=budget, workers=1, seed=seed)
+
+def _kryziazodzio_variantu_story(words, size, budget, seed, variantai, workers, st, font, atsakymu_skyrius=True):
+    words = list(words)
+    with sekimas.etapas("galvosukis"):
+        rez = _variantai(_kryziazodzio_variantas, lambda s: (words, size, budget, s),
+                         lambda r: tuple(sorted(r[1])), seed, variantai, workers)
+    maketai = [Kryziazodis(grid, placements, seed=s) for s, (grid, placements) in rez]
+
+    story = _variantu_lapai([_kryziazodzio_story(kz, False, st, font, f"Išspręsk kryžiažodį ({i} variantas)")
+                             for i, kz in enumerate(maketai, 1)], atsakymu_skyrius)
+    if atsakymu_skyrius:
+        story.append(_atsakymu_lentele([(f"{i} variantas", kz.grid, None, None)
+                                        for i, kz in enumerate(maketai, 1)], size, st))
+    return story
 
 # ---------- parašyk sakinį pagal pvz. ----------
 
+@talpinamas()
 def generuoti_sakini_pagal_pavyzdi(
     zodziai,
     pavyzdys_sakinys: str,
     pavyzdys_paveikslelis: str = "",
-    failas="out/uzduotis-sakinys-pagal-pavyzdi.pdf"
+    failas="out/uzduotis-sakinys-pagal-pavyzdi.pdf",
+    profilis=NUMATYTAS_PROFILIS
 ):
-    OUT_DIR.mkdir(exist_ok=True)
+    buf = io.BytesIO()
 
     doc = SimpleDocTemplate(
-        failas, pagesize=A4,
+        buf, pagesize=A4,
         leftMargin=marge, rightMargin=marge,
-        topMargin=36, bottomMargin=36
+        topMargin=36, bottomMargin=36,
+        **_pdf_meta(profilis=profilis)
     )
+    _maketuoti(doc, _turinys(_sakinio_story, zodziai, pavyzdys_sakinys, pavyzdys_paveikslelis), profilis)
+    return _irasyti(buf, failas)
 
-    st = getSampleStyleSheet()
-    font = FONT_NAME if FONT_FILE.exists() else "Helvetica"
-    st["Title"].fontName = font
-    st["Normal"].fontName = font
+def _sakinio_story(zodziai, pavyzdys_sakinys, pavyzdys_paveikslelis):
+    st = res.stiliai()
 
     title = Paragraph("Parašyk sakinį pagal pavyzdį", st["Title"])
 
-    sample_style = ParagraphStyle(
-        "SampleSentence",
-        parent=st["Normal"],
-        fontName=font,
-        fontSize=22,
-        leading=26,
-        spaceAfter=0
-    )
+    sample_style = st["SampleSentence"]
 
     # pavyzdžio paveikslėlis (pagal žodį images/ kataloge; jei neranda – tuščias tarpas)
-    sample_img_path = rasti_paveiksleli(pavyzdys_paveikslelis) if pavyzdys_paveikslelis else None
-    sample_img = Image(sample_img_path, width=42, height=42) if sample_img_path else Spacer(42, 42)
-
-    # VIENA eilutė: [paveikslėlis] [pavyzdinis sakinys] [3 linijų juosta]
-    # Naudingas plotis ~495pt (A4 - paraštės). Stulpelių sumą laikom ≤495.
-    top_row = Table(
-        [[
-            sample_img,
-            Paragraph(pavyzdys_sakinys, sample_style),
-            WritingLines(width=215, height=30)  # linija tame pačiame aukštyje
-        ]],
-        colWidths=[50, 230, 215]
-    )
+    sample_img = _paveikslelis(pavyzdys_paveikslelis, 42)
+
     # Viršuje: paveikslėlis + pavyzdinis sakinys
     sample_row = Table([[sample_img, Paragraph(pavyzdys_sakinys, sample_style)]],
-                       colWidths=[50, 500])
-    sample_row.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-    ]))
+                       colWidths=[50, 500], style=res.ZODZIO_EILUTE)
 
     # Po pavyzdinio sakinio — tik tarpas, be linijų
-    story = [
-        title,
-        Spacer(1, 8),
-        sample_row,
-        Spacer(1, 12)  # tiesiog tuščia vieta, be rašymo linijų
-    ]
+    yield title
+    yield Spacer(1, 8)
+    yield sample_row
+    yield Spacer(1, 12)  # tiesiog tuščia vieta, be rašymo linijų
 
     # Toliau – sąrašas BE žodžių: [paveikslėlis] [3 linijų juosta]
     for z in zodziai:
-        img_path = rasti_paveiksleli(z)
-        img = Image(img_path, width=42, height=42) if img_path else Spacer(42, 42)
-
-        row = Table([[img, WritingLines(width=500, height=30)]], colWidths=[50, 500])
-        row.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
-        story.append(row)
-
-    doc.build(story)
-    print(f"✅ PDF sukurtas: {failas}")
+        yield WordRow([(rasti_paveiksleli(z), None)], stulpelis=550, ikona=42, ikonos_plotis=50,
+                      linijos=(500, 30), virsus=4, apacia=8)
 
 # ---------- Gyvūnai ir jų gyvenamosios vietos (2 dalių lapas)a ----------
 
@@ -632,34 +1092,29 @@ def _row_of_images(names, img_size=48, total_width=495, gap=10):
     """Sukuria vieną eilę su paveikslėliais, išlygintą į kairę, su pastoviais tarpais."""
     cells = []
     for nm in names:
-        p = rasti_paveiksleli(nm)
-        img = Image(p, width=img_size, height=img_size) if p else Spacer(img_size, img_size)
-        cells.append(img)
+        cells.append(_paveikslelis(nm, img_size))
     # suskaičiuojam stulpelių plotį taip, kad tilptų į ~495pt
     col_w = (total_width - gap * (len(cells) - 1)) / max(1, len(cells))
-    t = Table([cells], colWidths=[col_w] * len(cells))
-    t.setStyle(TableStyle([
-        ('LEFTPADDING', (0,0), (-1,-1), 0),
-        ('RIGHTPADDING', (0,0), (-1,-1), 0),
-        ('TOPPADDING', (0,0), (-1,-1), 0),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 0),
-    ]))
-    return t
+    return Table([cells], colWidths=[col_w] * len(cells), style=res.BE_TARPU)
 
+@talpinamas()
 def generuoti_gyvunai_ir_vietos(
     gyvunai, vietos,
     failas="out/uzduotis-gyvunai-vietos.pdf",
-    rasymo_eiluciu_kiekis=12
+    rasymo_eiluciu_kiekis=12,
+    profilis=NUMATYTAS_PROFILIS
 ):
-    OUT_DIR.mkdir(exist_ok=True)
+    buf = io.BytesIO()
     doc = SimpleDocTemplate(
-        failas, pagesize=A4,
-        leftMargin=marge, rightMargin=marge, topMargin=36, bottomMargin=36
+        buf, pagesize=A4,
+        leftMargin=marge, rightMargin=marge, topMargin=36, bottomMargin=36,
+        **_pdf_meta(profilis=profilis)
     )
-    st = getSampleStyleSheet()
-    font = FONT_NAME if FONT_FILE.exists() else "Helvetica"
-    st["Title"].fontName = font
-    st["Normal"].fontName = font
+    _maketuoti(doc, _turinys(_gyvunu_story, gyvunai, vietos, rasymo_eiluciu_kiekis), profilis)
+    return _irasyti(buf, failas)
+
+def _gyvunu_story(gyvunai, vietos, rasymo_eiluciu_kiekis):
+    st = res.stiliai()
 
     story = []
 
@@ -679,9 +1134,102 @@ def generuoti_gyvunai_ir_vietos(
     for _ in range(rasymo_eiluciu_kiekis):
         story.append(WritingLines(width=495, height=22))
         story.append(Spacer(1, 6))
+    return story
+
+# ---------- Visas rinkinys viename PDF ----------
+# Lapo tipas -> (skyriaus pavadinimas PDF turinyje, viršaus ir apačios paraštė kaip atskirame lape)
+RINKINIO_SKYRIAI = {
+    "zodziai": ("Žodžiai su eilutėmis", 40),
+    "paieska": ("Žodžių paieška", 40),
+    "linksniai": ("Linksnių lentelė", 40),
+    "kryziazodis": ("Kryžiažodis", 36),
+    "sakinys": ("Sakinys pagal pavyzdį", 36),
+    "gyvunai": ("Gyvūnai ir jų vietos", 36),
+}
+# gyvunai reikia atskiro vietų sąrašo, todėl pagal nutylėjimą neįtraukiamas
+RINKINIO_NUMATYTI = ("zodziai", "paieska", "linksniai", "kryziazodis", "sakinys")
+
+class _Zyma(Flowable):
+    """Nematoma žymė: čia prasideda skyrius (PDF turinys / bookmarks)."""
+    def __init__(self, pavadinimas, raktas, lygis=0):
+        super().__init__()
+        self.pavadinimas = pavadinimas
+        self.raktas = raktas
+        self.lygis = lygis
 
-    doc.build(story)
-    print(f"✅ PDF sukurtas: {failas}")
-
-
+    def wrap(self, availWidth, availHeight):
+        return (0, 0)
 
+    def draw(self):
+        c = self.canv
+        c.bookmarkPage(self.raktas)
+        c.addOutlineEntry(self.pavadinimas, self.raktas, level=self.lygis)
+        c.showOutline()
+
+def _rinkinio_skyrius(tipas, zodziai, p, seed):
+    """Vieno rinkinio skyriaus flowable'ai; p – to tipo generatoriaus parinktys."""
+    if tipas == "zodziai":
+        return _zodziu_story(zodziai)
+    if tipas == "paieska":
+        return _paieskos_story(zodziai, p.get("dydis", 15), p.get("kryptys", KRYPTYS_VISOS), seed)
+    if tipas == "linksniai":
+        return _linksniu_story(zodziai, p.get("linksniai", ["kas?", "kam?"]), p.get("rodyti_vns", True),
+                               p.get("rodyti_dgs", True), p.get("rodyti_zodi_salia_paveikslelio", True))
+    if tipas == "kryziazodis":
+        kz = sukurti_kryziazodi(zodziai, size=p.get("size", 13), budget=p.get("budget", 1.0),
+                                workers=p.get("workers", 1), seed=seed)
+        st, font = res.stiliai(), res.sriftas()
+        story = _kryziazodzio_story(kz, False, st, font)
+        if p.get("atsakymai"):
+            story += [PageBreak(), _Zyma("Atsakymai", f"{tipas}-atsakymai", lygis=1)]
+            story += _kryziazodzio_story(kz, True, st, font)
+        return story
+    if tipas == "sakinys":
+        return _sakinio_story(zodziai, p.get("pavyzdys_sakinys", ""), p.get("pavyzdys_paveikslelis", ""))
+    if tipas == "gyvunai":
+        if not p.get("vietos"):
+            raise ValueError("Gyvūnų lapui reikia vietų sąrašo: parinktys[\"gyvunai\"][\"vietos\"]")
+        return _gyvunu_story(zodziai, p["vietos"], p.get("rasymo_eiluciu_kiekis", 12))
+    raise ValueError(f"Nežinomas lapo tipas: {tipas!r}")
+
+@talpinamas(atsitiktinis=True)
+def generuoti_rinkini(zodziai, skyriai=RINKINIO_NUMATYTI, parinktys=None, failas="out/rinkinys.pdf", seed=None,
+                      profilis=NUMATYTAS_PROFILIS):
+    """
+    Keli lapų tipai vienam žodžių sąrašui – vienas PDF, sukurtas vienu doc.build():
+    šriftas, paveikslėliai ir linijų formos įdedami po vieną kartą visam rinkiniui,
+    kiekvienas skyrius prasideda naujame puslapyje ir turi žymę PDF turinyje.
+      skyriai   – tipai iš RINKINIO_SKYRIAI, ta tvarka, kuria bus PDF'e
+      parinktys – {tipas: {...}} to tipo generatoriaus argumentai, pvz.
+                  {"linksniai": {"linksniai": ["kas?", "ko?"]}, "kryziazodis": {"size": 15, "atsakymai": True},
+                   "sakinys": {"pavyzdys_sakinys": "..."}, "gyvunai": {"vietos": [...]}}
+    seed – paieškai ir kryžiažodžiui; tas pats seed -> tas pats PDF.
+    """
+    zodziai = list(zodziai)
+    parinktys = parinktys or {}
+    seed = _sekla(seed)
+    for tipas in skyriai:
+        if tipas not in RINKINIO_SKYRIAI:
+            raise ValueError(f"Nežinomas lapo tipas: {tipas!r}")
+
+    buf = io.BytesIO()
+    doc = BaseDocTemplate(buf, pagesize=A4, leftMargin=marge, rightMargin=marge, **_pdf_meta(seed, profilis))
+    # skirtingos paraštės – atskiri puslapių šablonai; pirmas – pirmojo skyriaus
+    sablonai = {}
+    for tipas in skyriai:
+        m = RINKINIO_SKYRIAI[tipas][1]
+        if m not in sablonai:
+            remelis = Frame(marge, m, puslapio_plotis - 2 * marge, puslapio_aukstis - 2 * m, id="normal")
+            sablonai[m] = PageTemplate(id=f"m{m}", frames=[remelis])
+    doc.addPageTemplates(list(sablonai.values()))
+
+    dalys = []
+    for i, tipas in enumerate(skyriai):
+        pavadinimas, m = RINKINIO_SKYRIAI[tipas]
+        if i:
+            dalys.append([NextPageTemplate(f"m{m}"), PageBreak()])
+        dalys.append([_Zyma(pavadinimas, tipas)])
+        dalys.append(_turinys(_rinkinio_skyrius, tipas, zodziai, parinktys.get(tipas) or {}, seed))
+
+    _maketuoti(doc, list(itertools.chain.from_iterable(dalys)), profilis)
+    return _irasyti(buf, failas)